@@ -0,0 +1,131 @@
+"""assets.py
+Point de passage des ressources chargées : chaque surface finale (après mise à
+l'échelle) y reçoit son format de pixels définitif puis est enregistrée dans le
+registre mémoire, de même que chaque son.
+
+Les fichiers sont lus dans le paquet d'assets (pack.py) quand il existe, sinon
+sur le disque ; les chemins restent ceux de ``settings.py`` dans les deux cas.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+from typing import BinaryIO, Callable, Hashable
+import pygame
+from memory import LEDGER
+from pack import AssetPack, PackError, asset_name
+from pixelformat import optimise
+from settings import ASSETS_PACK
+
+_pack: AssetPack | None = None
+_pack_opened = False
+_pack_lock = threading.Lock()
+
+
+def asset_pack() -> AssetPack | None:
+    """Paquet d'assets, ouvert au premier appel ; None s'il n'existe pas."""
+    global _pack, _pack_opened
+    with _pack_lock:
+        if not _pack_opened:
+            _pack_opened = True
+            if ASSETS_PACK.is_file():
+                try:
+                    _pack = AssetPack(ASSETS_PACK)
+                except PackError as exc:
+                    print(f"Paquet d'assets ignoré : {exc}")
+        return _pack
+
+
+def open_asset(path: Path | str) -> BinaryIO | str:
+    """Source à passer à pygame : l'entrée du paquet si elle y est, sinon le chemin."""
+    pack = asset_pack()
+    name = asset_name(path)
+    if pack is not None and name in pack:
+        return pack.open(name)
+    return str(path)
+
+
+def read_asset(path: Path | str) -> bytes:
+    """Contenu complet d'un petit asset (descripteur JSON…)."""
+    source = open_asset(path)
+    if isinstance(source, str):
+        return Path(source).read_bytes()
+    return source.read()
+
+
+def load_image(path: Path | str, alpha: bool = True) -> pygame.Surface:
+    """Charge une image au format de l'écran (avec transparence si ``alpha``)."""
+    img = pygame.image.load(open_asset(path), Path(path).name)
+    return img.convert_alpha() if alpha else img.convert()
+
+
+def load_music(path: Path | str) -> None:
+    """Prépare la musique de fond ; lue en flux depuis le paquet ou le disque."""
+    pygame.mixer.music.load(open_asset(path), Path(path).name)
+
+
+def finalize(
+    surface: pygame.Surface,
+    category: str,
+    name: str,
+    evict: Callable[[], None] | None = None,
+) -> pygame.Surface:
+    """Optimise et enregistre une surface prête à être affichée.
+
+    La surface retournée peut être un nouvel objet (format écran, colorkey RLE) :
+    toujours utiliser la valeur de retour.
+    """
+    surface = optimise(surface, category)
+    return LEDGER.track(surface, category, name, evict)
+
+
+def mirrored(surface: pygame.Surface, category: str, name: str) -> pygame.Surface:
+    """Version retournée horizontalement d'une surface finale.
+
+    Préparée au chargement pour éviter un ``transform.flip`` par frame, qui
+    obligerait aussi à décoder les surfaces RLE.
+    """
+    flipped = pygame.transform.flip(surface, True, False)
+    key = flipped.get_colorkey()
+    if key is not None:
+        flipped.set_colorkey(key, pygame.RLEACCEL)
+    return finalize(flipped, category, name)
+
+
+class ImageCache:
+    """Surfaces finales d'un niveau, indexées par leur clé de chargement.
+
+    Créé à partir du cache du niveau précédent (``inherit``), il en reprend
+    les surfaces communes au lieu de les recharger : seules les ressources
+    propres au nouveau niveau sont chargées, et celles que seul l'ancien
+    utilisait disparaissent avec lui. ``seal`` oublie le cache hérité une
+    fois le chargement terminé.
+    """
+
+    def __init__(self, inherit: ImageCache | None = None) -> None:
+        self.surfaces: dict[Hashable, pygame.Surface] = {}
+        self._inherit = inherit.surfaces if inherit is not None else {}
+        self.loaded = 0
+        self.shared = 0
+
+    def get(self, key: Hashable, load: Callable[[], pygame.Surface]) -> pygame.Surface:
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self._inherit.get(key)
+            if surface is None:
+                surface = load()
+                self.loaded += 1
+            else:
+                self.shared += 1
+            self.surfaces[key] = surface
+        return surface
+
+    def seal(self) -> None:
+        self._inherit = {}
+
+
+def load_sound(path: Path) -> pygame.mixer.Sound:
+    """Charge un effet sonore comptabilisé dans la catégorie « audio »."""
+    sound = pygame.mixer.Sound(file=open_asset(path))
+    return LEDGER.track(sound, "audio", Path(path).name)
@@ -0,0 +1,113 @@
+"""background.py
+Arrière-plan en parallaxe : une pile de couches qui défilent chacune à leur propre
+vitesse par rapport à la caméra.
+Chaque couche se répète à l'infini (wraparound) et seules les une ou deux tranches
+visibles sont dessinées : le coût par frame ne dépend ni de la longueur du niveau
+ni du nombre d'écrans couverts.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+import pygame
+from settings import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    ASSETS_DIR,
+    BACKGROUND_IMG,
+    BACKGROUND_IMG_2,
+)
+from assets import ImageCache, finalize, load_image
+
+
+@dataclass
+class ParallaxLayer:
+    """Couche de décor répétée horizontalement."""
+
+    tiles: list[pygame.Surface]
+    factor: float = 1.0  # 1.0 = suit la caméra, 0.0 = immobile
+    y: int = 0
+    offsets: list[int] = field(init=False)
+    period: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Abscisse de départ de chaque tuile dans une période du motif
+        self.offsets = []
+        x = 0
+        for tile in self.tiles:
+            self.offsets.append(x)
+            x += tile.get_width()
+        self.period = max(1, x)
+
+    def draw(self, surface: pygame.Surface, camera_x: float) -> None:
+        """Dessine uniquement les tranches visibles de la couche."""
+        view_w = surface.get_width()
+        x = int(camera_x * self.factor) % self.period
+        i = bisect_right(self.offsets, x) - 1
+        screen_x = self.offsets[i] - x
+        while screen_x < view_w:
+            tile = self.tiles[i]
+            surface.blit(tile, (screen_x, self.y))
+            screen_x += tile.get_width()
+            i = (i + 1) % len(self.tiles)
+
+
+@dataclass
+class ParallaxBackground:
+    """Pile de couches dessinées de la plus lointaine à la plus proche."""
+
+    layers: list[ParallaxLayer]
+
+    @property
+    def scrolls_with_camera(self) -> bool:
+        """Vrai si toutes les couches suivent la caméra (rendu incrémental possible)."""
+        return all(layer.factor == 1.0 for layer in self.layers)
+
+    def draw(self, surface: pygame.Surface, camera_x: float) -> None:
+        for layer in self.layers:
+            layer.draw(surface, camera_x)
+
+
+# Fond par défaut lorsque le niveau ne décrit pas le sien : les deux forêts en
+# alternance, à la vitesse de la caméra.
+DEFAULT_LAYERS: list[dict] = [
+    {"images": [str(BACKGROUND_IMG), str(BACKGROUND_IMG_2)], "factor": 1.0},
+]
+
+
+def load_parallax(
+    layers_data: list[dict] | None,
+    max_layers: int | None = None,
+    cache: ImageCache | None = None,
+) -> ParallaxBackground:
+    """Construit l'arrière-plan à partir de la description ``background`` du niveau.
+
+    Chaque couche accepte ``images`` (chemins relatifs au dossier des assets),
+    ``factor`` (vitesse relative à la caméra), ``y`` et ``size`` ([w, h], par
+    défaut la taille de l'écran). ``max_layers`` ne garde que les couches les
+    plus lointaines (profils de qualité réduits) : la première couvre l'écran.
+    """
+    if not layers_data:
+        layers_data = DEFAULT_LAYERS
+    if max_layers is not None:
+        layers_data = layers_data[: max(1, max_layers)]
+
+    if cache is None:
+        cache = ImageCache()
+    layers: list[ParallaxLayer] = []
+    for data in layers_data:
+        w, h = data.get("size", (WINDOW_WIDTH, WINDOW_HEIGHT))
+        tiles: list[pygame.Surface] = []
+        for name in data["images"]:
+
+            def load(name=name, w=w, h=h) -> pygame.Surface:
+                img = load_image(ASSETS_DIR / Path(name), alpha=False)
+                return finalize(pygame.transform.scale(img, (w, h)), "level", Path(name).stem)
+
+            tiles.append(cache.get(("background", name, w, h), load))
+        layers.append(
+            ParallaxLayer(tiles, factor=float(data.get("factor", 1.0)), y=int(data.get("y", 0)))
+        )
+    return ParallaxBackground(layers)
@@ -0,0 +1,190 @@
+"""benchmark.py
+Mesures de performance hors jeu.
+    python src/benchmark.py
+charge le niveau et compare, par catégorie d'assets, le coût des blits avant et
+après la passe d'optimisation du format des pixels (pixelformat.py), puis
+mesure le coût par frame du système de particules (particles.py), de la file de
+rendu (sprite par sprite et en lot) face à des blits individuels
+(renderqueue.py) et du rendu complet face au rendu incrémental (camera.py) sur
+un travelling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import pygame
+
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT
+import pixelformat
+from particles import ParticleSystem
+from quality import PROFILES
+from renderqueue import LAYERS, RenderQueue
+
+
+def _time_blits(canvas: pygame.Surface, surfaces: list[pygame.Surface], rounds: int) -> float:
+    """Durée totale (s) de ``rounds`` passes de blit de ``surfaces``."""
+    positions = [
+        ((i * 37) % max(1, WINDOW_WIDTH - s.get_width()), (i * 53) % max(1, WINDOW_HEIGHT - s.get_height()))
+        for i, s in enumerate(surfaces)
+    ]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for surf, pos in zip(surfaces, positions):
+            canvas.blit(surf, pos)
+    return time.perf_counter() - start
+
+
+def bench_pixel_formats(canvas: pygame.Surface, rounds: int) -> list[str]:
+    """Gain de blit par catégorie grâce à la passe pixelformat."""
+    by_category: dict[str, tuple[list[pygame.Surface], list[pygame.Surface], dict[str, int]]] = {}
+    for category, original, optimised in pixelformat.SAMPLES:
+        before, after, kinds = by_category.setdefault(category or "?", ([], [], {}))
+        before.append(original)
+        after.append(optimised)
+        if optimised is original:
+            kind = "alpha"
+        elif optimised.get_colorkey() is not None:
+            kind = "rle"
+        else:
+            kind = "opaque"
+        kinds[kind] = kinds.get(kind, 0) + 1
+
+    lines = [f"{'catégorie':<12}{'avant ms':>10}{'après ms':>10}{'gain':>8}  formats"]
+    for category, (before, after, kinds) in sorted(by_category.items()):
+        t_before = _time_blits(canvas, before, rounds)
+        t_after = _time_blits(canvas, after, rounds)
+        detail = ", ".join(f"{k} {n}" for k, n in sorted(kinds.items()))
+        lines.append(
+            f"{category:<12}{t_before * 1000:>10.1f}{t_after * 1000:>10.1f}"
+            f"{t_before / max(t_after, 1e-9):>7.2f}×  {detail}"
+        )
+    return lines
+
+
+def bench_particles(canvas: pygame.Surface, frames: int, counts: tuple[int, ...] | None = None) -> list[str]:
+    """Temps moyen de mise à jour + rendu des particules pour plusieurs charges.
+
+    Par défaut : réserve pleine de chaque profil de qualité.
+    """
+    if counts is None:
+        counts = (0, *sorted({p.particle_capacity for p in PROFILES.values()}))
+    lines = [f"{'particules':<12}{'update ms':>10}{'draw ms':>10}"]
+    for count in counts:
+        system = ParticleSystem(capacity=max(count, 1))
+        queue = RenderQueue()
+        t_update = t_draw = 0.0
+        for _ in range(frames):
+            # Entretient la population : chaque frame remplace les mortes
+            while system.count < count:
+                system.hit(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, True)
+                system.dust(WINDOW_WIDTH // 3, WINDOW_HEIGHT - 20)
+            start = time.perf_counter()
+            system.update()
+            t_update += time.perf_counter() - start
+            start = time.perf_counter()
+            system.draw(queue)
+            queue.flush(canvas)
+            t_draw += time.perf_counter() - start
+        lines.append(f"{count:<12}{t_update * 1000 / frames:>10.2f}{t_draw * 1000 / frames:>10.2f}")
+    return lines
+
+
+def bench_queue(canvas: pygame.Surface, frames: int, counts: tuple[int, ...] = (50, 200, 800)) -> list[str]:
+    """Sprites blittés un par un, soumis un par un à la file ou déposés en lot.
+
+    Les sprites des assets, coûteux à copier, sont comparés à de petits
+    sprites de la taille d'une particule, où le coût d'un appel Python par
+    sprite domine.
+    """
+    assets = [s for _, _, s in pixelformat.SAMPLES if s.get_width() <= WINDOW_WIDTH // 2] or [canvas]
+    small = [pygame.Surface((8, 8)).convert()]
+    lines = [f"{'sprites':<12}{'taille':<8}{'blit ms':>10}{'file ms':>10}{'lot ms':>10}"]
+    for size, sprites in (("assets", assets), ("8 px", small)):
+        for count in counts:
+            # Moitié à l'écran, moitié hors champ (écartée par la file)
+            positions = [
+                ((i * 37) % (WINDOW_WIDTH * 2) - WINDOW_WIDTH // 2, (i * 53) % WINDOW_HEIGHT) for i in range(count)
+            ]
+            items = [(sprites[i % len(sprites)], pos) for i, pos in enumerate(positions)]
+            start = time.perf_counter()
+            for _ in range(frames):
+                for surf, pos in items:
+                    canvas.blit(surf, pos)
+            t_blit = time.perf_counter() - start
+            queue = RenderQueue()
+            start = time.perf_counter()
+            for _ in range(frames):
+                for i, (surf, pos) in enumerate(items):
+                    queue.submit(surf, pos, LAYERS["entities"] + i % 3)
+                queue.flush(canvas)
+            t_queue = time.perf_counter() - start
+            # Dépôt en un lot, comme les particules et la file des suiveurs
+            start = time.perf_counter()
+            for _ in range(frames):
+                queue.extend(items, LAYERS["entities"])
+                queue.flush(canvas)
+            t_batch = time.perf_counter() - start
+            lines.append(
+                f"{count:<12}{size:<8}{t_blit * 1000 / frames:>10.3f}"
+                f"{t_queue * 1000 / frames:>10.3f}{t_batch * 1000 / frames:>10.3f}"
+            )
+    return lines
+
+
+def bench_render(canvas: pygame.Surface, game, frames: int) -> list[str]:
+    """Rendu complet contre rendu incrémental pendant un aller-retour de caméra."""
+    span = game.level_width - WINDOW_WIDTH
+    path = []
+    for i in range(frames):
+        x = (i * 3) % (2 * span)  # 3 px par frame, demi-tour au bout du niveau
+        path.append(x if x <= span else 2 * span - x)
+    lines = [f"{'rendu':<12}{'ms/frame':>10}"]
+    for label, incremental in (("complet", False), ("incrémental", True)):
+        game.incremental = incremental
+        game.scenery.invalidate()
+        game._full_redraw = True
+        start = time.perf_counter()
+        for x in path:
+            game.camera_x = x
+            game.render(canvas)
+        lines.append(f"{label:<12}{(time.perf_counter() - start) * 1000 / frames:>10.3f}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks de rendu")
+    parser.add_argument("--rounds", type=int, default=200, help="passes de blit par catégorie")
+    parser.add_argument("--headless", action="store_true", help="pilote vidéo factice (CI)")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT), pygame.HIDDEN)
+    canvas = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+
+    # Charger le jeu déclenche la passe d'optimisation sur tous les assets
+    pixelformat.RECORD = True
+    from game import Game
+
+    game = Game()
+    print("Format des pixels (blits)")
+    for line in bench_pixel_formats(canvas, args.rounds):
+        print(line)
+    print("Particules (par frame)")
+    for line in bench_particles(canvas, args.rounds):
+        print(line)
+    print("File de rendu (par frame)")
+    for line in bench_queue(canvas, args.rounds):
+        print(line)
+    print("Rendu de la scène")
+    for line in bench_render(canvas, game, args.rounds * 5):
+        print(line)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""camera.py
+Caméra qui suit le personnage, et rendu incrémental des couches statiques.
+
+La caméra ne recentre pas brutalement : elle laisse le joueur se déplacer dans
+une zone morte, regarde un peu devant lui et rattrape sa cible par lissage.
+Sa position reste entière pour que le décor puisse être décalé avec
+``Surface.scroll`` : seule la bande nouvellement découverte est redessinée.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable
+import pygame
+
+from settings import CAMERA_DEAD_ZONE, CAMERA_LOOK_AHEAD, CAMERA_SMOOTHING
+
+
+@dataclass
+class Camera:
+    """Position horizontale de la vue dans le niveau."""
+
+    view_width: int
+    level_width: int
+    dead_zone: int = CAMERA_DEAD_ZONE  # demi-largeur, en px
+    look_ahead: int = CAMERA_LOOK_AHEAD
+    smoothing: float = CAMERA_SMOOTHING  # part de l'écart rattrapée par frame
+    x: float = 0.0
+    focus: float = field(init=False, default=0.0)
+
+    @property
+    def view_x(self) -> int:
+        """Abscisse entière du bord gauche de la vue."""
+        return round(self.x)
+
+    def _clamp(self, x: float) -> float:
+        return max(0.0, min(float(self.level_width - self.view_width), x))
+
+    def snap(self, target_x: float) -> int:
+        """Centre immédiatement la vue sur ``target_x`` (apparition, changement de perso)."""
+        self.focus = target_x
+        self.x = self._clamp(target_x - self.view_width / 2)
+        return self.view_x
+
+    def update(self, target_x: float, facing_left: bool) -> int:
+        """Suit ``target_x`` et retourne la nouvelle abscisse entière de la vue."""
+        # La zone morte déplace un point de visée que la cible pousse devant elle
+        if target_x > self.focus + self.dead_zone:
+            self.focus = target_x - self.dead_zone
+        elif target_x < self.focus - self.dead_zone:
+            self.focus = target_x + self.dead_zone
+        ahead = -self.look_ahead if facing_left else self.look_ahead
+        goal = self._clamp(self.focus + ahead - self.view_width / 2)
+        self.x += (goal - self.x) * self.smoothing
+        if abs(goal - self.x) < 0.5:
+            self.x = goal
+        return self.view_x
+
+
+class ScrollingLayer:
+    """Image mémorisée des couches qui défilent exactement avec la caméra.
+
+    ``paint(surface, camera_x)`` dessine ces couches ; il n'est appelé que sur
+    la zone de découpe (``clip``) active, entière au premier rendu ou après un
+    saut de caméra, réduite ensuite à la bande découverte.
+    """
+
+    def __init__(self, size: tuple[int, int], paint: Callable[[pygame.Surface, int], None]) -> None:
+        self.surface = pygame.Surface(size).convert()
+        self.paint = paint
+        self.x: int | None = None
+
+    def invalidate(self) -> None:
+        self.x = None
+
+    def scroll_to(self, camera_x: int) -> pygame.Rect | None:
+        """Amène l'image à ``camera_x``.
+
+        Retourne la bande redessinée (coordonnées écran, vide si la caméra n'a
+        pas bougé), ou None si toute l'image a été repeinte.
+        """
+        width, height = self.surface.get_size()
+        if self.x is None or abs(camera_x - self.x) >= width:
+            self.surface.set_clip(None)
+            self.paint(self.surface, camera_x)
+            self.x = camera_x
+            return None
+        dx = camera_x - self.x
+        if dx > 0:
+            strip = pygame.Rect(width - dx, 0, dx, height)
+        else:
+            strip = pygame.Rect(0, 0, -dx, height)
+        if dx:
+            self.surface.scroll(-dx, 0)
+            self.surface.set_clip(strip)
+            self.paint(self.surface, camera_x)
+            self.surface.set_clip(None)
+            self.x = camera_x
+        return strip
@@ -0,0 +1,238 @@
+"""capture.py
+Capture vidéo intégrée des parties, pour les rapports de bug.
+
+La surface 320×240 est copiée telle quelle, avant l'agrandissement, dans un
+anneau de tampons en mémoire partagée : une seule copie mémoire par frame, sans
+conversion de format (``Surface.get_buffer``). Un processus séparé lit les
+tampons, convertit les pixels en RGB et encode, sans perte, soit une suite
+d'images PNG, soit un fichier vidéo brut RGB24 ; le tampon est ensuite rendu
+à l'anneau. Si l'encodeur prend du retard et qu'aucun tampon n'est libre, la
+frame est perdue plutôt que d'attendre : la boucle de jeu ne bloque jamais.
+Les frames perdues sont comptées ; en vidéo brute, la précédente est répétée
+à leur place pour garder la durée.
+
+Relire une vidéo brute :
+``ffplay -f rawvideo -pixel_format rgb24 -video_size 320x240 -framerate 60 capture.rgb``
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import os
+from pathlib import Path
+import queue
+import sys
+import time
+import pygame
+
+from settings import CAPTURE_FORMATS, CAPTURE_SLOTS, FPS
+from inputs import LatencyMeter
+
+
+def _channel_offsets(surface: pygame.Surface) -> tuple[int, int, int] | None:
+    """Position des octets R, G et B dans un pixel 32 bits, ou None."""
+    if surface.get_bytesize() != 4:
+        return None
+    shifts = surface.get_shifts()[:3]
+    if any(shift % 8 for shift in shifts):
+        return None
+    if sys.byteorder == "little":
+        return tuple(shift // 8 for shift in shifts)
+    return tuple(3 - shift // 8 for shift in shifts)
+
+
+def _to_rgb(data: memoryview, size: tuple[int, int], pitch: int, stride: int, offsets: tuple[int, int, int]) -> bytes:
+    """Pixels bruts d'une surface → RGB24 compact."""
+    width, height = size
+    row = width * stride
+    if pitch != row:
+        packed = bytearray(row * height)
+        for y in range(height):
+            packed[y * row : (y + 1) * row] = data[y * pitch : y * pitch + row]
+        data = memoryview(packed)
+    if stride == 3 and offsets == (0, 1, 2):
+        return bytes(data[: row * height])
+    rgb = bytearray(width * height * 3)
+    for channel, offset in enumerate(offsets):
+        rgb[channel::3] = data[offset : row * height : stride]
+    return bytes(rgb)
+
+
+def _encode(
+    shm_name: str,
+    slot_size: int,
+    size: tuple[int, int],
+    pitch: int,
+    stride: int,
+    offsets: tuple[int, int, int],
+    path: str,
+    fmt: str,
+    frames: mp.Queue,
+    free: mp.Queue,
+    result: mp.Queue,
+) -> None:
+    """Processus encodeur : lit ``(tampon, numéro)`` jusqu'au nombre total de frames."""
+    if hasattr(os, "nice"):
+        # Sur une machine chargée, le jeu passe avant l'encodeur
+        os.nice(10)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    written = 0
+    try:
+        out = Path(path)
+        video = None
+        if fmt == "raw":
+            out.parent.mkdir(parents=True, exist_ok=True)
+            video = open(out, "wb")
+        else:
+            out.mkdir(parents=True, exist_ok=True)
+        last: bytes | None = None
+        expected = 0
+        while isinstance(item := frames.get(), tuple):
+            slot, number = item
+            data = shm.buf[slot * slot_size : (slot + 1) * slot_size]
+            try:
+                rgb = _to_rgb(data, size, pitch, stride, offsets)
+            finally:
+                data.release()
+            free.put(slot)
+            if video is not None:
+                # Frames perdues : on répète la dernière pour garder la durée
+                if last is not None:
+                    for _ in range(number - expected):
+                        video.write(last)
+                video.write(rgb)
+                last = rgb
+            else:
+                image = pygame.image.frombuffer(rgb, size, "RGB")
+                pygame.image.save(image, str(out / f"frame_{number:06d}.png"))
+            expected = number + 1
+            written += 1
+        if video is not None:
+            # Frames perdues en fin de session : la durée doit rester juste
+            if last is not None:
+                for _ in range(item - expected):
+                    video.write(last)
+            video.close()
+    finally:
+        shm.close()
+        result.put(written)
+
+
+class FrameCapture:
+    """Enregistre les frames de ``grab`` dans ``path``, encodées par un autre processus.
+
+    ``fmt`` : « png » (dossier d'images ``frame_000000.png``…, les numéros
+    manquants sont les frames perdues) ou « raw » (fichier RGB24 brut).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        surface: pygame.Surface,
+        fmt: str = "png",
+        slots: int = CAPTURE_SLOTS,
+        fps: int = FPS,
+    ) -> None:
+        if fmt not in CAPTURE_FORMATS:
+            raise ValueError(f"format de capture inconnu : {fmt}")
+        self.path = Path(path)
+        self.fmt = fmt
+        self.fps = fps
+        self.size = surface.get_size()
+        self.offsets = _channel_offsets(surface)
+        if self.offsets is None:
+            # Format exotique : conversion RGB sur le thread de jeu (plus lent)
+            self.pitch, self.stride = self.size[0] * 3, 3
+        else:
+            self.pitch, self.stride = surface.get_pitch(), 4
+        self.slot_size = self.pitch * self.size[1]
+        self.frames = 0  # frames présentées à la capture
+        self.dropped = 0  # frames perdues faute de tampon libre
+        self.written = 0  # frames encodées, connu à la fermeture
+        self.grab_time = LatencyMeter(size=600)  # coût de grab() sur la boucle de jeu
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slot_size * slots)
+        self._free = list(range(slots))
+        # Processus lancé à neuf (« spawn ») plutôt que dupliqué : SDL et la
+        # fenêtre ne doivent pas être hérités
+        ctx = mp.get_context("spawn")
+        self._queue = ctx.Queue()
+        self._returned = ctx.Queue()
+        self._result = ctx.Queue()
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        self._worker = ctx.Process(
+            target=_encode,
+            args=(
+                self._shm.name,
+                self.slot_size,
+                self.size,
+                self.pitch,
+                self.stride,
+                self.offsets or (0, 1, 2),
+                str(self.path),
+                fmt,
+                self._queue,
+                self._returned,
+                self._result,
+            ),
+            name="capture-encoder",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def grab(self, surface: pygame.Surface) -> bool:
+        """Copie ``surface`` dans un tampon libre ; False si la frame est perdue."""
+        start = time.perf_counter_ns()
+        number = self.frames
+        self.frames += 1
+        while True:
+            try:
+                self._free.append(self._returned.get_nowait())
+            except queue.Empty:
+                break
+        if not self._free:
+            self.dropped += 1
+            self.grab_time.record(time.perf_counter_ns() - start)
+            return False
+        slot = self._free.pop()
+        begin = slot * self.slot_size
+        if self.offsets is not None:
+            self._shm.buf[begin : begin + self.slot_size] = surface.get_buffer()
+        else:
+            self._shm.buf[begin : begin + self.slot_size] = pygame.image.tobytes(surface, "RGB")
+        self._queue.put((slot, number))
+        self.grab_time.record(time.perf_counter_ns() - start)
+        return True
+
+    def close(self) -> None:
+        """Attend la fin de l'encodage et libère l'anneau."""
+        # Le total clôt la file : l'encodeur complète la vidéo brute jusque-là
+        self._queue.put(self.frames)
+        # L'encodeur termine les frames en attente ; s'il est mort entre-temps,
+        # inutile d'attendre son résultat
+        while True:
+            try:
+                self.written = self._result.get(timeout=0.5)
+                break
+            except queue.Empty:
+                if not self._worker.is_alive():
+                    break
+        self._worker.join()
+        self._shm.close()
+        self._shm.unlink()
+
+    def __str__(self) -> str:
+        stats = self.grab_time.summary()
+        cost = "p50 {p50:.3f} ms  p95 {p95:.3f} ms".format(**stats) if stats else "-"
+        text = (
+            f"capture {self.path} : {self.written} frames encodées,"
+            f" {self.dropped} perdues sur {self.frames} ; coût par frame {cost}"
+        )
+        if self.fmt == "raw":
+            width, height = self.size
+            text += (
+                f"\n  lecture : ffplay -f rawvideo -pixel_format rgb24"
+                f" -video_size {width}x{height} -framerate {self.fps} {self.path}"
+            )
+        return text
@@ -0,0 +1,33 @@
+"""characters.py
+Table des ronins jouables : descripteur de sprites de chaque personnage (voir
+spritesheet.py) et réglages propres (impulsion de saut…). Utilisée par le jeu
+et par les outils hors jeu.
+"""
+
+from __future__ import annotations
+
+from settings import OISHI_DIR, KOJI_DIR, JUMP_SPEED, WINDOW_HEIGHT
+from player import Player
+
+CHARACTERS: dict[str, dict] = {
+    "Oishi": {
+        "sprites": OISHI_DIR / "sprites.json",
+        "jump_speed": JUMP_SPEED,
+    },
+    "Koji": {
+        "sprites": KOJI_DIR / "sprites.json",
+        "jump_speed": JUMP_SPEED * 1.2,
+    },
+}
+
+# Ordre de la partie (touches « next » / « prev »)
+PARTY: list[str] = ["Oishi", "Koji"]
+
+# Point d'apparition au début d'un niveau
+SPAWN: tuple[int, int] = (40, WINDOW_HEIGHT - 20)
+
+
+def create_player(name: str, pos: tuple[int, int] = SPAWN) -> Player:
+    """Construit le ``Player`` d'un ronin de la table."""
+    data = CHARACTERS[name]
+    return Player(pos, data["sprites"], name=name, jump_speed=data["jump_speed"])
@@ -0,0 +1,111 @@
+"""colliders.py
+Index spatial des plateformes, mis à jour au fil des déplacements.
+
+Le niveau est découpé en colonnes de ``COLLISION_CELL`` pixels ; chaque
+plateforme est rangée dans les colonnes que couvre son rectangle. Les
+plateformes fixes sont indexées une fois par stage et n'y bougent plus. Les
+plateformes mobiles (``platforms.MovingPlatform``) ont leurs propres colonnes :
+comme l'index garde une référence à leur rectangle, une plateforme qui se
+déplace dans les mêmes colonnes ne coûte rien, et seules celles qui changent
+de colonnes sont déplacées d'une liste à l'autre.
+
+Une entité ne teste ainsi que les plateformes proches d'elle, dans l'ordre du
+niveau (fixes puis mobiles), comme le faisait le parcours complet.
+"""
+
+from __future__ import annotations
+
+from bisect import insort
+import pygame
+
+from settings import COLLISION_CELL
+from platforms import MovingPlatform, Platform
+
+Bucket = list[tuple[int, pygame.Rect]]  # (rang dans le niveau, rectangle)
+
+
+class PlatformIndex:
+    """Plateformes d'un stage rangées par colonnes."""
+
+    def __init__(
+        self,
+        static: list[Platform],
+        moving: list[MovingPlatform] | None = None,
+        cell: int = COLLISION_CELL,
+    ) -> None:
+        self.cell = cell
+        self._static: dict[int, Bucket] = {}
+        self._moving: dict[int, Bucket] = {}
+        # Colonnes occupées et rang de chaque plateforme mobile
+        self._spans: dict[int, tuple[int, int]] = {}
+        self._order: dict[int, int] = {}
+        self.reindexed = 0  # déplacements de plateformes mobiles entre colonnes
+        for order, platform in enumerate(static):
+            first, last = self._columns(platform.rect)
+            for col in range(first, last + 1):
+                self._static.setdefault(col, []).append((order, platform.rect))
+        for order, platform in enumerate(moving or [], len(static)):
+            key = id(platform)
+            self._order[key] = order
+            self._spans[key] = span = self._columns(platform.rect)
+            for col in range(span[0], span[1] + 1):
+                insort(self._moving.setdefault(col, []), (order, platform.rect), key=lambda e: e[0])
+
+    def _columns(self, rect: pygame.Rect) -> tuple[int, int]:
+        return rect.left // self.cell, (rect.right - 1) // self.cell
+
+    def move(self, platform: MovingPlatform) -> None:
+        """Prend en compte le nouveau rectangle d'une plateforme mobile."""
+        key = id(platform)
+        old = self._spans[key]
+        new = self._columns(platform.rect)
+        if new == old:
+            return
+        self._spans[key] = new
+        self.reindexed += 1
+        entry = (self._order[key], platform.rect)
+        for col in range(old[0], old[1] + 1):
+            if not new[0] <= col <= new[1]:
+                bucket = self._moving[col]
+                bucket.remove(entry)
+                if not bucket:
+                    del self._moving[col]
+        for col in range(new[0], new[1] + 1):
+            if not old[0] <= col <= old[1]:
+                insort(self._moving.setdefault(col, []), entry, key=lambda e: e[0])
+
+    def near(self, rect: pygame.Rect, margin: int = 8) -> list[pygame.Rect]:
+        """Plateformes dont les colonnes croisent ``rect`` élargi de ``margin``.
+
+        ``margin`` couvre le déplacement horizontal de l'entité pendant le
+        tick (course, recul, élan d'une attaque).
+        """
+        first = (rect.left - margin) // self.cell
+        last = (rect.right - 1 + margin) // self.cell
+        found: dict[int, pygame.Rect] = {}
+        for col in range(first, last + 1):
+            for order, plat in self._static.get(col, ()):
+                found[order] = plat
+            for order, plat in self._moving.get(col, ()):
+                found[order] = plat
+        return [found[order] for order in sorted(found)]
+
+
+def rides(
+    hitbox: pygame.Rect,
+    old: pygame.Rect,
+    new: pygame.Rect,
+    grounded: bool,
+    falling: bool,
+) -> bool:
+    """Vrai si le corps de ``hitbox`` doit suivre la plateforme passée de ``old`` à ``new``.
+
+    Il la suit s'il se tenait dessus, ou si elle est montée à travers ses
+    pieds pendant qu'il tombait (un ascenseur ramasse qui l'attend) ; un
+    corps qui saute la traverse par-dessous, comme les plateformes fixes.
+    """
+    if hitbox.right <= old.left or hitbox.left >= old.right:
+        return False
+    if grounded and hitbox.bottom == old.top:
+        return True
+    return falling and new.top <= hitbox.bottom <= old.top
@@ -0,0 +1,95 @@
+"""collision.py
+Détection des coups au pixel près.
+Les masques de chaque frame d'animation, dans les deux orientations, sont construits
+une seule fois au chargement. Le test de combat compare d'abord les rectangles
+(très bon marché) et ne descend au niveau des masques que s'ils se chevauchent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import pygame
+
+
+@dataclass
+class FrameMasks:
+    """Masques précalculés d'une frame pour une orientation donnée."""
+
+    body: pygame.mask.Mask  # silhouette complète, origine = coin du sprite
+    strike: pygame.mask.Mask  # partie avant de la silhouette, celle qui frappe
+    strike_rect: pygame.Rect  # position du masque de frappe dans le sprite
+
+
+def build_frame_masks(
+    image: pygame.Surface, flip: bool, front_left: bool, split_x: int | None = None
+) -> FrameMasks:
+    """Construit les masques d'une frame telle qu'elle est affichée.
+
+    ``flip`` indique si l'image est retournée à l'affichage et ``front_left``
+    de quel côté se trouve l'avant du personnage une fois l'image orientée.
+    ``split_x`` sépare l'avant de l'arrière dans l'image non retournée (par
+    défaut le milieu ; le pivot pour une frame recadrée).
+    """
+    w, h = image.get_size()
+    if split_x is None:
+        split_x = w // 2
+    if flip:
+        image = pygame.transform.flip(image, True, False)
+        split_x = w - split_x
+    body = pygame.mask.from_surface(image)
+
+    # Seule la partie avant du sprite peut toucher : le dos et le corps restent
+    # hors de la zone de frappe.
+    half = pygame.Rect(0, 0, split_x, h) if front_left else pygame.Rect(split_x, 0, w - split_x, h)
+    front = pygame.mask.Mask(half.size)
+    front.draw(body, (-half.x, -half.y))
+
+    # Recadrage sur les pixels réellement opaques
+    rects = front.get_bounding_rects()
+    if not rects:
+        return FrameMasks(body, pygame.mask.Mask((0, 0)), pygame.Rect(half.topleft, (0, 0)))
+    bbox = rects[0].unionall(rects[1:])
+    strike = pygame.mask.Mask(bbox.size)
+    strike.draw(front, (-bbox.x, -bbox.y))
+    return FrameMasks(body, strike, bbox.move(half.topleft))
+
+
+class MaskBank:
+    """Cache des masques de toutes les frames d'une entité.
+
+    ``faces_left`` décrit l'orientation native des sprites (les Tengu sont
+    dessinés tournés vers la gauche, les ronins vers la droite).
+    """
+
+    def __init__(self, faces_left: bool = False) -> None:
+        self.faces_left = faces_left
+        self._masks: dict[tuple[int, bool], FrameMasks] = {}
+        self._images: list[pygame.Surface] = []  # garde les ids valides
+
+    def add(self, image: pygame.Surface, split_x: int | None = None) -> None:
+        """Précalcule les masques d'une frame pour les deux orientations."""
+        if (id(image), False) in self._masks:
+            return
+        self._images.append(image)
+        for facing_left in (False, True):
+            flip = facing_left != self.faces_left
+            self._masks[(id(image), facing_left)] = build_frame_masks(image, flip, facing_left, split_x)
+
+    def get(self, image: pygame.Surface, facing_left: bool) -> FrameMasks:
+        """Retourne les masques d'une frame déjà enregistrée."""
+        return self._masks[(id(image), facing_left)]
+
+
+def masks_collide(
+    rect_a: pygame.Rect,
+    mask_a: pygame.mask.Mask,
+    rect_b: pygame.Rect,
+    mask_b: pygame.mask.Mask,
+) -> bool:
+    """Test en deux temps : rectangles puis masques.
+
+    Chaque masque a pour origine le coin haut-gauche du rectangle associé.
+    """
+    if not rect_a.colliderect(rect_b):
+        return False
+    return mask_a.overlap(mask_b, (rect_b.x - rect_a.x, rect_b.y - rect_a.y)) is not None
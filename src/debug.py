@@ -0,0 +1,27 @@
+"""debug.py
+Superposition de debug (touche F3) : quelques lignes de texte en haut à droite.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+_font: pygame.font.Font | None = None
+
+
+def draw_overlay(surface: pygame.Surface, lines: list[str]) -> None:
+    """Affiche ``lines`` sur un fond semi-transparent."""
+    global _font
+    if _font is None:
+        _font = pygame.font.Font(None, 14)
+    rendered = [_font.render(line, True, (255, 255, 255)) for line in lines]
+    if not rendered:
+        return
+    width = max(r.get_width() for r in rendered) + 4
+    height = sum(r.get_height() for r in rendered) + 4
+    x = surface.get_width() - width - 2
+    surface.fill((0, 0, 0), (x, 2, width, height))
+    y = 4
+    for r in rendered:
+        surface.blit(r, (x + 2, y))
+        y += r.get_height()
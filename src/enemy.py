@@ -2,75 +2,213 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+import threading
 import pygame
 from settings import (
     PLAYER_SCALE,
     GRAVITY,
     GROUND_Y,
-    WINDOW_WIDTH,
-    WINDOW_HEIGHT,
     ENEMY_DIR,
+    ENEMY_CHASE_RANGE,
+    ENEMY_CHASE_SPEED,
+    ENEMY_JUMP_SPEED,
+    TENGU_HURT_FILE,
 )
+from collision import MaskBank
+from assets import finalize, load_image, load_sound, mirrored
+from navigation import Edge, NavGraph
+from terrain import HeightField
+from renderqueue import LAYERS, RenderQueue
+
+
+# Enemy types named by the levels' ``enemies`` lists. Sprites face left
+# natively; ``scale`` multiplies PLAYER_SCALE and ``tint`` multiplies the
+# colours. No dedicated cat art exists yet: cats are small, quick, tinted Tengu.
+ENEMY_TYPES: dict[str, dict] = {
+    "demon": {
+        "stand": ENEMY_DIR / "Tengu_stand_left.png",
+        "attack": ENEMY_DIR / "Tengu_attac.png",
+        "hurt_sound": TENGU_HURT_FILE,
+    },
+    "cat": {
+        "stand": ENEMY_DIR / "Tengu_stand_left.png",
+        "attack": ENEMY_DIR / "Tengu_attac.png",
+        "hurt_sound": TENGU_HURT_FILE,
+        "scale": 0.75,
+        "tint": (255, 170, 90),
+        "patrol_speed": 2,
+        "chase_range": 200,
+        "chase_speed": 3,
+        "attack_range": 30,
+        "attack_time": 14,
+    },
+}
+
 
 @dataclass
-class Enemy:
-    pos: tuple[int, int]
-    image_path: Path
-    attack_path: Path | None = None
+class EnemyArchetype:
+    """Data shared by every enemy of one type (flyweight).
+
+    Sprites, their mirrored versions and collision masks are built once per
+    type; instances only hold their position and AI state.
+    """
+
+    name: str
+    stand: pygame.Surface
+    attack: pygame.Surface
+    flipped: dict[int, pygame.Surface]
+    masks: MaskBank
+    hurt_sound: pygame.mixer.Sound | None = None
     health: int = 1
-    patrol_left: int = 0
-    patrol_right: int = 0
-    speed: int = 1
-    direction: int = 1
+    patrol_speed: int = 1
+    patrol_range: int = 40
+    chase_range: int = ENEMY_CHASE_RANGE
+    chase_speed: int = ENEMY_CHASE_SPEED
+    jump_speed: float = ENEMY_JUMP_SPEED  # negative = upwards
+    attack_range: int = 40
+    attack_time: int = 20  # the strike is active during its last 10 frames
+
+
+def _load_archetype(name: str) -> EnemyArchetype:
+    spec = dict(ENEMY_TYPES[name])
+    images = []
+    size = None
+    for key in ("stand", "attack"):
+        path = Path(spec.pop(key))
+        img = load_image(path)
+        if size is None:
+            # Both frames share the standing frame's size
+            size = int(img.get_width() * PLAYER_SCALE * spec.get("scale", 1.0))
+        img = pygame.transform.scale(img, (size, size))
+        if "tint" in spec:
+            img.fill(spec["tint"], special_flags=pygame.BLEND_RGB_MULT)
+        images.append(finalize(img, "enemies", f"{name}/{path.stem}"))
+    spec.pop("scale", None)
+    spec.pop("tint", None)
+    stand, attack = images
+    masks = MaskBank(faces_left=True)
+    masks.add(stand)
+    masks.add(attack)
+    flipped = {id(img): mirrored(img, "enemies", f"{name}/flipped") for img in (stand, attack)}
+    sound_path = spec.pop("hurt_sound", None)
+    sound = _shared_sound(Path(sound_path)) if sound_path is not None else None
+    return EnemyArchetype(name, stand, attack, flipped, masks, sound, **spec)
+
+
+def _shared_sound(path: Path) -> pygame.mixer.Sound:
+    """One ``Sound`` per file, shared by every type that uses it."""
+    sound = _SOUNDS.get(path)
+    if sound is None:
+        sound = _SOUNDS[path] = load_sound(path)
+    return sound
+
 
-    facing_left: bool = True
+_ARCHETYPES: dict[str, EnemyArchetype] = {}
+# Hit sounds by path; filled under _ARCHETYPES_LOCK like the archetypes
+_SOUNDS: dict[Path, pygame.mixer.Sound] = {}
+_ARCHETYPES_LOCK = threading.Lock()
 
-    hitbox: pygame.Rect | None = None
-    attacking: bool = False
-    attack_timer: int = 0
-    vel_y: float = 0.0
-    on_ground: bool = True
+
+def archetype(name: str) -> EnemyArchetype:
+    """Shared data for enemy type ``name``, loaded on first use.
+
+    Safe to call from the stage prefetch thread.
+    """
+    with _ARCHETYPES_LOCK:
+        kind = _ARCHETYPES.get(name)
+        if kind is None:
+            kind = _ARCHETYPES[name] = _load_archetype(name)
+        return kind
+
+
+@dataclass
+class Enemy:
+    kind: EnemyArchetype
+    pos: tuple[int, int]
 
     def __post_init__(self) -> None:
-        img = pygame.image.load(str(self.image_path)).convert_alpha()
-        scale = int(img.get_width() * PLAYER_SCALE)
-        self.image = pygame.transform.scale(img, (scale, scale))
-        self.rect = self.image.get_rect(midbottom=self.pos)
+        self.reset(self.pos)
+
+    def reset(self, pos: tuple[int, int]) -> None:
+        """Put the enemy back at ``pos`` with fresh state (pool reuse)."""
+        self.pos = pos
+        self.rect = self.kind.stand.get_rect(midbottom=pos)
         self.hitbox = self.rect.copy()
+        self.health = self.kind.health
+        self.direction = 1
+        self.facing_left = True
+        self.attacking = False
+        self.attack_timer = 0
         self.vel_y = 0.0
         self.on_ground = self.rect.bottom >= GROUND_Y
-        if self.patrol_left == 0 and self.patrol_right == 0:
-            self.patrol_left = self.rect.left - 40
-            self.patrol_right = self.rect.right + 40
-        if self.attack_path is not None:
-            aimg = pygame.image.load(str(self.attack_path)).convert_alpha()
-            self.attack_image = pygame.transform.scale(aimg, (scale, scale))
-        else:
-            self.attack_image = self.image
+        self.patrol_left = self.rect.left - self.kind.patrol_range
+        self.patrol_right = self.rect.right + self.kind.patrol_range
+        # Pursuit state (see navigation.py)
+        self.chasing = False
+        self.target_span: int | None = None
+        self.climb: Edge | None = None
+        self.air_x: int | None = None
+        # Player position as last perceived (see ``think`` in update)
+        self.seen: pygame.Rect | None = None
 
-    def draw(self, surface: pygame.Surface, offset_x: int = 0) -> None:
-        img = self.attack_image if self.attacking else self.image
+    def draw(self, queue: RenderQueue) -> None:
+        img = self.current_image()
         if not self.facing_left:
-            img = pygame.transform.flip(img, True, False)
-        rect = self.rect.move(-offset_x, 0)
-        surface.blit(img, rect)
+            img = self.kind.flipped[id(img)]
+        queue.submit(img, self.rect.topleft, LAYERS["entities"])
+
+    def ride(self, dx: int, top: int) -> None:
+        """Follow a moving platform: shifted by ``dx`` and set down on ``top``.
+
+        The patrol bounds travel with it.
+        """
+        self.hitbox.x += dx
+        self.hitbox.bottom = top
+        self.vel_y = 0
+        self.on_ground = True
+        self.patrol_left += dx
+        self.patrol_right += dx
+        self.rect.topleft = self.hitbox.topleft
 
     def take_damage(self, amount: int) -> None:
         self.health = max(0, self.health - amount)
 
-    def update(self, player_rect: pygame.Rect, platforms: list[pygame.Rect] | None = None) -> None:
-        """Met à jour l'ennemi en faisant toujours face au joueur."""
+    def update(
+        self,
+        player_rect: pygame.Rect,
+        platforms: list[pygame.Rect] | None = None,
+        walls: list[pygame.Rect] | None = None,
+        nav: NavGraph | None = None,
+        think: bool = True,
+        ground: HeightField | None = None,
+    ) -> None:
+        """Met à jour l'ennemi en faisant toujours face au joueur.
+
+        With a navigation graph, the enemy chases a nearby player across
+        platforms; otherwise it patrols between ``patrol_left`` and
+        ``patrol_right``. When ``think`` is false, decisions reuse the player
+        position seen on the last thinking tick (lower quality profiles);
+        movement and physics still run every tick. ``ground`` makes stairs
+        and slopes walkable (see terrain.py).
+        """
         if self.health <= 0:
             return
+        if think or self.seen is None:
+            self.seen = player_rect.copy()
+        player_rect = self.seen
+        on_terrain = ground is not None and self.on_ground and ground.stands_on(self.hitbox)
 
         # Gravity
-        if not self.on_ground:
+        if not self.on_ground and self.climb is None:
             self.vel_y += GRAVITY
             self.hitbox.y += int(self.vel_y)
             if self.hitbox.bottom >= GROUND_Y:
                 self.hitbox.bottom = GROUND_Y
                 self.vel_y = 0
                 self.on_ground = True
+            if ground is not None and not self.on_ground and ground.land(self.hitbox, int(self.vel_y)):
+                self.vel_y = 0
+                self.on_ground = True
             if platforms:
                 for plat in platforms:
                     will_land = (
@@ -84,13 +222,41 @@ class Enemy:
                         self.vel_y = 0
                         self.on_ground = True
                         break
-        self.rect.y = self.hitbox.y
 
-        # Patrol left and right
-        self.hitbox.x += self.direction * self.speed
-        self.rect.x = self.hitbox.x
-        if self.hitbox.left <= self.patrol_left or self.hitbox.right >= self.patrol_right:
-            self.direction *= -1
+        kind = self.kind
+        if nav is not None and abs(player_rect.centerx - self.hitbox.centerx) < kind.chase_range:
+            self.chasing = True
+            self._chase(player_rect, nav, platforms or [], ground, on_terrain)
+        else:
+            if self.chasing:
+                # Resume patrolling around wherever the pursuit ended
+                self.chasing = False
+                if self.climb is not None:
+                    # Let go of the ladder/stairs: gravity takes over
+                    self.climb = None
+                    self.on_ground = False
+                    self.vel_y = 0
+                self.patrol_left = self.hitbox.left - kind.patrol_range
+                self.patrol_right = self.hitbox.right + kind.patrol_range
+            # Patrol left and right
+            self.hitbox.x += self.direction * kind.patrol_speed
+            if self.hitbox.left <= self.patrol_left or self.hitbox.right >= self.patrol_right:
+                self.direction *= -1
+            # The patrol may now start at a platform edge
+            self._check_support(platforms or [], ground, on_terrain)
+
+        if walls:
+            for wall in walls:
+                if self.hitbox.colliderect(wall):
+                    if self.hitbox.centerx < wall.centerx:
+                        self.hitbox.right = wall.left
+                    else:
+                        self.hitbox.left = wall.right
+                    self.direction *= -1
+        # Stairs and slopes: walking feet follow the ground
+        if on_terrain and self.on_ground and self.climb is None:
+            ground.follow(self.hitbox)
+        self.rect.topleft = self.hitbox.topleft
 
         # oriente le Tengu vers le joueur cible
         self.facing_left = player_rect.centerx < self.hitbox.centerx
@@ -101,31 +267,103 @@ class Enemy:
                 self.attacking = False
             return
         # Déclenche l'attaque si le joueur est à portée
-        if abs(player_rect.centerx - self.hitbox.centerx) < 40 and abs(player_rect.centery - self.hitbox.centery) < self.hitbox.height:
+        if abs(player_rect.centerx - self.hitbox.centerx) < kind.attack_range and abs(player_rect.centery - self.hitbox.centery) < self.hitbox.height:
             self.attacking = True
-            self.attack_timer = 20
+            self.attack_timer = kind.attack_time
             self.facing_left = player_rect.centerx < self.hitbox.centerx
 
+    def _chase(
+        self,
+        player_rect: pygame.Rect,
+        nav: NavGraph,
+        platforms: list[pygame.Rect],
+        ground: HeightField | None = None,
+        on_terrain: bool = False,
+    ) -> None:
+        """Follow the precomputed route towards the player's span."""
+        target = nav.span_at(player_rect.centerx, player_rect.bottom)
+        if target is not None:
+            # Keep the last known span while the player is in the air
+            self.target_span = target.id
+
+        if self.climb is not None:
+            # Climb vertically along the ladder/stairs, then step onto the span
+            dst = nav.spans[self.climb.dst]
+            dy = dst.y - self.hitbox.bottom
+            if dy:
+                speed = self.kind.chase_speed
+                self.hitbox.y += max(-speed, min(speed, dy))
+            elif self.hitbox.centerx != self.climb.land_x:
+                self._step_towards(self.climb.land_x)
+            else:
+                self.climb = None
+                self.on_ground = True
+                self.vel_y = 0
+            return
+
+        if not self.on_ground:
+            # Keep drifting towards the landing point of a jump or drop
+            if self.air_x is not None:
+                self._step_towards(self.air_x)
+            return
+
+        goal_x = player_rect.centerx
+        span = nav.span_at(self.hitbox.centerx, self.hitbox.bottom)
+        if span is not None and self.target_span is not None and span.id != self.target_span:
+            edge = nav.next_edge[span.id][self.target_span]
+            if edge is not None:
+                goal_x = edge.x
+                if abs(self.hitbox.centerx - edge.x) <= self.kind.chase_speed:
+                    self.hitbox.centerx = edge.x
+                    if edge.kind == "climb":
+                        self.climb = edge
+                        return
+                    if edge.kind == "jump":
+                        self.vel_y = self.kind.jump_speed
+                        self.on_ground = False
+                    goal_x = edge.land_x
+                self.air_x = edge.land_x
+        self._step_towards(goal_x)
+        self._check_support(platforms, ground, on_terrain)
+
+    def _check_support(
+        self,
+        platforms: list[pygame.Rect],
+        ground: HeightField | None,
+        on_terrain: bool,
+    ) -> None:
+        """Start falling if the enemy walked off an edge."""
+        if self.on_ground and self.hitbox.bottom < GROUND_Y:
+            supported = any(
+                plat.top == self.hitbox.bottom
+                and self.hitbox.right > plat.left
+                and self.hitbox.left < plat.right
+                for plat in platforms
+            ) or (on_terrain and ground.follow(self.hitbox))
+            if not supported:
+                self.on_ground = False
+                self.vel_y = 0
+
+    def _step_towards(self, x: int) -> None:
+        dx = x - self.hitbox.centerx
+        speed = self.kind.chase_speed
+        self.hitbox.x += max(-speed, min(speed, dx))
+
+    def current_image(self) -> pygame.Surface:
+        return self.kind.attack if self.attacking else self.kind.stand
+
     def get_attack_rect(self) -> pygame.Rect | None:
+        """Bounding rect of the striking part of the attack frame."""
         if not self.attacking or self.attack_timer > 10:
             return None
-        width = 16
-        height = self.hitbox.height // 2
-        y = self.hitbox.centery - height // 2
-        if self.facing_left:
-            x = self.hitbox.left - width
-        else:
-            x = self.hitbox.right
-        return pygame.Rect(x, y, width, height)
-
-
-def create_level_enemies() -> list[Enemy]:
-    """Create the Tengu enemies for the level."""
-    stand = ENEMY_DIR / "Tengu_stand_left.png"
-    attack = ENEMY_DIR / "Tengu_attac.png"
-    enemies: list[Enemy] = []
+        rect = self.kind.masks.get(self.kind.attack, self.facing_left).strike_rect
+        if not rect.width:
+            return None
+        return rect.move(self.rect.topleft)
 
-    enemies.append(Enemy((WINDOW_WIDTH + 40, WINDOW_HEIGHT - 48), stand, attack))
-    enemies.append(Enemy((2 * WINDOW_WIDTH + 120, WINDOW_HEIGHT - 96), stand, attack))
+    def get_attack_mask(self) -> pygame.mask.Mask:
+        return self.kind.masks.get(self.kind.attack, self.facing_left).strike
 
-    return enemies
+    def get_body_mask(self) -> pygame.mask.Mask:
+        """Silhouette of the displayed frame, anchored at ``self.rect``."""
+        return self.kind.masks.get(self.current_image(), self.facing_left).body
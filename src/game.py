@@ -0,0 +1,637 @@
+"""game.py
+État d'une partie : niveau, personnages, ennemis, menu et superpositions.
+La boucle de ``main.py`` appelle, à chaque frame : ``handle_event`` pour chaque
+événement, puis ``update`` avec les actions du tick, puis ``render``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+import weakref
+import pygame
+
+from settings import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    PUNCH_SOUND_FILE,
+    KICK_SOUND_FILE,
+    SWORD_SOUND_FILE,
+    HEART_IMG,
+    SNES_IMG,
+    INCREMENTAL_RENDER,
+    STAGE_FADE_TIME,
+)
+from player import Player
+from characters import PARTY, create_player
+from party import Party
+from camera import Camera, ScrollingLayer
+from collision import masks_collide
+from colliders import PlatformIndex, rides
+from particles import ParticleSystem
+from quality import PROFILES, DEFAULT_PROFILE, QualityProfile
+from renderqueue import LAYERS, RenderQueue
+from inputs import ActionState, InputManager
+from assets import finalize, load_image, load_music, load_sound
+from memory import LEDGER
+from stages import Stage, StageManager
+from enemy import Enemy
+
+
+# Touches par défaut (correspondance avec la manette SNES en commentaire)
+DEFAULT_CONTROLS: dict[str, int] = {
+    "up": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "attack": pygame.K_d,  # A
+    "kick": pygame.K_f,    # B
+    "special": pygame.K_s,  # X
+    "jump": pygame.K_SPACE,  # Y
+    "next": pygame.K_e,   # R
+    "prev": pygame.K_r,   # L
+}
+
+# Ordre d'affichage des touches dans le menu de configuration
+MENU_KEYS: list[str] = [
+    "up",
+    "down",
+    "left",
+    "right",
+    "attack",
+    "kick",
+    "special",
+    "jump",
+    "prev",
+    "next",
+]
+
+
+@dataclass(frozen=True)
+class MenuView:
+    """Ce que le menu affiche, figé au tick."""
+
+    music_volume: float
+    sfx_volume: float
+    selected_key: int
+    waiting_key: str | None
+    key_names: tuple[str, ...]  # dans l'ordre de MENU_KEYS
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """État figé d'un tick : tout ce qu'il faut pour dessiner une frame."""
+
+    tick: int
+    stage: Stage
+    camera_x: int
+    queue: RenderQueue  # sprites du tick, en coordonnées écran
+    # Superpositions dans l'ordre : ("fade", opacité), ("veil", opacité), ("message", texte)
+    overlays: tuple[tuple[str, int | str], ...] = ()
+    menu: MenuView | None = None
+    debug: bool = False
+    # Première pression du tick (perf_counter_ns), pour la latence entrée → affichage
+    input_ns: int | None = None
+
+
+@lru_cache(maxsize=None)
+def font(size: int) -> pygame.font.Font:
+    """Police par défaut, chargée une fois par taille (et non à chaque frame)."""
+    return pygame.font.Font(None, size)
+
+
+class Game:
+    """Une partie en cours, du chargement du niveau à l'écran de fin."""
+
+    def __init__(
+        self,
+        controls: dict[str, int] | None = None,
+        quality: QualityProfile | None = None,
+    ) -> None:
+        # Profil de qualité : densité des effets, parallaxe, cadence de l'IA
+        self.quality = quality or PROFILES[DEFAULT_PROFILE]
+
+        # effets sonores
+        self.punch_snd = load_sound(PUNCH_SOUND_FILE)
+        self.kick_snd = load_sound(KICK_SOUND_FILE)
+        self.sword_snd = load_sound(SWORD_SOUND_FILE)
+        self._music: Path | None = None
+
+        # Stages : le premier est chargé ici, les suivants en arrière-plan
+        self.stages = StageManager(quality=self.quality)
+
+        # Entités
+        self.players = [create_player(name) for name in PARTY]
+        self.current_player = 0
+        # Les autres ronins suivent le personnage contrôlé
+        self.party = Party(self.players)
+        self.particles = ParticleSystem(
+            capacity=self.quality.particle_capacity, density=self.quality.particle_density
+        )
+        self.camera = Camera(WINDOW_WIDTH, self.stages.current.width)
+        # Décor mémorisé pour le rendu incrémental, et zones salies par les
+        # entités à la frame précédente
+        self.scenery = ScrollingLayer((WINDOW_WIDTH, WINDOW_HEIGHT), self.paint_scenery)
+        self._scenery_stage: Stage | None = None
+        self.incremental = INCREMENTAL_RENDER
+        self.queue = RenderQueue()
+        self.scenery_queue = RenderQueue()
+        self._dirty: list[pygame.Rect] = []
+        self._full_redraw = True
+
+        heart_img = load_image(HEART_IMG)
+        heart_scale = int(heart_img.get_width() * 0.012)
+        self.heart = finalize(
+            pygame.transform.scale(heart_img, (heart_scale, heart_scale)), "ui", "heart"
+        )
+        # Surfaces d'interface créées à la demande (voile, manette du menu)
+        self._ui_cache: dict[str, pygame.Surface] = {}
+
+        # Entrées : la table des touches est partagée avec le menu
+        self.controls = dict(DEFAULT_CONTROLS if controls is None else controls)
+        self.inputs = InputManager(self.controls)
+
+        self.menu_open = False
+        self.waiting_key: str | None = None
+        self.selected_key = 0
+        self.music_volume = 1.0
+        self.sfx_volume = 1.0
+        self.show_debug = False
+
+        self.running = True
+        self.game_over = False
+        self.stage_complete = False
+        self.stage_timer = 0
+        self.fade_in = 0  # frames restantes du fondu d'entrée dans un stage
+        self.restart = False
+        self.tick = 0
+        self.enter_stage(self.stages.current)
+
+    def enter_stage(self, stage: Stage) -> None:
+        """Installe ``stage`` : géométrie, ennemis, musique, personnages et caméra."""
+        self.stage = stage
+        self.background = stage.background
+        self.level_width = stage.width
+        self.platforms = stage.platforms
+        self.movers = stage.movers
+        self.ladders = stage.ladders
+        self.stairs = stage.stairs
+        self.walls = stage.walls
+        self.ground = stage.ground
+        # Les plateformes sont indexées une fois ; seules les mobiles y bougent
+        self.colliders = PlatformIndex(stage.platforms, stage.movers)
+        self._ladder_rects = [l.rect for l in stage.ladders]
+        self._wall_rects = [w.rect for w in stage.walls]
+        self.static_props = stage.static_props
+        self.props = stage.props
+        self.spawner = stage.spawner
+        self.nav = stage.nav
+
+        # La musique du stage 1 n'est pas encore dans les assets : on joue
+        # sans plutôt que de refuser de démarrer.
+        if stage.music != self._music:
+            self._music = stage.music
+            try:
+                load_music(stage.music)
+                pygame.mixer.music.play(-1)
+            except (FileNotFoundError, pygame.error):
+                pygame.mixer.music.stop()
+
+        for player in self.players:
+            player.hitbox.topleft = stage.spawn
+            player.vel.update(0, 0)
+            player.on_ladder = False
+        self.party.reset(self.player)
+        self.particles.clear()
+        self.inputs.release_all()
+        self.camera.level_width = stage.width
+        self.camera_x = self.camera.snap(self.player.hitbox.centerx)
+        self.spawner.update(self.camera_x, WINDOW_WIDTH)
+
+    @property
+    def player(self) -> Player:
+        """Personnage actuellement contrôlé."""
+        return self.players[self.current_player]
+
+    @property
+    def enemies(self) -> list[Enemy]:
+        """Ennemis présents autour de la caméra."""
+        return self.spawner.active
+
+    # ————————————————————
+    # Événements
+    # ————————————————————
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Traite un événement : menus immédiatement, actions de jeu au tick."""
+        if event.type == pygame.QUIT:
+            self.running = False
+            return
+        if event.type == pygame.WINDOWFOCUSLOST:
+            # Les relâchements de la manette n'arrivent pas à une fenêtre en
+            # arrière-plan : rien ne doit rester enfoncé
+            self.inputs.release_all()
+            return
+        self.inputs.process(event)
+        if event.type != pygame.KEYDOWN:
+            return
+
+        if self.game_over:
+            if event.key == pygame.K_o:
+                self.restart = True
+                self.running = False
+            return
+        if event.key == pygame.K_F3:
+            self.show_debug = not self.show_debug
+        elif event.key == pygame.K_ESCAPE:
+            self.toggle_menu()
+        elif self.menu_open and self.waiting_key is None:
+            if event.key == pygame.K_m:
+                self.music_volume = max(0.0, self.music_volume - 0.1)
+                pygame.mixer.music.set_volume(self.music_volume)
+            elif event.key == pygame.K_p:
+                self.music_volume = min(1.0, self.music_volume + 0.1)
+                pygame.mixer.music.set_volume(self.music_volume)
+            elif event.key == pygame.K_s:
+                self.sfx_volume = max(0.0, self.sfx_volume - 0.1)
+            elif event.key == pygame.K_d:
+                self.sfx_volume = min(1.0, self.sfx_volume + 0.1)
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN):
+                cols = 5
+                row = self.selected_key // cols
+                col = self.selected_key % cols
+                if event.key == pygame.K_LEFT and col > 0:
+                    col -= 1
+                elif event.key == pygame.K_RIGHT and col < cols - 1 and row * cols + col + 1 < len(MENU_KEYS):
+                    col += 1
+                elif event.key == pygame.K_UP and row > 0:
+                    row -= 1
+                elif event.key == pygame.K_DOWN and (row + 1) * cols + col < len(MENU_KEYS):
+                    row += 1
+                self.selected_key = row * cols + col
+            elif event.key == pygame.K_RETURN:
+                self.waiting_key = MENU_KEYS[self.selected_key]
+        elif self.menu_open and self.waiting_key:
+            self.controls[self.waiting_key] = event.key
+            self.waiting_key = None
+        elif event.key == pygame.K_p:
+            self.restart = True
+            self.running = False
+
+    def toggle_menu(self) -> None:
+        self.menu_open = not self.menu_open
+        if self.menu_open:
+            pygame.mixer.music.pause()
+        else:
+            pygame.mixer.music.unpause()
+
+    def switch_player(self, step: int) -> None:
+        """Passe au personnage suivant (``step`` = 1) ou précédent (-1)."""
+        old = self.player
+        self.current_player = (self.current_player + step) % len(self.players)
+        self.player.hitbox.midbottom = old.hitbox.midbottom
+
+    # ————————————————————
+    # Simulation
+    # ————————————————————
+
+    def update(self, actions: ActionState) -> None:
+        """Avance la simulation d'un tick."""
+        if "menu" in actions.pressed and not self.game_over:
+            self.toggle_menu()
+        if self.game_over:
+            return
+        if self.menu_open:
+            # Le menu capte les flèches : le personnage ne bouge pas
+            actions = ActionState()
+
+        if "attack" in actions.pressed:
+            self.player.start_attack()
+            if self.player.name.lower() == "oishi":
+                self.sword_snd.set_volume(self.sfx_volume)
+                self.sword_snd.play()
+        elif "kick" in actions.pressed:
+            self.player.start_kick()
+        if "next" in actions.pressed:
+            self.switch_player(1)
+        elif "prev" in actions.pressed:
+            self.switch_player(-1)
+
+        self.move_platforms()
+        player = self.player
+        player.jump_sound.set_volume(self.sfx_volume)
+        player.update(actions, self.colliders.near(player.hitbox), self._ladder_rects, self._wall_rects, self.ground)
+        self.camera_x = self.camera.update(player.hitbox.centerx, player.facing_left)
+        if player.just_landed:
+            self.particles.dust(player.hitbox.centerx, player.hitbox.bottom)
+        attack_rect = player.get_attack_rect()
+        attack_mask = player.get_attack_mask() if attack_rect else None
+        body_rect = player.sprite_rect()
+        body_mask = player.get_body_mask()
+
+        # Les ennemis réfléchissent à tour de rôle quand l'IA est ralentie
+        interval = self.quality.ai_interval
+        self.tick += 1
+        for i, enemy in enumerate(self.enemies):
+            think = (self.tick + i) % interval == 0
+            enemy.update(
+                player.hitbox, self.colliders.near(enemy.hitbox), self._wall_rects, self.nav, think, self.ground
+            )
+            # Rectangles d'abord, masques précalculés ensuite
+            e_rect = enemy.get_attack_rect()
+            if e_rect and masks_collide(e_rect, enemy.get_attack_mask(), body_rect, body_mask):
+                health = player.health
+                from_left = e_rect.centerx < player.hitbox.centerx
+                player.take_damage(1, from_left=from_left)
+                if player.health < health:
+                    self.particles.hit(player.hitbox.centerx, player.hitbox.centery, from_left)
+            if attack_rect and masks_collide(attack_rect, attack_mask, enemy.rect, enemy.get_body_mask()):
+                health = enemy.health
+                enemy.take_damage(player.attack_damage())
+                if enemy.health < health and enemy.kind.hurt_sound is not None:
+                    enemy.kind.hurt_sound.set_volume(self.sfx_volume)
+                    enemy.kind.hurt_sound.play()
+                clip = attack_rect.clip(enemy.rect)
+                self.particles.hit(clip.centerx, clip.centery, not player.facing_left)
+        # Morts et ennemis sortis de la fenêtre retournent à la réserve
+        self.spawner.update(self.camera_x, WINDOW_WIDTH)
+        self.particles.update()
+
+        # Switch character if health depleted
+        if player.health <= 0:
+            next_idx = None
+            for i in range(len(self.players)):
+                idx = (self.current_player + i + 1) % len(self.players)
+                if self.players[idx].health > 0:
+                    next_idx = idx
+                    break
+            if next_idx is not None:
+                self.players[next_idx].hitbox.midbottom = player.hitbox.midbottom
+                self.current_player = next_idx
+            else:
+                self.game_over = True
+
+        self.party.update(self.player, self.tick)
+
+        # Le stage suivant se charge en arrière-plan pendant la fin de celui-ci
+        self.stages.update(self.player.hitbox.centerx)
+        if not self.stage_complete and self.player.hitbox.right >= self.level_width:
+            self.stage_complete = True
+            self.stage_timer = STAGE_FADE_TIME if self.stages.has_next else 120
+
+        if self.stage_complete:
+            self.stage_timer -= 1
+            if self.stage_timer <= 0:
+                if self.stages.has_next:
+                    # Écran noir : on change de stage puis on rouvre en fondu
+                    self.enter_stage(self.stages.advance())
+                    self.stage_complete = False
+                    self.fade_in = STAGE_FADE_TIME
+                else:
+                    self.running = False
+        elif self.fade_in:
+            self.fade_in -= 1
+
+    def move_platforms(self) -> None:
+        """Avance les plateformes mobiles, avant les entités, en emportant leurs passagers."""
+        if not self.movers:
+            return
+        player = self.player
+        bodies = [(player, player.vel.y >= 0 and not player.on_ladder)]
+        bodies += [(e, e.vel_y >= 0 and e.climb is None) for e in self.enemies if e.health > 0]
+        for mover in self.movers:
+            old = mover.rect.copy()
+            dx, dy = mover.step()
+            if not (dx or dy):
+                continue
+            self.colliders.move(mover)
+            for body, falling in bodies:
+                if not rides(body.hitbox, old, mover.rect, body.on_ground, falling):
+                    continue
+                body.ride(dx, mover.rect.top)
+                # Un mur arrête le passager, la plateforme glisse sous lui
+                for wall in self._wall_rects:
+                    if body.hitbox.colliderect(wall):
+                        if dx > 0:
+                            body.hitbox.right = wall.left
+                        else:
+                            body.hitbox.left = wall.right
+
+    # ————————————————————
+    # Rendu
+    # ————————————————————
+
+    def paint_scenery(self, surface: pygame.Surface, camera_x: int) -> None:
+        """Dessine le décor et la géométrie du stage affiché dans la zone de découpe."""
+        stage = self._scenery_stage
+        stage.background.draw(surface, camera_x)
+        queue = self.scenery_queue
+        queue.camera_x = camera_x
+        for group in (stage.platforms, stage.ladders, stage.stairs, stage.walls):
+            for item in group:
+                queue.submit(item.image, item.rect.topleft, LAYERS["scenery"])
+        for prop in stage.static_props:
+            queue.submit(prop.image, prop.rect.topleft, prop.layer)
+        queue.flush(surface)
+
+    def snapshot(self, input_ns: int | None = None) -> Snapshot:
+        """Fige l'état du tick pour le rendu.
+
+        Les sprites sont déposés dans une file neuve, positions déjà converties
+        en coordonnées écran : l'instantané ne partage rien de modifiable avec
+        la simulation et peut être dessiné par un autre thread.
+        """
+        camera_x = self.camera_x
+        queue = RenderQueue()
+        queue.camera_x = camera_x
+        for mover in self.movers:
+            queue.submit(mover.image, mover.rect.topleft, LAYERS["scenery"])
+        for enemy in self.enemies:
+            enemy.draw(queue)
+        self.party.draw(queue)
+        self.player.draw(queue)
+        self.particles.draw(queue)
+        for prop in self.props:
+            queue.submit(prop.image, prop.rect.topleft, prop.layer)
+        self.player.draw_health(queue, self.heart)
+
+        overlays: list[tuple[str, int | str]] = []
+        if self.fade_in:
+            overlays.append(("fade", 255 * self.fade_in // STAGE_FADE_TIME))
+        if self.stage_complete:
+            if self.stages.has_next:
+                elapsed = STAGE_FADE_TIME - self.stage_timer
+                overlays.append(("fade", 255 * elapsed // STAGE_FADE_TIME))
+            else:
+                overlays.append(("veil", 180))
+            overlays.append(("message", "Stage Clear!"))
+        if self.game_over:
+            overlays.append(("veil", 180))
+            overlays.append(("message", "Game Over - Press 'O' to restart"))
+        menu = None
+        if self.menu_open:
+            menu = MenuView(
+                self.music_volume,
+                self.sfx_volume,
+                self.selected_key,
+                self.waiting_key,
+                tuple(pygame.key.name(self.controls[k]) for k in MENU_KEYS),
+            )
+        return Snapshot(
+            tick=self.tick,
+            stage=self.stage,
+            camera_x=camera_x,
+            queue=queue,
+            overlays=tuple(overlays),
+            menu=menu,
+            debug=self.show_debug,
+            input_ns=input_ns,
+        )
+
+    def render(self, canvas: pygame.Surface) -> None:
+        """Dessine l'état courant sur la surface 320×240."""
+        self.draw(canvas, self.snapshot())
+
+    def draw(self, canvas: pygame.Surface, snap: Snapshot) -> None:
+        """Dessine l'instantané ``snap`` et ses superpositions.
+
+        En rendu incrémental, ``canvas`` doit être la même surface d'une frame
+        à l'autre : le décor y est décalé avec ``Surface.scroll``, puis seules
+        la bande découverte et les zones des entités de la frame précédente
+        sont restaurées avant de dessiner les entités. Tout ce qui bouge passe
+        par la file de rendu, dessinée couche par couche. Seul ce côté-ci
+        touche au décor mémorisé et aux surfaces d'interface.
+        """
+        camera_x = snap.camera_x
+        if snap.stage is not self._scenery_stage:
+            self._scenery_stage = snap.stage
+            self.scenery.invalidate()
+        if self.incremental and snap.stage.background.scrolls_with_camera:
+            previous_x = self.scenery.x
+            strip = self.scenery.scroll_to(camera_x)
+            if strip is None or self._full_redraw:
+                canvas.blit(self.scenery.surface, (0, 0))
+            else:
+                dx = camera_x - previous_x
+                if dx:
+                    canvas.scroll(-dx, 0)
+                scenery = self.scenery.surface
+                restore = [(scenery, r, r) for r in (strip, *(r.move(-dx, 0) for r in self._dirty))]
+                canvas.blits(restore, doreturn=False)
+        else:
+            self.paint_scenery(canvas, camera_x)
+
+        self.queue = snap.queue
+        self._dirty = []
+        snap.queue.flush(canvas, self._dirty, clear=False)
+        # Les superpositions couvrent tout l'écran : repartir d'une copie
+        # complète du décor à la frame suivante
+        self._full_redraw = bool(snap.overlays) or snap.menu is not None or snap.debug
+
+        for kind, value in snap.overlays:
+            if kind == "fade":
+                canvas.blit(self.fade(value), (0, 0))
+            elif kind == "veil":
+                canvas.blit(self.veil(value), (0, 0))
+            else:
+                msg = font(32).render(value, True, (255, 255, 255))
+                rect = msg.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+                canvas.blit(msg, rect)
+
+        if snap.menu is not None:
+            self.render_menu(canvas, snap.menu)
+
+    def ui_surface(self, key: str, factory) -> pygame.Surface:
+        """Surface d'interface mise en cache, évictable si le budget est dépassé."""
+        surf = self._ui_cache.get(key)
+        if surf is None:
+            # Référence faible : le registre ne doit pas garder la partie en vie
+            owner = weakref.ref(self)
+
+            def evict() -> None:
+                game = owner()
+                if game is not None:
+                    game._ui_cache.pop(key, None)
+
+            # ``finalize`` peut rendre une copie optimisée : c'est elle qu'on garde
+            surf = finalize(factory(), "ui", key, evict)
+            self._ui_cache[key] = surf
+        return surf
+
+    def veil(self, alpha: int) -> pygame.Surface:
+        """Voile noir semi-transparent couvrant l'écran."""
+
+        def make() -> pygame.Surface:
+            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            return overlay
+
+        return self.ui_surface(f"veil{alpha}", make)
+
+    def fade(self, alpha: int) -> pygame.Surface:
+        """Écran noir d'opacité ``alpha`` pour les transitions (une seule surface)."""
+
+        def make() -> pygame.Surface:
+            black = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            black.fill((0, 0, 0))
+            return black
+
+        surf = self.ui_surface("fade", make)
+        surf.set_alpha(alpha)
+        return surf
+
+    def render_menu(self, canvas: pygame.Surface, menu: MenuView) -> None:
+        canvas.blit(self.veil(200), (0, 0))
+        menu_font = font(24)
+        title = menu_font.render("Menu", True, (255, 255, 255))
+        canvas.blit(title, (20, 20))
+
+        # Sliders volume
+        bar_w = 100
+        bar_h = 6
+        vol_y = 50
+        pygame.draw.rect(canvas, (100, 100, 100), (20, vol_y, bar_w, bar_h))
+        pygame.draw.rect(canvas, (255, 255, 255), (20, vol_y, int(bar_w * menu.music_volume), bar_h))
+        txt = menu_font.render("Musique", True, (255, 255, 255))
+        canvas.blit(txt, (130, vol_y - 4))
+
+        vol_y += 20
+        pygame.draw.rect(canvas, (100, 100, 100), (20, vol_y, bar_w, bar_h))
+        pygame.draw.rect(canvas, (255, 255, 255), (20, vol_y, int(bar_w * menu.sfx_volume), bar_h))
+        txt = menu_font.render("Effets", True, (255, 255, 255))
+        canvas.blit(txt, (130, vol_y - 4))
+
+        snes = self.ui_surface(
+            "snes",
+            lambda: pygame.transform.scale(load_image(SNES_IMG), (120, 60)),
+        )
+        canvas.blit(snes, (20, vol_y + 30))
+
+        key_y = vol_y + 100
+        box_w = 20
+        for i, k in enumerate(MENU_KEYS):
+            x = 20 + (i % 5) * 60
+            y = key_y + (i // 5) * 30
+            color = (255, 0, 0) if i == menu.selected_key else (200, 200, 200)
+            pygame.draw.rect(canvas, color, (x, y, box_w, box_w), 1)
+            txt = menu_font.render(menu.key_names[i], True, (255, 255, 255))
+            canvas.blit(txt, (x + box_w + 4, y))
+
+        if menu.waiting_key:
+            txt = menu_font.render("Appuyez sur une touche...", True, (255, 255, 0))
+            canvas.blit(txt, (20, key_y + 70))
+
+    def debug_lines(self) -> list[str]:
+        """Lignes affichées par la superposition de debug (F3)."""
+        lines = [str(self.inputs.latency), f"qualité : {self.quality.name}"]
+        for category, nbytes in LEDGER.totals().items():
+            lines.append(f"{category} : {nbytes // 1024} Kio")
+        lines.append(f"total : {LEDGER.total() // 1024} Kio")
+        lines.append(f"particules : {self.particles.count}")
+        spawner = self.spawner
+        lines.append(f"ennemis : {len(spawner.active)} actifs, {spawner.pooled} en réserve, {spawner.created} créés")
+        if self.movers:
+            lines.append(f"plateformes mobiles : {len(self.movers)}, changements de colonne : {self.colliders.reindexed}")
+        lines.append(f"sprites : {self.queue.drawn}/{self.queue.submitted}")
+        return lines
@@ -0,0 +1,205 @@
+"""inputs.py
+Couche d'entrée : clavier et manettes.
+Les événements sont horodatés dès leur collecte puis regroupés par tick de
+simulation. Le jeu ne lit plus de touches mais des actions (« left », « jump »,
+« attack »…) définies par la table ``controls``.
+Le temps entre une entrée et l'affichage de la frame qui en tient compte est
+mesuré pour suivre l'effet des réglages de cadence.
+Les actions de chaque tick peuvent être enregistrées puis rejouées (soak.py).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import time
+from typing import Iterator
+import pygame
+from settings import PAD_BUTTONS, PAD_DEADZONE
+
+
+@dataclass(frozen=True)
+class InputEvent:
+    """Changement d'état d'une action, horodaté à la collecte."""
+
+    action: str
+    down: bool
+    time_ns: int
+    device: str = "keyboard"
+
+
+@dataclass(frozen=True)
+class ActionState:
+    """Actions vues par la simulation pendant un tick."""
+
+    held: frozenset[str] = frozenset()  # actions maintenues en fin de tick
+    pressed: frozenset[str] = frozenset()  # actions enfoncées pendant le tick
+    events: tuple[InputEvent, ...] = ()
+
+
+class LatencyMeter:
+    """Historique glissant des latences entrée → frame présentée."""
+
+    def __init__(self, size: int = 240) -> None:
+        self.samples: deque[int] = deque(maxlen=size)
+
+    def record(self, latency_ns: int) -> None:
+        self.samples.append(latency_ns)
+
+    def summary(self) -> dict[str, float]:
+        """Percentiles en millisecondes (vide s'il n'y a aucune mesure)."""
+        if not self.samples:
+            return {}
+        values = sorted(self.samples)
+        last = len(values) - 1
+        return {
+            "p50": values[last // 2] / 1e6,
+            "p95": values[int(last * 0.95)] / 1e6,
+            "max": values[last] / 1e6,
+        }
+
+    def __str__(self) -> str:
+        stats = self.summary()
+        if not stats:
+            return "latence : -"
+        return "latence : p50 {p50:.1f} ms  p95 {p95:.1f} ms  max {max:.1f} ms".format(**stats)
+
+
+class InputManager:
+    """Collecte les événements clavier/manette et les livre par tick."""
+
+    def __init__(self, controls: dict[str, int], pad_buttons: dict[int, str] | None = None) -> None:
+        # ``controls`` est partagé avec le menu : une touche réassignée est
+        # prise en compte immédiatement.
+        self.controls = controls
+        self.pad_buttons = dict(PAD_BUTTONS if pad_buttons is None else pad_buttons)
+        self.latency = LatencyMeter()
+        self._queue: list[InputEvent] = []
+        # action -> sources qui la maintiennent (touche, bouton, croix…)
+        self._held: dict[str, set[tuple]] = {}
+        self._directions: dict[tuple, frozenset[str]] = {}
+        self._joysticks: dict[int, pygame.joystick.JoystickType] = {}
+        self._tick_input_ns: int | None = None
+
+    # ————————————————————
+    # Collecte
+    # ————————————————————
+
+    def process(self, event: pygame.event.Event) -> None:
+        """Traduit un événement pygame en actions horodatées."""
+        now = time.perf_counter_ns()
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            down = event.type == pygame.KEYDOWN
+            for action, key in self.controls.items():
+                if key == event.key:
+                    self._set(action, ("key", key), down, now, "keyboard")
+        elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+            action = self.pad_buttons.get(event.button)
+            if action:
+                down = event.type == pygame.JOYBUTTONDOWN
+                self._set(action, ("button", event.instance_id, event.button), down, now, "gamepad")
+        elif event.type == pygame.JOYHATMOTION:
+            x, y = event.value
+            dirs = set()
+            if x:
+                dirs.add("left" if x < 0 else "right")
+            if y:
+                dirs.add("up" if y > 0 else "down")
+            self._set_directions(("hat", event.instance_id, event.hat), dirs, now)
+        elif event.type == pygame.JOYAXISMOTION and event.axis in (0, 1):
+            dirs = set()
+            if abs(event.value) >= PAD_DEADZONE:
+                if event.axis == 0:
+                    dirs.add("left" if event.value < 0 else "right")
+                else:
+                    dirs.add("up" if event.value < 0 else "down")
+            self._set_directions(("axis", event.instance_id, event.axis), dirs, now)
+        elif event.type == pygame.JOYDEVICEADDED:
+            joy = pygame.joystick.Joystick(event.device_index)
+            self._joysticks[joy.get_instance_id()] = joy
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            # Manette débranchée : ses actions sont relâchées comme par l'utilisateur
+            self._joysticks.pop(event.instance_id, None)
+            for source in [s for s in self._directions if s[1] == event.instance_id]:
+                self._set_directions(source, set(), now)
+                del self._directions[source]
+            for action, sources in list(self._held.items()):
+                for source in [s for s in sources if s[0] != "key" and s[1] == event.instance_id]:
+                    self._set(action, source, False, now, "gamepad")
+
+    def _set(self, action: str, source: tuple, down: bool, now: int, device: str) -> None:
+        sources = self._held.setdefault(action, set())
+        was_held = bool(sources)
+        if down:
+            sources.add(source)
+        else:
+            sources.discard(source)
+        if was_held != bool(sources):
+            self._queue.append(InputEvent(action, down, now, device))
+
+    def _set_directions(self, source: tuple, dirs: set[str], now: int) -> None:
+        old = self._directions.get(source, frozenset())
+        for action in old - dirs:
+            self._set(action, source, False, now, "gamepad")
+        for action in dirs - old:
+            self._set(action, source, True, now, "gamepad")
+        self._directions[source] = frozenset(dirs)
+
+    def release_all(self) -> None:
+        """Relâche toutes les actions (perte de focus, changement de scène)."""
+        self._held.clear()
+        self._directions.clear()
+
+    # ————————————————————
+    # Ticks et latence
+    # ————————————————————
+
+    def tick(self) -> ActionState:
+        """Vide la file et retourne les actions du tick de simulation."""
+        events = tuple(self._queue)
+        self._queue.clear()
+        pressed = frozenset(e.action for e in events if e.down)
+        held = frozenset(a for a, sources in self._held.items() if sources)
+        first = min((e.time_ns for e in events if e.down), default=None)
+        if first is not None and self._tick_input_ns is None:
+            self._tick_input_ns = first
+        return ActionState(held, pressed, events)
+
+    def take_tick_input(self) -> int | None:
+        """Horodatage de la première pression non encore affichée, remis à zéro.
+
+        Pour la simulation threadée : l'horodatage voyage avec l'instantané
+        du tick et la latence est mesurée quand celui-ci est affiché.
+        """
+        first, self._tick_input_ns = self._tick_input_ns, None
+        return first
+
+    def frame_presented(self) -> None:
+        """À appeler juste après ``display.flip`` : mesure la latence du tick."""
+        if self._tick_input_ns is not None:
+            self.latency.record(time.perf_counter_ns() - self._tick_input_ns)
+            self._tick_input_ns = None
+
+
+class InputRecorder:
+    """Enregistre les actions de chaque tick, une ligne JSON par tick."""
+
+    def __init__(self, path: Path) -> None:
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, actions: ActionState) -> None:
+        record = {"held": sorted(actions.held), "pressed": sorted(actions.pressed)}
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def read_recording(path: Path) -> Iterator[ActionState]:
+    """Rejoue un enregistrement d'``InputRecorder`` tick par tick."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            record = json.loads(line)
+            yield ActionState(held=frozenset(record["held"]), pressed=frozenset(record["pressed"]))
@@ -0,0 +1,140 @@
+"""memory.py
+Comptabilité mémoire des ressources chargées.
+Chaque surface et chaque son est enregistré avec une catégorie (characters,
+enemies, level, ui, audio) et sa taille en octets. L'entrée disparaît d'elle-même
+quand l'objet est libéré, les totaux reflètent donc ce qui est réellement vivant.
+Un budget par catégorie déclenche un avertissement ou l'éviction des caches.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+import warnings
+import weakref
+import pygame
+from settings import MEMORY_BUDGET, MEMORY_POLICY
+
+CATEGORIES: tuple[str, ...] = ("characters", "enemies", "level", "ui", "vfx", "audio")
+
+T = TypeVar("T")
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Taille des pixels d'une surface : largeur × hauteur × octets par pixel."""
+    w, h = surface.get_size()
+    return w * h * surface.get_bytesize()
+
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """Taille des échantillons bruts d'un son au format du mixer."""
+    init = pygame.mixer.get_init()
+    if init is None:
+        return 0
+    freq, size, channels = init
+    return round(sound.get_length() * freq) * channels * abs(size) // 8
+
+
+@dataclass
+class Entry:
+    """Ressource suivie par le registre."""
+
+    name: str
+    category: str
+    nbytes: int
+    evict: Callable[[], None] | None = None
+
+
+class MemoryLedger:
+    """Registre des ressources vivantes, par catégorie."""
+
+    def __init__(self, budgets: dict[str, int | None] | None = None, policy: str = "warn") -> None:
+        self.budgets = dict(MEMORY_BUDGET if budgets is None else budgets)
+        self.policy = policy
+        self.entries: dict[int, Entry] = {}
+
+    def track(
+        self,
+        obj: T,
+        category: str,
+        name: str,
+        evict: Callable[[], None] | None = None,
+    ) -> T:
+        """Enregistre ``obj`` et le retourne.
+
+        ``evict`` est appelé si le budget est dépassé en mode « evict » : il doit
+        retirer l'objet de son cache (il sera rechargé à la demande).
+        """
+        key = id(obj)
+        if key in self.entries:
+            return obj
+        if isinstance(obj, pygame.Surface):
+            nbytes = surface_bytes(obj)
+        else:
+            nbytes = sound_bytes(obj)
+        self.entries[key] = Entry(name, category, nbytes, evict)
+        weakref.finalize(obj, self.entries.pop, key, None)
+        self._check_budget(category)
+        return obj
+
+    def _snapshot(self) -> list[Entry]:
+        # Copie atomique : un stage peut être chargé par un autre thread
+        # (stages.py) pendant qu'on parcourt le registre
+        return list(self.entries.values())
+
+    def totals(self) -> dict[str, int]:
+        """Octets par catégorie."""
+        totals = dict.fromkeys(CATEGORIES, 0)
+        for entry in self._snapshot():
+            totals[entry.category] = totals.get(entry.category, 0) + entry.nbytes
+        return totals
+
+    def total(self) -> int:
+        return sum(entry.nbytes for entry in self._snapshot())
+
+    def largest(self, count: int = 10, category: str | None = None) -> list[Entry]:
+        """Plus grosses ressources, éventuellement d'une seule catégorie."""
+        entries = [e for e in self._snapshot() if category is None or e.category == category]
+        return sorted(entries, key=lambda e: e.nbytes, reverse=True)[:count]
+
+    def report(self) -> str:
+        """Rapport texte : totaux, budgets et plus grosses ressources."""
+        lines = [f"{'catégorie':<12}{'Kio':>10}{'budget':>10}"]
+        for category, nbytes in self.totals().items():
+            budget = self.budgets.get(category)
+            budget_txt = "-" if budget is None else f"{budget // 1024}"
+            lines.append(f"{category:<12}{nbytes // 1024:>10}{budget_txt:>10}")
+        lines.append(f"{'total':<12}{self.total() // 1024:>10}")
+        lines.append("")
+        lines.append("plus grosses ressources :")
+        for entry in self.largest():
+            lines.append(f"  {entry.nbytes // 1024:>8} Kio  {entry.category:<11} {entry.name}")
+        return "\n".join(lines)
+
+    def _check_budget(self, category: str) -> None:
+        budget = self.budgets.get(category)
+        if budget is None:
+            return
+        used = self.totals()[category]
+        if used <= budget:
+            return
+        if self.policy == "evict":
+            # Les plus anciennes entrées évictables d'abord
+            for key, entry in list(self.entries.items()):
+                if used <= budget:
+                    return
+                if entry.category == category and entry.evict is not None:
+                    entry.evict()
+                    self.entries.pop(key, None)
+                    used -= entry.nbytes
+            if used <= budget:
+                return
+        warnings.warn(
+            f"budget mémoire « {category} » dépassé : {used // 1024} Kio > {budget // 1024} Kio",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+
+# Registre partagé par tout le jeu
+LEDGER = MemoryLedger(policy=MEMORY_POLICY)
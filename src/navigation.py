@@ -0,0 +1,218 @@
+"""navigation.py
+Graphe de navigation des ennemis, construit une fois au chargement du niveau.
+Les nœuds sont les segments où l'on peut marcher (sol entre deux murs, dessus
+des plateformes) ; les arêtes sont les déplacements possibles d'un segment à
+l'autre : marcher, se laisser tomber, sauter, grimper (échelles, escaliers).
+La table « prochaine arête » de chaque couple de segments est précalculée et
+sert de table de routage : suivre le joueur ne coûte par frame qu'une
+recherche de segment et une lecture de table.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+import pygame
+from settings import GRAVITY, GROUND_Y
+
+
+@dataclass
+class Span:
+    """Segment horizontal praticable à la hauteur ``y`` (bas des pieds)."""
+
+    id: int
+    left: int
+    right: int
+    y: int
+
+
+@dataclass
+class Edge:
+    """Déplacement d'un segment à un autre.
+
+    ``x`` est l'abscisse (centre de l'entité) où le déplacement commence et
+    ``land_x`` celle visée à l'arrivée.
+    """
+
+    kind: str  # "walk", "drop", "jump" ou "climb"
+    src: int
+    dst: int
+    x: int
+    land_x: int
+
+
+def _arc(jump_speed: float) -> list[int]:
+    """Hauteur atteinte (vers le haut positif) à chaque frame d'un saut.
+
+    Reproduit l'intégration des entités : vitesse entière tronquée, gravité
+    ajoutée après le déplacement.
+    """
+    heights = [0]
+    y = 0
+    vy = jump_speed
+    while y < GROUND_Y:
+        vy += GRAVITY
+        y += int(vy)
+        heights.append(-y)
+    return heights
+
+
+def _frames_to_reach(arc: list[int], dh: int) -> int | None:
+    """Première frame, en descente, où l'arc repasse sous la hauteur ``dh``."""
+    apex = max(range(len(arc)), key=arc.__getitem__)
+    if arc[apex] < dh:
+        return None
+    for t in range(apex, len(arc)):
+        if arc[t] <= dh:
+            return t
+    return None
+
+
+@dataclass
+class NavGraph:
+    """Graphe des segments praticables et tables de routage."""
+
+    spans: list[Span]
+    edges: list[Edge]
+    next_edge: list[list[Edge | None]] = field(init=False)
+    _by_y: dict[int, tuple[list[int], list[Span]]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        rows: dict[int, list[Span]] = {}
+        for span in self.spans:
+            rows.setdefault(span.y, []).append(span)
+        self._by_y = {}
+        for y, spans in rows.items():
+            spans.sort(key=lambda s: s.left)
+            self._by_y[y] = ([s.left for s in spans], spans)
+        self._build_tables()
+
+    def _build_tables(self) -> None:
+        """Parcours en largeur inverse depuis chaque destination."""
+        n = len(self.spans)
+        incoming: list[list[Edge]] = [[] for _ in range(n)]
+        for edge in self.edges:
+            incoming[edge.dst].append(edge)
+        self.next_edge = [[None] * n for _ in range(n)]
+        for dst in range(n):
+            seen = {dst}
+            queue = deque([dst])
+            while queue:
+                node = queue.popleft()
+                for edge in incoming[node]:
+                    if edge.src not in seen:
+                        seen.add(edge.src)
+                        self.next_edge[edge.src][dst] = edge
+                        queue.append(edge.src)
+
+    def span_at(self, x: int, bottom: int) -> Span | None:
+        """Segment sous des pieds posés en (``x``, ``bottom``)."""
+        row = self._by_y.get(bottom)
+        if row is None:
+            return None
+        lefts, spans = row
+        i = bisect_right(lefts, x) - 1
+        if i >= 0 and x <= spans[i].right:
+            return spans[i]
+        return None
+
+
+def build_nav_graph(
+    platforms: list[pygame.Rect],
+    ladders: list[pygame.Rect],
+    stairs: list[pygame.Rect],
+    walls: list[pygame.Rect],
+    level_width: int,
+    entity_width: int,
+    speed: float,
+    jump_speed: float,
+) -> NavGraph:
+    """Construit le graphe pour une entité de largeur et vitesses données."""
+    # Sol découpé par les murs
+    spans: list[Span] = []
+    x = 0
+    for wall in sorted(walls, key=lambda w: w.left):
+        if wall.left > x:
+            spans.append(Span(len(spans), x, wall.left, GROUND_Y))
+        x = max(x, wall.right)
+    if x < level_width:
+        spans.append(Span(len(spans), x, level_width, GROUND_Y))
+
+    # Dessus des plateformes, fusionnés quand ils se touchent
+    for plat in sorted(platforms, key=lambda p: (p.top, p.left)):
+        last = spans[-1]
+        if last.y == plat.top and plat.left <= last.right:
+            last.right = max(last.right, plat.right)
+        else:
+            spans.append(Span(len(spans), plat.left, plat.right, plat.top))
+
+    jump_arc = _arc(jump_speed)
+    fall_arc = _arc(0.0)
+    half = entity_width // 2
+    edges: list[Edge] = []
+
+    def inside(span: Span, x: int) -> int:
+        lo, hi = span.left + half, span.right - half
+        return (lo + hi) // 2 if lo > hi else max(lo, min(hi, x))
+
+    for a in spans:
+        for b in spans:
+            if a is b:
+                continue
+            dh = a.y - b.y  # > 0 : b est plus haut
+            gap = max(b.left - a.right, a.left - b.right, 0)
+            # Point de départ : bord de a le plus proche de b
+            if b.left >= a.right:
+                x0 = a.right
+            elif b.right <= a.left:
+                x0 = a.left
+            else:
+                x0 = (max(a.left, b.left) + min(a.right, b.right)) // 2
+
+            if dh == 0 and gap <= half:
+                edges.append(Edge("walk", a.id, b.id, x0, inside(b, x0)))
+            elif a.y == b.y == GROUND_Y:
+                # Sol séparé par un mur : le saut doit rester au-dessus du mur
+                # le temps de le franchir avec toute la largeur de l'entité
+                lo, hi = min(a.right, b.right), max(a.left, b.left)
+                wall_h = max((GROUND_Y - w.top for w in walls if w.left < hi and w.right > lo), default=0)
+                above = sum(1 for h in jump_arc if h > wall_h)
+                if above * speed >= gap + entity_width:
+                    edges.append(Edge("jump", a.id, b.id, inside(a, x0), inside(b, x0)))
+            elif dh < 0 and b.left <= a.right + half <= b.right:
+                # Se laisser tomber par le bord droit de a
+                edges.append(Edge("drop", a.id, b.id, a.right, a.right + half))
+            elif dh < 0 and b.left <= a.left - half <= b.right:
+                edges.append(Edge("drop", a.id, b.id, a.left, a.left - half))
+            elif dh < 0 and gap and gap <= speed * (_frames_to_reach(fall_arc, dh) or 0) + half:
+                edges.append(Edge("drop", a.id, b.id, x0, inside(b, x0)))
+            else:
+                t = _frames_to_reach(jump_arc, dh)
+                if t is not None and gap <= speed * t + half:
+                    edges.append(Edge("jump", a.id, b.id, inside(a, x0), inside(b, x0)))
+
+    # Échelles : relient les segments traversés par leur axe
+    climbs: list[tuple[pygame.Rect, list[Span]]] = []
+    for ladder in ladders:
+        touched = [
+            s for s in spans
+            if ladder.top - 1 <= s.y <= ladder.bottom + 1 and s.left <= ladder.centerx <= s.right
+        ]
+        climbs.append((ladder, touched))
+    # Escaliers : relient les segments qui arrivent à l'une de leurs marches
+    for stair in stairs:
+        touched = [
+            s for s in spans
+            if stair.top - 1 <= s.y <= stair.bottom + 1
+            and s.left <= stair.right + half and s.right >= stair.left - half
+        ]
+        climbs.append((stair, touched))
+    for rect, touched in climbs:
+        for a in touched:
+            for b in touched:
+                if a is not b:
+                    land_x = max(b.left, min(b.right, rect.centerx))
+                    edges.append(Edge("climb", a.id, b.id, rect.centerx, land_x))
+
+    return NavGraph(spans, edges)
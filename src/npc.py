@@ -2,19 +2,63 @@ from dataclasses import dataclass
 from pathlib import Path
 import pygame
 from settings import PLAYER_SCALE
+from assets import load_image
+from renderqueue import LAYERS, RenderQueue
+from spritesheet import SpriteSet
+
+# Animation name, frame index and facing of a displayed character
+Pose = tuple[str, int, bool]
+
 
 @dataclass
 class NPC:
-    """Simple non-playable character displayed in the level."""
+    """Simple non-playable character displayed in the level.
+
+    ``pos`` is the midbottom of the sprite.
+    """
 
     pos: tuple[int, int]
-    image_path: Path
+    image: pygame.Surface
 
-    def __post_init__(self) -> None:
-        img = pygame.image.load(str(self.image_path)).convert_alpha()
+    @classmethod
+    def load(cls, pos: tuple[int, int], image_path: Path) -> "NPC":
+        """NPC showing a single image, scaled like the characters."""
+        img = load_image(image_path)
         scale = int(img.get_width() * PLAYER_SCALE)
-        self.image = pygame.transform.scale(img, (scale, scale))
-        self.rect = self.image.get_rect(midbottom=self.pos)
+        return cls(pos, pygame.transform.scale(img, (scale, scale)))
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self.image.get_rect(midbottom=self.pos)
+
+    def draw(self, queue: RenderQueue) -> None:
+        queue.submit(self.image, self.rect.topleft, LAYERS["entities"])
+
+
+@dataclass
+class Follower(NPC):
+    """Party member replaying the leader's trail ``delay`` steps behind.
+
+    It has no physics of its own: position and pose come from the trail,
+    the pose being shown with the follower's own sprites. An animation the
+    character lacks falls back to its standing frame.
+    """
+
+    sprites: SpriteSet | None = None
+    delay: int = 0
+    pose: Pose = ("stand", 0, False)
+
+    def show(self, pose: Pose) -> None:
+        """Switch to ``pose`` (no-op if already shown)."""
+        if pose == self.pose:
+            return
+        self.pose = pose
+        anim, frame, facing_left = pose
+        frames = self.sprites.animations.get(anim) or self.sprites.animations["stand"]
+        image = frames[frame % len(frames)]
+        self.image = self.sprites.flipped[id(image)] if facing_left else image
 
-    def draw(self, surface: pygame.Surface, offset_x: int = 0) -> None:
-        surface.blit(self.image, self.rect.move(-offset_x, 0))
+    @property
+    def rect(self) -> pygame.Rect:
+        # Anchored on the frame's pivot, like the player
+        return self.sprites.rect(self.image, self.pos)
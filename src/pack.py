@@ -0,0 +1,287 @@
+"""pack.py
+Paquet d'assets : toutes les images, sons et descripteurs dans un seul fichier.
+
+Format : en-tête ``MAGIC`` + longueur de l'index (``HEADER``), index JSON
+``{nom: [position, taille, crc32]}`` puis les données, chaque entrée alignée
+sur ``ALIGN`` octets. Les noms sont les chemins relatifs au dossier
+``assets/`` (``son/kick1.wav``). Le jeu ouvre le paquet une seule fois avec
+``mmap`` et lit chaque entrée à travers une vue mémoire, sans copie
+intermédiaire du fichier (``assets.open_asset``) ; sans paquet, les assets
+sont lus un par un sur le disque.
+
+La construction vérifie que chaque asset référencé par le code et les niveaux
+existe : un chemin cassé après un renommage est signalé à ce moment-là, pas
+au lancement du jeu.
+
+Depuis le dossier ``src/`` :
+``python pack.py build`` construit ``assets.pack`` (code de sortie 1 si un
+asset obligatoire manque) ; ``python pack.py check`` vérifie les références
+et, s'il existe, que le paquet est complet et intact.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import io
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+import zlib
+
+from settings import ASSETS_DIR, ASSETS_PACK, MUSIC_FILE, STAGE_FILES
+
+MAGIC = b"47RPACK1"
+HEADER = struct.Struct("<8sI")  # signature, taille de l'index en octets
+ALIGN = 16
+
+
+class PackError(Exception):
+    """Paquet absent, illisible ou incohérent."""
+
+
+@dataclass(frozen=True)
+class PackEntry:
+    offset: int
+    size: int
+    crc: int
+
+
+def asset_name(path: Path | str) -> str | None:
+    """Nom d'entrée d'un chemin d'asset (absolu ou relatif à ``assets/``), ou None."""
+    path = ASSETS_DIR / Path(path)
+    try:
+        return path.resolve().relative_to(ASSETS_DIR.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+class EntryReader(io.RawIOBase):
+    """Fichier en lecture seule sur une entrée du paquet.
+
+    Les lectures copient directement de la projection mémoire vers le tampon
+    de l'appelant (pygame / SDL).
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = max(0, min(len(buffer), len(self._view) - self._pos))
+        buffer[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = (0, self._pos, len(self._view))[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetPack:
+    """Paquet ouvert et projeté en mémoire."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # fichier vide
+                raise PackError(f"{self.path} : paquet vide") from None
+        self._view = memoryview(self._map)
+        if len(self._view) < HEADER.size:
+            raise PackError(f"{self.path} : en-tête tronqué")
+        magic, index_size = HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            raise PackError(f"{self.path} : signature inconnue {magic!r}")
+        try:
+            index = json.loads(bytes(self._view[HEADER.size : HEADER.size + index_size]))
+        except ValueError as exc:
+            raise PackError(f"{self.path} : index illisible ({exc})") from None
+        self.entries = {name: PackEntry(*entry) for name, entry in index.items()}
+        for name, entry in self.entries.items():
+            if entry.offset + entry.size > len(self._view):
+                raise PackError(f"{self.path} : {name} dépasse la fin du paquet")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def view(self, name: str) -> memoryview:
+        entry = self.entries[name]
+        return self._view[entry.offset : entry.offset + entry.size]
+
+    def open(self, name: str) -> EntryReader:
+        return EntryReader(self.view(name))
+
+    def corrupted(self) -> list[str]:
+        """Entrées dont le contenu ne correspond plus à leur crc32."""
+        return [name for name, entry in self.entries.items() if zlib.crc32(self.view(name)) != entry.crc]
+
+
+def build_pack(assets_dir: Path = ASSETS_DIR, output: Path = ASSETS_PACK) -> AssetPack:
+    """Écrit le paquet de tous les fichiers de ``assets_dir`` et le retourne ouvert.
+
+    Le fichier est écrit à côté puis renommé : un jeu qui a encore l'ancien
+    paquet ouvert n'est pas affecté.
+    """
+    files = sorted(p for p in Path(assets_dir).rglob("*") if p.is_file())
+    names = [p.relative_to(assets_dir).as_posix() for p in files]
+    index = {name: [0, p.stat().st_size, zlib.crc32(p.read_bytes())] for name, p in zip(names, files)}
+    # La taille de l'index décale les données, dont les positions changent
+    # la taille de l'index : on recommence jusqu'à stabilité
+    raw = b""
+    while True:
+        offset = HEADER.size + len(raw)
+        for entry in index.values():
+            offset += -offset % ALIGN
+            entry[0] = offset
+            offset += entry[1]
+        encoded = json.dumps(index, separators=(",", ":")).encode()
+        stable = len(encoded) == len(raw)
+        raw = encoded
+        if stable:
+            break
+
+    output = Path(output)
+    tmp = output.with_name(output.name + ".tmp")
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, len(raw)))
+        out.write(raw)
+        for name, path in zip(names, files):
+            out.write(b"\0" * (index[name][0] - out.tell()))
+            out.write(path.read_bytes())
+    os.replace(tmp, output)
+    return AssetPack(output)
+
+
+def _sprite_images(descriptor: Path) -> list[Path]:
+    data = json.loads(descriptor.read_text(encoding="utf-8"))
+    images = set()
+    for spec in data["animations"].values():
+        if "image" in spec:
+            images.add(spec["image"])
+        images.update(frame["image"] for frame in spec["frames"] if "image" in frame)
+    return [descriptor.parent / name for name in sorted(images)]
+
+
+def referenced_assets() -> dict[Path, bool]:
+    """Assets utilisés par le code et les niveaux, et s'ils sont obligatoires.
+
+    La musique est facultative : le jeu démarre sans (``Game.enter_stage``).
+    """
+    import settings
+    from background import DEFAULT_LAYERS
+    from characters import CHARACTERS
+    from enemy import ENEMY_TYPES
+
+    refs: dict[Path, bool] = {}
+
+    def add(path: Path | str, required: bool = True) -> None:
+        path = ASSETS_DIR / Path(path)
+        refs[path] = refs.get(path, False) or required
+
+    for value in vars(settings).values():
+        if isinstance(value, Path) and value.suffix and asset_name(value) is not None:
+            add(value, value != MUSIC_FILE)
+    for spec in ENEMY_TYPES.values():
+        for key in ("stand", "attack", "hurt_sound"):
+            if spec.get(key) is not None:
+                add(spec[key])
+    for layer in DEFAULT_LAYERS:
+        for name in layer["images"]:
+            add(name)
+    for info in CHARACTERS.values():
+        add(info["sprites"])
+        if Path(info["sprites"]).is_file():
+            for image in _sprite_images(Path(info["sprites"])):
+                add(image)
+    for level in STAGE_FILES:
+        data = json.loads(Path(level).read_text(encoding="utf-8"))
+        for layer in data.get("background") or []:
+            for name in layer["images"]:
+                add(name)
+        for prop in data.get("props") or []:
+            add(prop["image"])
+        if "music" in data:
+            add(data["music"], required=False)
+    return refs
+
+
+def missing_assets(available: set[str] | None = None) -> list[tuple[Path, bool]]:
+    """Références introuvables (sur le disque, ou dans ``available`` si donné)."""
+    missing = []
+    for path, required in sorted(referenced_assets().items()):
+        name = asset_name(path)
+        if name is None:
+            found = False  # hors du dossier assets/ : impossible à empaqueter
+        elif available is None:
+            found = path.is_file()
+        else:
+            found = name in available
+        if not found:
+            missing.append((path, required))
+    return missing
+
+
+def _report(missing: list[tuple[Path, bool]]) -> bool:
+    """Affiche les assets manquants ; vrai si aucun n'est obligatoire."""
+    for path, required in missing:
+        label = "MANQUANT" if required else "absent (facultatif)"
+        print(f"  {label} : {path}")
+    return not any(required for _, required in missing)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Paquet d'assets de 47 Ronins Chats")
+    parser.add_argument("command", choices=("build", "check"))
+    parser.add_argument("--output", type=Path, default=ASSETS_PACK, help="fichier du paquet")
+    args = parser.parse_args(argv)
+
+    print("Références des assets :")
+    ok = _report(missing_assets())
+    if args.command == "build":
+        if not ok:
+            print("Paquet non construit : des assets obligatoires manquent.")
+            return 1
+        pack = build_pack(output=args.output)
+        size = pack.path.stat().st_size
+        print(f"{pack.path} : {len(pack.entries)} entrées, {size / 2**20:.1f} Mio")
+        return 0
+
+    if args.output.is_file():
+        try:
+            pack = AssetPack(args.output)
+        except PackError as exc:
+            print(exc)
+            return 1
+        print(f"Paquet {pack.path} :")
+        ok = _report(missing_assets(set(pack.entries))) and ok
+        for name in pack.corrupted():
+            print(f"  CORROMPU : {name}")
+            ok = False
+        stale = [
+            name for name, entry in pack.entries.items()
+            if not (ASSETS_DIR / name).is_file() or (ASSETS_DIR / name).stat().st_size != entry.size
+        ]
+        for name in stale:
+            print(f"  différent du disque : {name} (relancer build)")
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
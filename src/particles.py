@@ -0,0 +1,167 @@
+"""particles.py
+Effets visuels à base de particules : poussière à l'atterrissage, étincelles et
+éclairs d'impact. Les particules vivent dans des tableaux préalloués (une
+colonne par attribut, ``array`` de la bibliothèque standard) et les particules
+vivantes restent contiguës : une particule morte est remplacée par la dernière.
+La mise à jour est une seule boucle sur ces colonnes ; au rendu, toutes les
+particules partent en un seul lot dans la file de rendu (un appel
+``Surface.fblits``), avec des sprites précalculés une fois pour toutes.
+"""
+
+from __future__ import annotations
+
+from array import array
+import math
+import random
+import pygame
+
+from settings import PARTICLE_CAPACITY, PARTICLE_DENSITY
+from assets import finalize
+from renderqueue import LAYERS, RenderQueue
+
+# Types de particules : (durée de vie en frames, gravité, nombre d'images)
+DUST, SPARK, FLASH = 0, 1, 2
+KINDS: tuple[tuple[int, float, int], ...] = (
+    (18, -0.02, 4),  # poussière : monte doucement
+    (14, 0.25, 4),   # étincelle : retombe
+    (6, 0.0, 3),     # éclair : immobile, bref
+)
+
+# Sprites partagés par tous les systèmes : [type][image], du plus jeune au plus vieux
+_SPRITES: list[list[pygame.Surface]] = []
+
+
+def _disc(radius: int, colour: tuple[int, int, int], alpha: int = 255) -> pygame.Surface:
+    size = radius * 2 + 1
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*colour, alpha), (radius, radius), radius)
+    return surf
+
+
+def particle_sprites() -> list[list[pygame.Surface]]:
+    """Crée (au premier appel) les images de chaque type de particule.
+
+    Poussière et étincelles sont à alpha binaire et passent donc en colorkey
+    RLE ; seul l'éclair garde un canal alpha.
+    """
+    if not _SPRITES:
+        dust = [_disc(r, c) for r, c in ((3, (200, 190, 170)), (2, (180, 170, 150)), (2, (150, 140, 125)), (1, (120, 110, 100)))]
+        spark = []
+        for colour in ((255, 255, 200), (255, 220, 80), (255, 140, 40), (190, 60, 20)):
+            surf = pygame.Surface((2, 2))
+            surf.fill(colour)
+            spark.append(surf)
+        flash = [_disc(r, (255, 255, 255), a) for r, a in ((7, 220), (5, 150), (3, 90))]
+        for kind, frames in enumerate((dust, spark, flash)):
+            _SPRITES.append([finalize(img, "vfx", f"particle{kind}/{i}") for i, img in enumerate(frames)])
+    return _SPRITES
+
+
+class ParticleSystem:
+    """Réserve de ``capacity`` particules, mises à jour et dessinées par lot."""
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, density: float = PARTICLE_DENSITY) -> None:
+        self.capacity = capacity
+        # Multiplicateur du nombre de particules émises (0 désactive les effets)
+        self.density = density
+        self.count = 0
+        self.x = array("f", bytes(4 * capacity))
+        self.y = array("f", bytes(4 * capacity))
+        self.vx = array("f", bytes(4 * capacity))
+        self.vy = array("f", bytes(4 * capacity))
+        self.life = array("h", bytes(2 * capacity))
+        self.kind = array("B", bytes(capacity))
+        self.sprites = particle_sprites()
+        # Image à afficher pour (type, vie restante), calculée une fois
+        self._frame_for: list[list[pygame.Surface]] = []
+        for k, (max_life, _, n_frames) in enumerate(KINDS):
+            frames = self.sprites[k]
+            self._frame_for.append(
+                [frames[min(n_frames - 1, (max_life - life) * n_frames // max_life)] for life in range(max_life + 1)]
+            )
+        # Demi-taille de chaque image pour centrer le blit
+        self._half = {id(img): (img.get_width() // 2, img.get_height() // 2) for fr in self.sprites for img in fr}
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def emit(
+        self,
+        kind: int,
+        x: float,
+        y: float,
+        n: int,
+        speed: float,
+        angle: float = -math.pi / 2,
+        spread: float = math.pi,
+    ) -> None:
+        """Émet jusqu'à ``n × density`` particules autour de la direction ``angle``."""
+        n = int(n * self.density + 0.5)
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return
+        max_life = KINDS[kind][0]
+        i = self.count
+        rnd = random.random
+        for _ in range(n):
+            a = angle + (rnd() - 0.5) * spread
+            s = speed * (0.4 + 0.6 * rnd())
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = math.cos(a) * s
+            self.vy[i] = math.sin(a) * s
+            self.life[i] = max_life - int(rnd() * max_life * 0.3)
+            self.kind[i] = kind
+            i += 1
+        self.count = i
+
+    def dust(self, x: float, y: float) -> None:
+        """Petit nuage de poussière aux pieds d'un personnage qui atterrit."""
+        self.emit(DUST, x, y - 2, 10, 1.2, -math.pi / 2, math.pi * 0.9)
+
+    def hit(self, x: float, y: float, from_left: bool) -> None:
+        """Éclair et gerbe d'étincelles à un point d'impact."""
+        self.emit(FLASH, x, y, 1, 0.0)
+        self.emit(SPARK, x, y, 14, 3.0, 0.0 if from_left else math.pi, math.pi * 0.8)
+
+    def update(self) -> None:
+        """Avance toutes les particules d'une frame et retire les mortes."""
+        x, y, vx, vy, life, kind = self.x, self.y, self.vx, self.vy, self.life, self.kind
+        gravity = [g for _, g, _ in KINDS]
+        i = 0
+        n = self.count
+        while i < n:
+            left = life[i] - 1
+            if left <= 0:
+                # Remplace par la dernière particule vivante
+                n -= 1
+                x[i] = x[n]
+                y[i] = y[n]
+                vx[i] = vx[n]
+                vy[i] = vy[n]
+                life[i] = life[n]
+                kind[i] = kind[n]
+                continue
+            life[i] = left
+            vy[i] += gravity[kind[i]]
+            x[i] += vx[i]
+            y[i] += vy[i]
+            i += 1
+        self.count = n
+
+    def draw(self, queue: RenderQueue) -> None:
+        """Ajoute toutes les particules à la couche « effects » en un seul lot."""
+        n = self.count
+        if not n:
+            return
+        frame_for = self._frame_for
+        half = self._half
+        offset_x = queue.camera_x
+        x, y, life, kind = self.x, self.y, self.life, self.kind
+        batch = []
+        append = batch.append
+        for i in range(n):
+            img = frame_for[kind[i]][life[i]]
+            hw, hh = half[id(img)]
+            append((img, (int(x[i]) - offset_x - hw, int(y[i]) - hh)))
+        queue.extend(batch, LAYERS["effects"])
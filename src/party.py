@@ -0,0 +1,123 @@
+"""party.py
+Ronins de la partie non contrôlés : ils suivent le meneur à la file.
+
+Pas de physique ni de recherche de chemin : le meneur laisse derrière lui une
+trace (``Trail``), un tampon circulaire de taille fixe de ses dernières
+positions et poses, et chaque suiveur rejoue cette trace avec un retard
+proportionnel à sa place dans la file. La trace n'avance que quand le meneur
+se déplace : à l'arrêt, la file s'arrête derrière lui au lieu de le
+rejoindre, et les suiveurs passent à leur image de repos. Chaque pas note si
+le meneur avait pied (sol ou échelle) ; tant qu'un suiveur rejoue un pas en
+l'air, la trace continue d'avancer pour qu'il finisse son saut.
+
+Le coût par suiveur se limite à une lecture dans la trace. Pour tenir une
+file de 47 ronins, ceux qui sont loin du meneur ne changent de pose qu'un
+tick sur ``FOLLOWER_FAR_INTERVAL`` (leur position suit toujours la trace), et
+toute la file est déposée dans la file de rendu en un seul lot.
+"""
+
+from __future__ import annotations
+
+from settings import FOLLOW_SPACING, FOLLOWER_FAR_INTERVAL, FOLLOWER_NEAR_DISTANCE
+from npc import Follower, Pose
+from player import Player
+from renderqueue import LAYERS, RenderQueue
+
+
+class Trail:
+    """Tampon circulaire des ``capacity`` derniers pas du meneur."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self.x = [0] * self.capacity
+        self.y = [0] * self.capacity
+        self.poses: list[Pose] = [("stand", 0, False)] * self.capacity
+        self.grounded = [True] * self.capacity
+        self.head = 0
+
+    def reset(self, pos: tuple[int, int], pose: Pose) -> None:
+        """Toute la trace au point ``pos`` : la file repart groupée."""
+        self.x[:] = [pos[0]] * self.capacity
+        self.y[:] = [pos[1]] * self.capacity
+        self.poses[:] = [pose] * self.capacity
+        self.grounded[:] = [True] * self.capacity
+
+    def push(self, pos: tuple[int, int], pose: Pose, grounded: bool = True) -> None:
+        head = (self.head + 1) % self.capacity
+        self.x[head], self.y[head] = pos
+        self.poses[head] = pose
+        self.grounded[head] = grounded
+        self.head = head
+
+    def last(self) -> tuple[int, int]:
+        return self.x[self.head], self.y[self.head]
+
+    def index(self, delay: int) -> int:
+        """Case du pas d'il y a ``delay`` pas (borné à la capacité)."""
+        return (self.head - min(delay, self.capacity - 1)) % self.capacity
+
+    def at(self, delay: int) -> tuple[int, int, Pose]:
+        i = self.index(delay)
+        return self.x[i], self.y[i], self.poses[i]
+
+
+class Party:
+    """File des suiveurs derrière le personnage contrôlé."""
+
+    def __init__(self, players: list[Player], spacing: int = FOLLOW_SPACING) -> None:
+        self.players = players
+        self.spacing = spacing
+        self.trail = Trail((len(players) - 1) * spacing + 1)
+        self.followers: list[Follower] = []
+        self._leader: Player | None = None
+        self._members: list[Player] = []
+
+    def regroup(self, leader: Player) -> None:
+        """Refait la file derrière ``leader`` : les ronins vivants, dans l'ordre de la partie."""
+        self._leader = leader
+        # Par identité : ``Player`` est une dataclass, ``==`` compare les champs
+        start = next(i for i, p in enumerate(self.players) if p is leader)
+        order = self.players[start + 1 :] + self.players[:start]
+        alive = self._members = [p for p in order if p.health > 0]
+        self.followers = []
+        for rank, member in enumerate(alive, 1):
+            x, y, pose = self.trail.at(rank * self.spacing)
+            follower = Follower((x, y), member.images["stand"], sprites=member.sprites, delay=rank * self.spacing)
+            follower.show(pose)
+            self.followers.append(follower)
+
+    def reset(self, leader: Player) -> None:
+        """Regroupe toute la file sur ``leader`` (entrée dans un stage)."""
+        self.trail.reset(leader.hitbox.midbottom, leader.pose())
+        self.regroup(leader)
+
+    def update(self, leader: Player, tick: int) -> None:
+        """Avance la trace si le meneur a bougé, puis place les suiveurs."""
+        if leader is not self._leader or any(p.health <= 0 for p in self._members):
+            self.regroup(leader)
+        trail = self.trail
+        pos = leader.hitbox.midbottom
+        moved = pos != trail.last()
+        if not moved:
+            # Meneur arrêté : on avance encore si un suiveur est en plein saut
+            grounded = trail.grounded
+            moved = not all(grounded[trail.index(f.delay)] for f in self.followers)
+        if moved:
+            trail.push(pos, leader.pose(), leader.on_ground or leader.on_ladder)
+        for i, follower in enumerate(self.followers):
+            x, y, pose = trail.at(follower.delay)
+            follower.pos = (x, y)
+            if abs(x - pos[0]) > FOLLOWER_NEAR_DISTANCE and (tick + i) % FOLLOWER_FAR_INTERVAL:
+                continue
+            # Meneur à l'arrêt : la file l'attend au repos
+            follower.show(pose if moved else ("stand", 0, pose[2]))
+
+    def draw(self, queue: RenderQueue) -> None:
+        """Dépose toute la file en un seul lot, derrière le joueur."""
+        offset_x = queue.camera_x
+        batch = []
+        append = batch.append
+        for follower in self.followers:
+            rect = follower.rect
+            append((follower.image, (rect.x - offset_x, rect.y)))
+        queue.extend(batch, LAYERS["entities"])
@@ -0,0 +1,68 @@
+"""pixelformat.py
+Passe d'optimisation du format des pixels, appliquée une fois au chargement.
+Le pixel art réduit n'a presque que des pixels totalement opaques ou totalement
+transparents : ces surfaces passent en colorkey RLE au format de l'écran, les
+surfaces sans transparence en simple ``convert()``. Seules les surfaces ayant de
+vraies demi-transparences gardent le mélange alpha par pixel.
+"""
+
+from __future__ import annotations
+
+import pygame
+from settings import OPTIMISE_PIXEL_FORMAT
+
+# Couleurs candidates pour la transparence, la première absente du sprite est prise
+KEY_COLOURS: tuple[tuple[int, int, int], ...] = (
+    (255, 0, 255),
+    (0, 255, 0),
+    (0, 255, 255),
+    (1, 2, 3),
+)
+
+# Le benchmark active l'enregistrement pour comparer avant/après :
+# (catégorie, surface d'origine, surface optimisée)
+RECORD: bool = False
+SAMPLES: list[tuple[str, pygame.Surface, pygame.Surface]] = []
+
+
+def classify(surface: pygame.Surface) -> str:
+    """Retourne « opaque », « binary » (alpha 0 ou 255) ou « blended »."""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return "opaque"
+    w, h = surface.get_size()
+    solid = pygame.mask.from_surface(surface, 254)  # alpha == 255
+    if solid.count() == w * h:
+        return "opaque"
+    visible = pygame.mask.from_surface(surface, 0)  # alpha > 0
+    if visible.count() == solid.count():
+        return "binary"
+    return "blended"
+
+
+def _free_colour(surface: pygame.Surface) -> tuple[int, int, int] | None:
+    """Couleur de transparence qu'aucun pixel opaque n'utilise."""
+    solid = pygame.mask.from_surface(surface, 254)
+    for colour in KEY_COLOURS:
+        same = pygame.mask.from_threshold(surface, colour, (1, 1, 1, 255))
+        if not same.overlap_area(solid, (0, 0)):
+            return colour
+    return None
+
+
+def optimise(surface: pygame.Surface, category: str = "") -> pygame.Surface:
+    """Convertit ``surface`` dans le format de blit le plus rapide possible."""
+    if not OPTIMISE_PIXEL_FORMAT or not surface.get_flags() & pygame.SRCALPHA:
+        return surface
+    kind = classify(surface)
+    if kind == "opaque":
+        result = surface.convert()
+    elif kind == "binary" and (key := _free_colour(surface)) is not None:
+        result = pygame.Surface(surface.get_size()).convert()
+        result.fill(key)
+        result.blit(surface, (0, 0))
+        result.set_colorkey(key, pygame.RLEACCEL)
+    else:
+        result = surface
+    if RECORD:
+        SAMPLES.append((category, surface, result))
+    return result
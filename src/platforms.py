@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 import pygame
 from settings import (
     PLATFORM_TILESET_IMG,
-    WINDOW_WIDTH,
-    WINDOW_HEIGHT,
+    LADDER_IMG,
+    STAIR_IMG,
+    WALL_IMG,
     PLAYER_SCALE,
     ASSETS_DIR,
 )
+from assets import ImageCache, finalize, load_image
+from renderqueue import LAYERS
 
 
 @dataclass
@@ -19,6 +23,52 @@ class Platform:
     image: pygame.Surface
 
 
+@dataclass
+class MovingPlatform(Platform):
+    """Platform travelling along a scripted path: lifts, sliding beams.
+
+    ``path`` lists the midbottom waypoints, visited in order at ``speed`` px
+    per tick with a ``wait``-tick pause at each one. A ``loop`` path goes
+    from its last waypoint straight back to the first; otherwise the
+    platform retraces its steps.
+    """
+
+    path: list[tuple[int, int]] = field(default_factory=list)
+    speed: float = 1.0
+    wait: int = 0
+    loop: bool = False
+
+    def __post_init__(self) -> None:
+        self.rect.midbottom = self.path[0]
+        self._pos = pygame.Vector2(self.path[0])
+        self._target = 1 % len(self.path)
+        self._step = 1
+        self._pause = self.wait
+
+    def step(self) -> tuple[int, int]:
+        """Advance one tick and return the whole-pixel ``(dx, dy)`` of ``rect``."""
+        if self._pause:
+            self._pause -= 1
+            return 0, 0
+        target = self.path[self._target]
+        self._pos.move_towards_ip(target, self.speed)
+        if self._pos == target:
+            self._pause = self.wait
+            self._next_target()
+        old_x, old_y = self.rect.midbottom
+        self.rect.midbottom = (round(self._pos.x), round(self._pos.y))
+        return self.rect.centerx - old_x, self.rect.bottom - old_y
+
+    def _next_target(self) -> None:
+        last = len(self.path) - 1
+        if self.loop:
+            self._target = (self._target + 1) % len(self.path)
+            return
+        if not 0 <= self._target + self._step <= last:
+            self._step = -self._step
+        self._target += self._step
+
+
 @dataclass
 class Ladder:
     """Climbable ladder allowing the player to reach higher platforms."""
@@ -29,7 +79,8 @@ class Ladder:
 
 @dataclass
 class Staircase:
-    """Decorative staircase used to reach a higher platform."""
+    """Staircase used to reach a higher platform, walkable through its
+    height profile (see terrain.py)."""
 
     rect: pygame.Rect
     image: pygame.Surface
@@ -43,9 +94,18 @@ class Wall:
     image: pygame.Surface
 
 
+@dataclass
+class Prop:
+    """Decorative sprite without collision, drawn on a configurable layer."""
+
+    rect: pygame.Rect
+    image: pygame.Surface
+    layer: int = LAYERS["foreground"]
+
+
 def load_platform_image() -> pygame.Surface:
     """Load and return the platform sprite."""
-    sheet = pygame.image.load(str(PLATFORM_TILESET_IMG)).convert_alpha()
+    sheet = load_image(PLATFORM_TILESET_IMG)
 
     # Extract a wider slice of the tileset to keep good quality when scaling
     # down.  The wooden platform graphics sit near the bottom of the sheet but
@@ -61,33 +121,28 @@ def load_platform_image() -> pygame.Surface:
     # consistency.
     w, h = img.get_size()
     img = pygame.transform.scale(img, (int(w * PLAYER_SCALE), int(h * PLAYER_SCALE)))
-    return img
+    return finalize(img, "level", "platform")
 
 
 def load_ladder_image() -> pygame.Surface:
     """Load and scale the ladder sprite."""
-    # The asset was renamed from "Echelle.png" to "Echelle_corde.png" in the
-    # repository.  Update the path accordingly to avoid a FileNotFoundError.
-    path = ASSETS_DIR / "niveaux" / "Echelle_corde.png"
-    img = pygame.image.load(str(path)).convert_alpha()
+    img = load_image(LADDER_IMG)
     w, h = img.get_size()
     img = pygame.transform.scale(img, (int(w * PLAYER_SCALE), int(h * PLAYER_SCALE)))
-    return img
+    return finalize(img, "level", LADDER_IMG.stem)
 
 
 def load_stair_image() -> pygame.Surface:
     """Load and scale the wooden staircase sprite."""
-    path = ASSETS_DIR / "niveaux" / "Stair_wood_1.png"
-    img = pygame.image.load(str(path)).convert_alpha()
+    img = load_image(STAIR_IMG)
     w, h = img.get_size()
     img = pygame.transform.scale(img, (int(w * PLAYER_SCALE), int(h * PLAYER_SCALE)))
-    return img
+    return finalize(img, "level", STAIR_IMG.stem)
 
 
 def load_wall_image() -> pygame.Surface:
     """Load and scale the wooden wall sprite."""
-    path = ASSETS_DIR / "niveaux" / "Wall_wood_side.png"
-    img = pygame.image.load(str(path)).convert_alpha()
+    img = load_image(WALL_IMG)
     w, h = img.get_size()
     img = pygame.transform.scale(
         img,
@@ -96,95 +151,109 @@ def load_wall_image() -> pygame.Surface:
             int(h * PLAYER_SCALE * 0.5),
         ),
     )
-    return img
-
-
-def create_level_platforms() -> list[Platform]:
-    """Create all platforms for the level."""
-    img = load_platform_image()
-    platforms: list[Platform] = []
-
-    # --- Screen 1 ---
-    rect1 = img.get_rect(midbottom=(60, WINDOW_HEIGHT - 48))
-    platforms.append(Platform(rect1, img))
-
-    # Elevated walkway accessed via ladder
-    rect2 = img.get_rect(midbottom=(120, WINDOW_HEIGHT - 112))
-    platforms.append(Platform(rect2, img))
-    rect3 = img.get_rect(midbottom=(160, WINDOW_HEIGHT - 112))
-    platforms.append(Platform(rect3, img))
-
-    # --- Screen 2 --- (continuation of high path)
-    rect4 = img.get_rect(midbottom=(WINDOW_WIDTH + 40, WINDOW_HEIGHT - 112))
-    platforms.append(Platform(rect4, img))
-    rect5 = img.get_rect(midbottom=(WINDOW_WIDTH + 120, WINDOW_HEIGHT - 112))
-    platforms.append(Platform(rect5, img))
-
-    # Ground platform after a gap
-    rect6 = img.get_rect(midbottom=(WINDOW_WIDTH + 220, WINDOW_HEIGHT - 48))
-    platforms.append(Platform(rect6, img))
-
-    # --- Screen 3 --- staircase leads back up
-    rect7 = img.get_rect(midbottom=(2 * WINDOW_WIDTH + 80, WINDOW_HEIGHT - 96))
-    platforms.append(Platform(rect7, img))
-    rect8 = img.get_rect(midbottom=(2 * WINDOW_WIDTH + 160, WINDOW_HEIGHT - 96))
-    platforms.append(Platform(rect8, img))
-
-    # --- Screen 4 --- final high path
-    rect9 = img.get_rect(midbottom=(3 * WINDOW_WIDTH + 80, WINDOW_HEIGHT - 120))
-    platforms.append(Platform(rect9, img))
-    rect10 = img.get_rect(midbottom=(3 * WINDOW_WIDTH + 160, WINDOW_HEIGHT - 120))
-    platforms.append(Platform(rect10, img))
-
-    return platforms
-
-
-def create_level_ladders(platforms: list[Platform]) -> list[Ladder]:
-    """Create ladders for the level."""
-    img = load_ladder_image()
+    return finalize(img, "level", WALL_IMG.stem)
+
+
+def _cached(cache: ImageCache | None, key: str, load) -> pygame.Surface:
+    return load() if cache is None else cache.get(key, load)
+
+
+def _anchored(data: dict) -> tuple[int, int]:
+    """Midbottom position of a geometry entry: its ``x``/``y`` keys."""
+    return data["x"], data["y"]
+
+
+def create_level_platforms(platforms_data: list[dict], cache: ImageCache | None = None) -> list[Platform]:
+    """Create the level's platforms from its ``platforms`` list.
+
+    Each entry gives the ``x``/``y`` midbottom of one platform sprite.
+    """
+    img = _cached(cache, "platform", load_platform_image)
+    return [Platform(img.get_rect(midbottom=_anchored(d)), img) for d in platforms_data]
+
+
+def create_level_moving_platforms(
+    movers_data: list[dict],
+    cache: ImageCache | None = None,
+) -> list[MovingPlatform]:
+    """Create the level's ``moving_platforms``.
+
+    Each entry gives its ``path`` (list of ``[x, y]`` midbottom waypoints,
+    the first being the start) and optionally ``speed``, ``wait`` and
+    ``loop`` (see ``MovingPlatform``).
+    """
+    img = _cached(cache, "platform", load_platform_image)
+    return [
+        MovingPlatform(
+            img.get_rect(),
+            img,
+            path=[tuple(p) for p in d["path"]],
+            speed=float(d.get("speed", 1.0)),
+            wait=int(d.get("wait", 0)),
+            loop=bool(d.get("loop", False)),
+        )
+        for d in movers_data
+    ]
+
+
+def create_level_ladders(
+    ladders_data: list[dict],
+    platforms: list[Platform],
+    cache: ImageCache | None = None,
+) -> list[Ladder]:
+    """Create the level's ladders.
+
+    An entry either stands on top of a platform (``on``: its index in the
+    ``platforms`` list) or gives its own ``x``/``y`` midbottom.
+    """
+    img = _cached(cache, "ladder", load_ladder_image)
     ladders: list[Ladder] = []
-
-    if len(platforms) >= 10:
-        # Ladder at the start to reach the high path
-        start_high = platforms[1]
-        rect1 = img.get_rect(midbottom=(start_high.rect.centerx, start_high.rect.top))
-        ladders.append(Ladder(rect1, img))
-
-        # Ladder at the end to descend from the final platform
-        end_high = platforms[-1]
-        rect2 = img.get_rect(midbottom=(end_high.rect.centerx, end_high.rect.top))
-        ladders.append(Ladder(rect2, img))
-
+    for data in ladders_data:
+        if "on" in data:
+            plat = platforms[data["on"]].rect
+            pos = (plat.centerx, plat.top)
+        else:
+            pos = _anchored(data)
+        ladders.append(Ladder(img.get_rect(midbottom=pos), img))
     return ladders
 
 
-def create_level_stairs() -> list[Staircase]:
-    """Create the decorative staircase for the level."""
-    img = load_stair_image()
-    stairs: list[Staircase] = []
-
-    # First staircase used to leave the upper path
-    rect1 = img.get_rect(midbottom=(WINDOW_WIDTH + 160, WINDOW_HEIGHT))
-    stairs.append(Staircase(rect1, img))
-
-    # Second staircase bringing the player back up later in the level
-    rect2 = img.get_rect(midbottom=(2 * WINDOW_WIDTH + 40, WINDOW_HEIGHT))
-    stairs.append(Staircase(rect2, img))
-
-    return stairs
-
-
-def create_level_walls() -> list[Wall]:
-    """Create blocking walls for the level."""
-    img = load_wall_image()
-    walls: list[Wall] = []
-
-    # Wall at the start forcing ladder use
-    rect1 = img.get_rect(midbottom=(100, WINDOW_HEIGHT))
-    walls.append(Wall(rect1, img))
-
-    # Wall before the final ladder
-    rect2 = img.get_rect(midbottom=(3 * WINDOW_WIDTH + 120, WINDOW_HEIGHT))
-    walls.append(Wall(rect2, img))
-
-    return walls
+def create_level_stairs(stairs_data: list[dict], cache: ImageCache | None = None) -> list[Staircase]:
+    """Create the level's staircases (``x``/``y`` midbottom)."""
+    img = _cached(cache, "stairs", load_stair_image)
+    return [Staircase(img.get_rect(midbottom=_anchored(d)), img) for d in stairs_data]
+
+
+def create_level_walls(walls_data: list[dict], cache: ImageCache | None = None) -> list[Wall]:
+    """Create the level's blocking walls (``x``/``y`` midbottom)."""
+    img = _cached(cache, "wall", load_wall_image)
+    return [Wall(img.get_rect(midbottom=_anchored(d)), img) for d in walls_data]
+
+
+def load_props(props_data: list[dict] | None, cache: ImageCache | None = None) -> list[Prop]:
+    """Create the decorative props described by the level's ``props`` list.
+
+    Each prop takes an ``image`` (relative to the assets folder), an optional
+    ``crop`` region [x, y, w, h] of that image, an optional ``size`` [w, h],
+    its ``x``/``y`` top-left position and a ``layer`` name from
+    ``renderqueue.LAYERS`` ("foreground" by default).
+    """
+    if cache is None:
+        cache = ImageCache()
+    props: list[Prop] = []
+    for data in props_data or []:
+        crop = tuple(data["crop"]) if "crop" in data else None
+        size = tuple(data["size"]) if "size" in data else None
+
+        def load(data=data, crop=crop, size=size) -> pygame.Surface:
+            img = load_image(ASSETS_DIR / Path(data["image"]))
+            if crop:
+                img = img.subsurface(pygame.Rect(crop)).copy()
+            if size:
+                img = pygame.transform.scale(img, size)
+            return finalize(img, "level", Path(data["image"]).stem)
+
+        img = cache.get(("prop", data["image"], crop, size), load)
+        rect = img.get_rect(topleft=(data["x"], data["y"]))
+        props.append(Prop(rect, img, LAYERS[data.get("layer", "foreground")]))
+    return props
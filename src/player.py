@@ -14,10 +14,30 @@ from settings import (
     GRAVITY,
     JUMP_SPEED,
     WINDOW_HEIGHT,
-    PLAYER_SCALE,
     JUMP_SOUND_FILE,
     LANDING_TIME,
 )
+from collision import MaskBank
+from assets import load_sound
+from inputs import ActionState
+from renderqueue import LAYERS, RenderQueue
+from spritesheet import SpriteSet, load_sprite_set
+from terrain import HeightField
+
+# Animations d'une seule image, rangées dans ``Player.images``
+STILL_IMAGES: tuple[str, ...] = ("stand", "sit", "hurt")
+
+# Effets sonores par fichier, partagés par tous les personnages
+_SOUNDS: dict[Path, pygame.mixer.Sound] = {}
+
+
+def _shared_sound(path: Path) -> pygame.mixer.Sound:
+    """Un seul ``Sound`` par fichier, chargé au premier joueur qui l'utilise."""
+    sound = _SOUNDS.get(path)
+    if sound is None:
+        sound = _SOUNDS[path] = load_sound(path)
+    return sound
+
 
 @dataclass
 class Player:
@@ -29,6 +49,10 @@ class Player:
     facing_left: bool = False
     images: dict[str, pygame.Surface] | None = None
     animations: dict[str, list[pygame.Surface]] | None = None
+    sprites: SpriteSet | None = None
+    masks: MaskBank | None = None
+    flipped: dict[int, pygame.Surface] | None = None
+    poses: dict[int, tuple[str, int]] | None = None
     current_image: pygame.Surface | None = None
     frame_index: float = 0.0
     animation_speed: float = 0.2
@@ -38,6 +62,7 @@ class Player:
     invincible_time: int = 0
     invincible: bool = False
     landing_timer: int = 0
+    just_landed: bool = False
     on_ladder: bool = False
     jump_speed: float = JUMP_SPEED
 
@@ -47,7 +72,7 @@ class Player:
     def __init__(
         self,
         pos: tuple[int, int],
-        asset_paths: dict[str, Path],
+        sprite_sheet: Path,
         name: str = "player",
         jump_speed: float = JUMP_SPEED,
     ):
@@ -55,31 +80,26 @@ class Player:
 
         self.name = name
 
+        # Frames recadrées, pivots et versions retournées (spritesheet.py)
+        self.sprites = load_sprite_set(sprite_sheet, "characters", name)
         self.images = {}
-        if "stand" in asset_paths:
-            self.images["stand"] = pygame.image.load(
-                str(asset_paths["stand"])
-            ).convert_alpha()
-        if "sit" in asset_paths:
-            self.images["sit"] = pygame.image.load(
-                str(asset_paths["sit"])
-            ).convert_alpha()
-        if "hurt" in asset_paths:
-            self.images["hurt"] = pygame.image.load(
-                str(asset_paths["hurt"])
-            ).convert_alpha()
-
-        # Réduction des sprites fixes
-        for key, img in self.images.items():
-            w = int(img.get_width() * PLAYER_SCALE)
-            h = int(img.get_height() * PLAYER_SCALE)
-            self.images[key] = pygame.transform.scale(img, (w, h))
-
-        # Chargement des animations
         self.animations = {}
-        for key in ("walk", "jump", "attack", "kick", "jumpkick"):
-            if key in asset_paths:
-                self.animations[key] = self._load_frames(asset_paths[key])
+        for key, frames in self.sprites.animations.items():
+            if key in STILL_IMAGES:
+                self.images[key] = frames[0]
+            else:
+                self.animations[key] = frames
+
+        # Masques de collision construits une fois pour toutes, coupés au pivot
+        self.masks = MaskBank()
+        self.flipped = self.sprites.flipped
+        for frames in self.sprites.animations.values():
+            for img in frames:
+                self.masks.add(img, self.sprites.pivots[id(img)][0])
+        # Animation et rang de chaque frame, pour la rejouer sur les suiveurs
+        self.poses = {
+            id(img): (key, i) for key, frames in self.sprites.animations.items() for i, img in enumerate(frames)
+        }
 
         self.current_image = self.images["stand"]
         # Hitbox utilisée pour la physique, indépendante de la taille du sprite
@@ -87,7 +107,7 @@ class Player:
         self.vel = pygame.Vector2(0, 0)
         self.on_ground = False
         self.facing_left = False
-        self.jump_sound = pygame.mixer.Sound(str(JUMP_SOUND_FILE))
+        self.jump_sound = _shared_sound(JUMP_SOUND_FILE)
         self.jump_speed = jump_speed
         self.is_attacking = False
         self.attack_type = ""
@@ -96,51 +116,9 @@ class Player:
         self.invincible_time = 0
         self.invincible = False
         self.landing_timer = 0
+        self.just_landed = False
         self.on_ladder = False
 
-    def _load_frames(self, paths: Path | list[Path]) -> list[pygame.Surface]:
-        """Charge des frames depuis une feuille de sprites ou plusieurs images."""
-
-        if isinstance(paths, (list, tuple)):
-            frames: list[pygame.Surface] = []
-            for p in paths:
-                img = pygame.image.load(str(p)).convert_alpha()
-                scale = int(img.get_width() * PLAYER_SCALE)
-                frames.append(pygame.transform.scale(img, (scale, scale)))
-            return frames
-
-        sheet = pygame.image.load(str(paths)).convert_alpha()
-        w, h = sheet.get_width(), sheet.get_height()
-
-        if w >= h:
-            # frames disposées horizontalement
-            num_frames = max(1, round(w / h))
-            frame_w = w // num_frames
-            frame_h = h
-            regions = [
-                pygame.Rect(i * frame_w, 0, frame_w, frame_h)
-                for i in range(num_frames)
-            ]
-        else:
-            # frames disposées verticalement
-            num_frames = max(1, round(h / w))
-            frame_w = w
-            frame_h = h // num_frames
-            regions = [
-                pygame.Rect(0, i * frame_h, frame_w, frame_h)
-                for i in range(num_frames)
-            ]
-
-        frames: list[pygame.Surface] = []
-        for rect in regions:
-            region = sheet.subsurface(rect).copy()
-            w_scaled = int(rect.width * PLAYER_SCALE)
-            h_scaled = int(rect.height * PLAYER_SCALE)
-            region = pygame.transform.scale(region, (w_scaled, h_scaled))
-            frames.append(region)
-
-        return frames
-
     def _animate(self, state: str, loop: bool = True) -> None:
         """Met à jour l'image courante d'une animation."""
         frames = self.animations[state]
@@ -153,18 +131,37 @@ class Player:
                 self.is_attacking = False
         self.current_image = frames[int(self.frame_index)]
 
+    def displayed_image(self) -> pygame.Surface:
+        """Frame courante dans l'orientation affichée."""
+        if self.facing_left:
+            return self.flipped[id(self.current_image)]
+        return self.current_image
+
+    def pose(self) -> tuple[str, int, bool]:
+        """Animation, rang de la frame et orientation affichés (voir ``npc.Pose``)."""
+        anim, frame = self.poses.get(id(self.current_image), ("stand", 0))
+        return anim, frame, self.facing_left
+
+    def sprite_rect(self) -> pygame.Rect:
+        """Rectangle du sprite affiché, son pivot posé au milieu du bas de la hitbox."""
+        return self.sprites.rect(self.displayed_image(), self.hitbox.midbottom)
+
     def get_attack_rect(self) -> pygame.Rect | None:
-        """Retourne la zone d'attaque active."""
+        """Retourne le rectangle englobant la partie du sprite qui frappe."""
         if not self.is_attacking:
             return None
-        width = 16
-        height = self.hitbox.height // 2
-        y = self.hitbox.centery - height // 2
-        if self.facing_left:
-            x = self.hitbox.left - width
-        else:
-            x = self.hitbox.right
-        return pygame.Rect(x, y, width, height)
+        rect = self.masks.get(self.current_image, self.facing_left).strike_rect
+        if not rect.width:
+            return None
+        return rect.move(self.sprite_rect().topleft)
+
+    def get_attack_mask(self) -> pygame.mask.Mask:
+        """Masque de frappe associé à ``get_attack_rect``."""
+        return self.masks.get(self.current_image, self.facing_left).strike
+
+    def get_body_mask(self) -> pygame.mask.Mask:
+        """Silhouette de la frame courante, associée à ``sprite_rect``."""
+        return self.masks.get(self.current_image, self.facing_left).body
 
     def attack_damage(self) -> int:
         """Dégâts infligés par l'attaque courante."""
@@ -191,25 +188,37 @@ class Player:
     # Boucle d’update
     # ————————————————————
 
-    def handle_input(self, pressed: pygame.key.ScancodeWrapper, controls: dict[str, int]) -> None:
-        """Mise à jour de la vitesse horizontale en fonction des touches pressées."""
+    def handle_input(self, actions: ActionState) -> None:
+        """Mise à jour de la vitesse horizontale en fonction des actions maintenues.
+
+        Une action enfoncée puis relâchée dans le même tick (``pressed`` sans
+        ``held``) compte pour ce tick : un appui bref fait un pas ou un saut.
+        """
+        active = actions.held | actions.pressed
 
         self.vel.x = 0  # Annule l’inertie à chaque frame pour un contrôle précis
-        if pressed[controls.get("left", pygame.K_LEFT)]:
+        if "left" in active:
             self.vel.x = -PLAYER_SPEED
             self.facing_left = True
-        if pressed[controls.get("right", pygame.K_RIGHT)]:
+        if "right" in active:
             self.vel.x = PLAYER_SPEED
             self.facing_left = False
 
         # Saut : possible uniquement quand le joueur est au sol
-        if pressed[controls.get("jump", pygame.K_SPACE)] and self.on_ground:
+        if "jump" in active and self.on_ground:
             self.vel.y = self.jump_speed
             self.on_ground = False
             self.jump_phase = "start"
             self.frame_index = 0
             self.jump_sound.play()
 
+    def ride(self, dx: int, top: int) -> None:
+        """Suit une plateforme mobile : décalé de ``dx`` et posé sur ``top``."""
+        self.hitbox.x += dx
+        self.hitbox.bottom = top
+        self.vel.y = 0
+        self.on_ground = True
+
     def apply_gravity(self) -> None:
         """Applique la gravité lorsque le joueur est en l’air."""
         if not self.on_ground:
@@ -243,20 +252,21 @@ class Player:
 
     def update(
         self,
-        pressed: pygame.key.ScancodeWrapper,
+        actions: ActionState,
         platforms: list[pygame.Rect] | None = None,
         ladders: list[pygame.Rect] | None = None,
         walls: list[pygame.Rect] | None = None,
-        controls: dict[str, int] | None = None,
+        ground: HeightField | None = None,
     ) -> None:
-        """Met à jour la position et l’état du joueur pour la frame courante."""
+        """Met à jour la position et l’état du joueur pour la frame courante.
 
-        if controls is None:
-            controls = {}
+        ``ground`` rend les escaliers et les pentes marchables (terrain.py).
+        """
 
         prev_on_ground = self.on_ground
+        on_terrain = prev_on_ground and ground is not None and ground.stands_on(self.hitbox)
 
-        self.handle_input(pressed, controls)
+        self.handle_input(actions)
         if self.invincible_time > 0:
             self.invincible_time -= 1
 
@@ -271,6 +281,9 @@ class Player:
                         self.hitbox.right = wall.left
                     elif self.vel.x < 0:
                         self.hitbox.left = wall.right
+        # Marches et pentes : les pieds suivent le relief
+        if on_terrain:
+            ground.follow(self.hitbox)
 
         # Ladder check
         self.on_ladder = False
@@ -284,9 +297,9 @@ class Player:
 
         if self.on_ladder:
             self.hitbox.centerx = active_ladder.centerx
-            if pressed[controls.get("up", pygame.K_UP)]:
+            if "up" in actions.held:
                 self.vel.y = -PLAYER_SPEED
-            elif pressed[controls.get("down", pygame.K_DOWN)]:
+            elif "down" in actions.held:
                 self.vel.y = PLAYER_SPEED
             else:
                 self.vel.y = 0
@@ -302,6 +315,9 @@ class Player:
             self.hitbox.bottom = WINDOW_HEIGHT
             self.vel.y = 0
             self.on_ground = True
+        if ground is not None and not self.on_ground and ground.land(self.hitbox, int(self.vel.y)):
+            self.vel.y = 0
+            self.on_ground = True
 
         if platforms:
             for plat in platforms:
@@ -323,8 +339,8 @@ class Player:
                     self.on_ground = True
                     break
 
-        just_landed = not prev_on_ground and self.on_ground
-        if just_landed:
+        self.just_landed = not prev_on_ground and self.on_ground
+        if self.just_landed:
             self.is_attacking = False
             self.landing_timer = LANDING_TIME
             frames = self.animations.get("jump")
@@ -343,7 +359,7 @@ class Player:
             if state in self.animations:
                 if (
                     state == "jumpkick"
-                    and pressed[controls.get("kick", pygame.K_d)]
+                    and "kick" in actions.held
                     and int(self.frame_index) >= len(self.animations[state]) - 1
                 ):
                     self.current_image = self.animations[state][-1]
@@ -370,7 +386,7 @@ class Player:
             self.landing_timer -= 1
             if self.landing_timer <= 0:
                 self.jump_phase = "stand"
-        elif pressed[controls.get("down", pygame.K_DOWN)]:
+        elif "down" in actions.held:
             if "sit" in self.images:
                 self.current_image = self.images["sit"]
             self.frame_index = 0
@@ -389,21 +405,16 @@ class Player:
     # Rendu
     # ————————————————————
 
-    def draw(self, surface: pygame.Surface, offset_x: int = 0) -> None:
-        """Dessine le sprite actuel."""
-        image = self.current_image
-        if self.facing_left:
-            image = pygame.transform.flip(image, True, False)
-
-        img_rect = image.get_rect(midbottom=(self.hitbox.midbottom[0] - offset_x, self.hitbox.midbottom[1]))
-        surface.blit(image, img_rect)
+    def draw(self, queue: RenderQueue) -> None:
+        """Soumet le sprite actuel à la file de rendu."""
+        queue.submit(self.displayed_image(), self.sprite_rect().topleft, LAYERS["player"])
 
-    def draw_health(self, surface: pygame.Surface, heart: pygame.Surface) -> None:
-        """Dessine les coeurs de vie en haut à gauche sur deux lignes max."""
+    def draw_health(self, queue: RenderQueue, heart: pygame.Surface) -> None:
+        """Affiche les coeurs de vie en haut à gauche sur deux lignes max."""
         max_per_row = 10
         for i in range(self.health):
             row = i // max_per_row
             col = i % max_per_row
             x = 5 + col * (heart.get_width() + 2)
             y = 5 + row * (heart.get_height() + 2)
-            surface.blit(heart, (x, y))
+            queue.submit(heart, (x, y), LAYERS["hud"], screen=True)
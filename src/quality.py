@@ -0,0 +1,173 @@
+"""quality.py
+Profils de qualité (bas / moyen / haut) et fichier de configuration utilisateur.
+
+Un profil regroupe ce qui coûte au rendu et à la simulation : facteur
+d'agrandissement de la fenêtre, filtre de mise à l'échelle, densité et
+nombre maximal de particules, nombre de couches de parallaxe et fréquence de décision des
+ennemis. Le choix est mémorisé dans un fichier JSON ; au premier lancement,
+un court banc d'essai fait tourner la vraie boucle ``update`` / ``render`` /
+mise à l'échelle avec chaque profil, du plus beau au plus léger, et garde le
+premier qui tient la cadence visée.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field, fields, replace
+import json
+from pathlib import Path
+import time
+import pygame
+
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, UPSCALE, FPS, FULLSCREEN, CONFIG_FILE, PARTICLE_CAPACITY
+
+SCALE_FILTERS: tuple[str, ...] = ("nearest", "scale2x", "smooth")
+
+
+@dataclass(frozen=True)
+class QualityProfile:
+    """Réglages de coût d'un profil."""
+
+    name: str
+    upscale: int = UPSCALE
+    # « nearest » : pixels nets ; « scale2x » : lissage des diagonales propre
+    # au pixel art ; « smooth » : filtrage bilinéaire
+    scale_filter: str = "nearest"
+    particle_density: float = 1.0
+    # Réserve de particules : la boucle Python coûte 1 à 1,5 µs par particule
+    # vivante (mise à jour + rendu), soit 0,5 à 0,8 ms réserve pleine à 512
+    particle_capacity: int = PARTICLE_CAPACITY
+    parallax_layers: int | None = None  # None = toutes les couches du niveau
+    ai_interval: int = 1  # les ennemis revoient la position du joueur tous les N ticks
+
+    @property
+    def display_size(self) -> tuple[int, int]:
+        return WINDOW_WIDTH * self.upscale, WINDOW_HEIGHT * self.upscale
+
+
+# Du plus beau au plus léger : l'ordre d'essai du banc au démarrage
+PROFILES: dict[str, QualityProfile] = {
+    "high": QualityProfile("high"),
+    "medium": QualityProfile(
+        "medium", upscale=3, particle_density=0.5, particle_capacity=256, parallax_layers=2, ai_interval=2
+    ),
+    "low": QualityProfile(
+        "low", upscale=2, particle_density=0.25, particle_capacity=128, parallax_layers=1, ai_interval=3
+    ),
+}
+DEFAULT_PROFILE: str = "high"
+
+
+@dataclass
+class UserConfig:
+    """Contenu du fichier de configuration utilisateur.
+
+    ``overrides`` surcharge des champs du profil choisi, par exemple
+    ``{"scale_filter": "smooth"}``. ``benchmark`` garde les temps mesurés
+    (ms par frame, 95e centile) pour information.
+    """
+
+    quality: str | None = None  # None : profil à déterminer par le banc d'essai
+    fps: int = FPS
+    fullscreen: bool = FULLSCREEN
+    overrides: dict[str, object] = field(default_factory=dict)
+    benchmark: dict[str, float] = field(default_factory=dict)
+
+    def profile(self) -> QualityProfile:
+        base = PROFILES.get(self.quality or DEFAULT_PROFILE, PROFILES[DEFAULT_PROFILE])
+        known = {f.name for f in fields(QualityProfile)} - {"name"}
+        profile = replace(base, **{k: v for k, v in self.overrides.items() if k in known})
+        if profile.scale_filter not in SCALE_FILTERS:
+            profile = replace(profile, scale_filter="nearest")
+        return profile
+
+
+def load_config(path: Path = CONFIG_FILE) -> UserConfig:
+    """Lit la configuration ; fichier absent ou illisible = valeurs par défaut."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return UserConfig()
+    known = {f.name for f in fields(UserConfig)}
+    try:
+        return UserConfig(**{k: v for k, v in data.items() if k in known})
+    except TypeError:
+        return UserConfig()
+
+
+def save_config(config: UserConfig, path: Path = CONFIG_FILE) -> None:
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(config), indent=2) + "\n", encoding="utf-8")
+    except OSError as exc:
+        # Dossier personnel en lecture seule : on rejouera le banc au prochain lancement
+        print(f"Configuration non enregistrée ({exc})")
+
+
+def present(canvas: pygame.Surface, window: pygame.Surface, scale_filter: str) -> None:
+    """Agrandit ``canvas`` dans ``window`` avec le filtre du profil."""
+    size = window.get_size()
+    if scale_filter == "smooth":
+        pygame.transform.smoothscale(canvas, size, window)
+    elif scale_filter == "scale2x" and size[0] >= 2 * canvas.get_width():
+        doubled = pygame.transform.scale2x(canvas)
+        if doubled.get_size() == size:
+            window.blit(doubled, (0, 0))
+        else:
+            pygame.transform.scale(doubled, size, window)
+    else:
+        pygame.transform.scale(canvas, size, window)
+
+
+def _scripted_actions(frames: int):
+    """Parcours court et reproductible : marche, sauts et attaques."""
+    from inputs import ActionState
+
+    for i in range(frames):
+        held = {"right"} if (i // 90) % 4 != 3 else {"left"}
+        pressed = set()
+        if i % 45 == 0:
+            held.add("jump")
+            pressed.add("jump")
+        if i % 30 == 15:
+            pressed.add("attack")
+        yield ActionState(frozenset(held), frozenset(pressed))
+
+
+def time_profile(profile: QualityProfile, frames: int = 180, warmup: int = 20) -> float:
+    """95e centile du temps d'une frame (ms) : update, render et mise à l'échelle.
+
+    L'affichage (``flip``) n'est pas mesuré : il dépend de la synchronisation
+    verticale, d'où la marge prise par ``pick_profile``.
+    """
+    from game import Game
+
+    game = Game(quality=profile)
+    canvas = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    window = pygame.Surface(profile.display_size).convert()
+    times: list[float] = []
+    for i, actions in enumerate(_scripted_actions(frames + warmup)):
+        start = time.perf_counter()
+        game.update(actions)
+        game.render(canvas)
+        present(canvas, window, profile.scale_filter)
+        if i >= warmup:
+            times.append(time.perf_counter() - start)
+    pygame.mixer.music.stop()
+    times.sort()
+    return times[int((len(times) - 1) * 0.95)] * 1000
+
+
+def pick_profile(fps: int = FPS, headroom: float = 0.6) -> tuple[str, dict[str, float]]:
+    """Premier profil dont la frame tient dans ``headroom`` × le budget de ``fps``.
+
+    Retourne son nom et les temps mesurés ; le profil le plus léger est gardé
+    si aucun ne tient la cadence.
+    """
+    budget = 1000 / fps * headroom
+    timings: dict[str, float] = {}
+    for name, profile in PROFILES.items():
+        timings[name] = round(time_profile(profile), 3)
+        if timings[name] <= budget:
+            return name, timings
+    return name, timings
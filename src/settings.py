@@ -3,12 +3,14 @@ Définit toutes les constantes de configuration du jeu : dimensions d’écran,
 Ce fichier centralise les paramètres pour simplifier les ajustements ultérieurs.
 """
 
+import os
 from pathlib import Path
 
 # —— Dimensions d’origine (pixel‑art) ——
 WINDOW_WIDTH: int = 320
 WINDOW_HEIGHT: int = 240
 # Augmente le facteur de mise à l'échelle pour une résolution plus élevée.
+# Valeur du profil « high » ; le profil choisi (quality.py) peut la réduire.
 UPSCALE: int = 4  # 320×240 → 1280×960
 
 DISPLAY_WIDTH: int = WINDOW_WIDTH * UPSCALE
@@ -31,12 +33,82 @@ GRAVITY: float = 0.35      # Accélération gravitationnelle
 JUMP_SPEED: float = -6.5   # Impulsion verticale du saut (négatif = vers le haut)
 LANDING_TIME: int = 6      # Durée d'affichage de la frame d'atterrissage
 
+# —— Ennemis ——
+ENEMY_CHASE_RANGE: int = 160  # Distance horizontale de poursuite (px)
+ENEMY_CHASE_SPEED: int = 2     # Vitesse de poursuite (px par frame)
+ENEMY_JUMP_SPEED: float = JUMP_SPEED
+# Marge autour de la caméra où les ennemis apparaissent et disparaissent (px)
+ENEMY_SPAWN_MARGIN: int = 64
+
+# —— Suiveurs (party.py) ——
+FOLLOW_SPACING: int = 10  # Pas du meneur entre deux ronins de la file
+# Au-delà de cette distance au meneur (px), un suiveur ne change de pose
+# qu'un tick sur FOLLOWER_FAR_INTERVAL
+FOLLOWER_NEAR_DISTANCE: int = 96
+FOLLOWER_FAR_INTERVAL: int = 4
+
+# —— Manette (disposition SNES : B, A, Y, X, L, R, Select, Start) ——
+PAD_BUTTONS: dict[int, str] = {
+    1: "attack",   # A
+    2: "kick",     # B
+    0: "special",  # X
+    3: "jump",     # Y
+    4: "prev",     # L
+    5: "next",     # R
+    9: "menu",     # Start
+}
+PAD_DEADZONE: float = 0.5  # Seuil des sticks analogiques
+
+# —— Budget mémoire par catégorie (octets, None = illimité) ——
+MEMORY_BUDGET: dict[str, int | None] = {
+    "characters": 16 * 1024 * 1024,
+    "enemies": 8 * 1024 * 1024,
+    "level": 16 * 1024 * 1024,
+    "ui": 4 * 1024 * 1024,
+    "vfx": 1 * 1024 * 1024,
+    "audio": 32 * 1024 * 1024,
+}
+MEMORY_POLICY: str = "warn"  # "warn" : avertir, "evict" : vider les caches évictables
+
+# —— Rendu ——
+# Passe de conversion des sprites au chargement (colorkey RLE / convert)
+OPTIMISE_PIXEL_FORMAT: bool = True
+# Caméra (camera.py) : demi-largeur de la zone morte, avance dans le sens du
+# regard (px) et part de l'écart rattrapée à chaque frame
+CAMERA_DEAD_ZONE: int = 24
+CAMERA_LOOK_AHEAD: int = 40
+CAMERA_SMOOTHING: float = 0.12
+# Décor décalé avec Surface.scroll, seules les zones modifiées sont redessinées
+INCREMENTAL_RENDER: bool = True
+# Simulation sur un thread séparé du rendu (simthread.py, main.py --threaded)
+THREADED_SIMULATION: bool = False
+# Capture vidéo (capture.py, main.py --capture) : tampons de l'anneau partagé
+# avec l'encodeur ; au-delà, les frames sont perdues
+CAPTURE_SLOTS: int = 16
+CAPTURE_FORMATS: tuple[str, ...] = ("png", "raw")
+# Index des plateformes (colliders.py) : largeur des colonnes, en px
+COLLISION_CELL: int = 64
+# Relief marchable (terrain.py) : plus haute marche franchie en marchant, en px
+TERRAIN_STEP: int = 24
+# Particules (particles.py) : taille de la réserve (profil « high », voir
+# quality.py) et multiplicateur d'émission
+PARTICLE_CAPACITY: int = 512
+PARTICLE_DENSITY: float = 1.0
+
 # —— Autres ——
 GROUND_Y: int = WINDOW_HEIGHT  # Limite inférieure (sol) pour collision simple
 
 # —— Assets ——
 BASE_DIR: Path = Path(__file__).resolve().parent.parent
 ASSETS_DIR: Path = BASE_DIR / "assets"
+LEVELS_DIR: Path = BASE_DIR / "levels"
+LEVEL_FILE: Path = LEVELS_DIR / "level1.json"
+# Enchaînement des stages (stages.py) : le suivant est chargé en arrière-plan
+# quand le joueur dépasse STAGE_PREFETCH_AT de la largeur du stage courant,
+# puis la transition est un fondu au noir de STAGE_FADE_TIME frames par sens.
+STAGE_FILES: list[Path] = [LEVEL_FILE, LEVELS_DIR / "level2.json"]
+STAGE_PREFETCH_AT: float = 0.5
+STAGE_FADE_TIME: int = 40
 
 # Arrière-plan principal du stage.  On réutilise l'image
 # ``background_forest.png`` provenant du dossier ``assets/niveaux`` afin de
@@ -45,6 +117,10 @@ BACKGROUND_IMG: Path = ASSETS_DIR / "niveaux" / "background_forest.png"
 BACKGROUND_IMG_2: Path = ASSETS_DIR / "niveaux" / "background_forest2.png"
 TILESET_IMG: Path = ASSETS_DIR / "niveaux" / "tileset_forest.png"
 PLATFORM_TILESET_IMG: Path = ASSETS_DIR / "niveaux" / "tileset_plateform_1.png"
+# L'échelle s'appelait "Echelle.png" avant d'être renommée "Echelle_corde.png"
+LADDER_IMG: Path = ASSETS_DIR / "niveaux" / "Echelle_corde.png"
+STAIR_IMG: Path = ASSETS_DIR / "niveaux" / "Stair_wood_1.png"
+WALL_IMG: Path = ASSETS_DIR / "niveaux" / "Wall_wood_side.png"
 MUSIC_FILE: Path = ASSETS_DIR / "son" / "music_stage_1.wav"
 JUMP_SOUND_FILE: Path = ASSETS_DIR / "son" / "son_saut.wav"
 PUNCH_SOUND_FILE: Path = ASSETS_DIR / "son" / "punch1.wav"
@@ -62,4 +138,13 @@ ENEMY_DIR: Path = ASSETS_DIR / "ennemis"
 HEART_IMG: Path = ASSETS_DIR / "ui" / "Heart_lifepoint.png"
 SNES_IMG: Path = ASSETS_DIR / "ui" / "Manette_SNES.png"
 
+# Paquet des assets (pack.py build) : lu à la place des fichiers s'il existe.
+# Tous les chemins ci-dessus y sont vérifiés à la construction.
+ASSETS_PACK: Path = BASE_DIR / "assets.pack"
+
+# —— Configuration utilisateur (profil de qualité, plein écran, cadence) ——
+CONFIG_FILE: Path = (
+    Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "47ronins" / "config.json"
+)
+
 
@@ -0,0 +1,140 @@
+"""simthread.py
+Simulation sur son propre thread, rendu sur le thread principal.
+
+Le thread de simulation avance la partie à cadence fixe et publie, à chaque
+tick, un instantané figé (``game.Snapshot``) dans un double tampon. Le thread
+principal récupère les événements pygame (obligatoirement chez lui), les
+transmet à la simulation, puis dessine le dernier instantané, le met à
+l'échelle et l'affiche. Les blits, ``transform.scale`` et ``display.flip``
+relâchent le GIL : sur plusieurs cœurs, la durée d'une frame tend vers le
+plus grand des deux coûts au lieu de leur somme, et un affichage lent ne
+retarde plus la simulation.
+
+Toutes les modifications de la partie se font sur le thread de simulation ;
+le rendu ne lit que l'instantané.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import queue
+import threading
+import time
+import pygame
+
+from settings import FPS
+from game import Game, Snapshot
+from inputs import InputRecorder
+
+
+class SnapshotBuffer:
+    """Double tampon d'instantanés : la simulation remplit l'un, le rendu lit l'autre.
+
+    ``publish`` écrit dans le tampon arrière puis l'échange avec l'avant ;
+    ``latest`` retourne le tampon avant. Les instantanés étant immuables, le
+    rendu peut garder le sien pendant que la simulation publie les suivants.
+    """
+
+    def __init__(self) -> None:
+        self._slots: list[Snapshot | None] = [None, None]
+        self._front = 0
+        self._cond = threading.Condition()
+        self.published = 0
+        self.skipped = 0  # instantanés remplacés avant d'avoir été lus
+        self._read = 0
+        self.closed = False
+
+    def publish(self, snap: Snapshot, wait: bool = False) -> None:
+        """Rend ``snap`` visible ; ``wait`` attend que le précédent ait été lu."""
+        with self._cond:
+            if wait:
+                self._cond.wait_for(lambda: self._read == self.published or self.closed)
+            front = self._slots[self._front]
+            if front is not None and self._read < self.published:
+                self.skipped += 1
+                # Une pression jamais affichée reste à mesurer sur la frame suivante
+                if front.input_ns is not None and snap.input_ns is None:
+                    snap = replace(snap, input_ns=front.input_ns)
+            back = 1 - self._front
+            self._slots[back] = snap
+            self._front = back
+            self.published += 1
+            self._cond.notify_all()
+
+    def latest(self, timeout: float | None = None) -> Snapshot | None:
+        """Dernier instantané ; attend jusqu'à ``timeout`` s'il a déjà été lu.
+
+        Retourne None si rien de nouveau n'est arrivé à temps.
+        """
+        with self._cond:
+            if self._read == self.published and not self.closed:
+                self._cond.wait(timeout)
+            if self._read == self.published:
+                return None
+            self._read = self.published
+            self._cond.notify_all()
+            return self._slots[self._front]
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class SimulationThread(threading.Thread):
+    """Fait avancer ``game`` à ``rate`` ticks par seconde.
+
+    ``rate=None`` supprime la cadence : chaque tick attend que le rendu ait
+    lu le précédent (banc d'essai du pipeline).
+    """
+
+    def __init__(self, game: Game, rate: int | None = FPS, recorder: InputRecorder | None = None) -> None:
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.period = 1 / rate if rate else None
+        self.recorder = recorder
+        self.buffer = SnapshotBuffer()
+        self.tick_time = 0.0  # durée du dernier tick (s)
+        self.error: BaseException | None = None
+        self._events: queue.SimpleQueue[pygame.event.Event] = queue.SimpleQueue()
+        self._halt = threading.Event()
+
+    def post(self, event: pygame.event.Event) -> None:
+        """Transmet un événement pygame, traité au début du tick suivant."""
+        self._events.put(event)
+
+    def stop(self) -> None:
+        self._halt.set()
+        self.buffer.close()
+
+    def run(self) -> None:
+        game = self.game
+        next_tick = time.perf_counter()
+        try:
+            while game.running and not self._halt.is_set():
+                while True:
+                    try:
+                        game.handle_event(self._events.get_nowait())
+                    except queue.Empty:
+                        break
+                start = time.perf_counter()
+                actions = game.inputs.tick()
+                if self.recorder is not None:
+                    self.recorder.write(actions)
+                game.update(actions)
+                snap = game.snapshot(game.inputs.take_tick_input())
+                self.tick_time = time.perf_counter() - start
+                self.buffer.publish(snap, wait=self.period is None)
+
+                if self.period is not None:
+                    next_tick += self.period
+                    delay = next_tick - time.perf_counter()
+                    if delay > 0:
+                        self._halt.wait(delay)
+                    elif delay < -5 * self.period:
+                        # Trop en retard (machine suspendue…) : on ne rattrape pas
+                        next_tick = time.perf_counter()
+        except BaseException as exc:  # relancée par le thread principal
+            self.error = exc
+        finally:
+            self.buffer.close()
@@ -0,0 +1,341 @@
+"""soak.py
+Test d'endurance : joue le jeu sans fenêtre pendant des heures (temps de jeu)
+avec un flux d'entrées aléatoire ou enregistré (``main.py --record-inputs``),
+redémarrages, menu et superpositions compris.
+
+Des relevés périodiques de la mémoire du processus (RSS), des plus gros
+allocateurs Python (``tracemalloc``), des compteurs du ramasse-miettes, du
+registre des assets et des percentiles du temps de frame sont écrits par un
+thread d'arrière-plan dans un journal tournant (une ligne JSON par relevé).
+Chaque relevé est précédé d'un ``gc.collect()``. Le premier relevé pris après
+la chauffe et un premier redémarrage sert de référence : le test échoue si la
+mémoire ou le p99 du temps de frame dérive au-delà des seuils.
+
+    python src/soak.py --hours 4 [--replay session.jsonl] [--log soak.log]
+
+Le code de sortie est non nul en cas de dérive.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+from dataclasses import dataclass
+import gc
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+from pathlib import Path
+import queue
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Iterator
+
+from settings import FPS
+
+# Actions déclenchées à l'appui (les autres sont maintenues)
+PRESS_ACTIONS = frozenset({"attack", "kick", "jump", "next", "prev"})
+RANDOM_HOLDS: tuple[tuple[str, ...], ...] = (
+    (),
+    ("right",),
+    ("right",),
+    ("right", "jump"),
+    ("left",),
+    ("left", "jump"),
+    ("up",),
+    ("down",),
+    ("attack",),
+    ("kick",),
+    ("right", "attack"),
+    ("next",),
+)
+
+
+@dataclass
+class Thresholds:
+    """Dérives tolérées par rapport au relevé de référence."""
+
+    rss_mb: float = 32.0  # bruit de l'allocateur en régime établi : ~10 Mio
+    traced_mb: float = 32.0
+    p99_ratio: float = 1.5  # p99 courant / p99 de référence
+    p99_slack_ms: float = 1.0  # marge absolue contre le bruit des frames très courtes
+    consecutive: int = 3  # relevés hors seuil d'affilée avant d'échouer
+
+
+def rss_bytes() -> int:
+    """Mémoire résidente du processus (pic sur les systèmes sans /proc)."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Instantané des allocations, sans celles de tracemalloc lui-même."""
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def random_inputs(seed: int) -> Iterator[tuple[frozenset[str], frozenset[str], list[int]]]:
+    """Flux infini (maintenues, appuyées, touches de menu) d'un joueur au hasard.
+
+    Les touches de menu (Échap, F3, P) sont émises comme de vrais événements
+    pour passer par les superpositions et les redémarrages.
+    """
+    import pygame
+
+    rng = random.Random(seed)
+    while True:
+        held = frozenset(rng.choice(RANDOM_HOLDS))
+        keys: list[int] = []
+        roll = rng.random()
+        if roll < 0.02:
+            keys.append(pygame.K_p)
+        elif roll < 0.06:
+            keys.append(pygame.K_ESCAPE)
+        elif roll < 0.10:
+            keys.append(pygame.K_F3)
+        yield held, held & PRESS_ACTIONS, keys
+        for _ in range(rng.randint(5, 60)):
+            yield held, frozenset(), []
+        if keys and keys[0] != pygame.K_p:
+            # Referme le menu ou la superposition de debug après la visite
+            yield frozenset(), frozenset(), keys
+
+
+def replay_inputs(path: Path) -> Iterator[tuple[frozenset[str], frozenset[str], list[int]]]:
+    """Rejoue un enregistrement en boucle."""
+    from inputs import read_recording
+
+    while True:
+        for actions in read_recording(path):
+            yield actions.held, actions.pressed, []
+
+
+class SoakMonitor(threading.Thread):
+    """Relevés périodiques et journal.
+
+    Les mesures coûteuses (instantané ``tracemalloc``, parcours du
+    ramasse-miettes) sont prises par la boucle de jeu entre deux frames, hors
+    du temps mesuré : faites dans un autre thread, elles garderaient le GIL et
+    gonfleraient les temps de frame qu'elles observent. Ce thread calcule les
+    percentiles, écrit le journal et compare chaque relevé à la référence.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float, warmup: float, thresholds: Thresholds) -> None:
+        super().__init__(name="soak-monitor", daemon=True)
+        self.logger = logger
+        self.interval = interval
+        self.warmup = warmup
+        self.thresholds = thresholds
+        self.samples: queue.Queue[dict | None] = queue.Queue()
+        self.failure: str | None = None
+        self.baseline: dict | None = None
+        self.last: dict | None = None
+        self.breaches = 0
+        self._start = time.monotonic()
+        self._next = self._start + interval
+        self._baseline_snapshot: tracemalloc.Snapshot | None = None
+
+    def due(self) -> bool:
+        return time.monotonic() >= self._next
+
+    def collect(self, frames: int, restarts: int, frame_times: list[float]) -> None:
+        """Prend un relevé (boucle de jeu) et le confie au thread d'écriture."""
+        from memory import LEDGER
+
+        # Les anciennes parties ne sont libérées que par le ramasse-miettes
+        # (cycles) : on mesure ce qui reste vivant, pas ce qui attend
+        gc.collect()
+        now = time.monotonic()
+        self._next = now + self.interval
+        elapsed = now - self._start
+        traced, traced_peak = tracemalloc.get_traced_memory()
+        snapshot = _snapshot()
+        # Référence en régime établi : après la chauffe et un premier
+        # redémarrage, quand l'allocateur a déjà servi deux parties
+        is_baseline = (
+            self._baseline_snapshot is None and elapsed >= self.warmup and restarts >= 1 and bool(frame_times)
+        )
+        if self._baseline_snapshot is not None:
+            stats = snapshot.compare_to(self._baseline_snapshot, "lineno")[:5]
+            top = [f"{s.traceback[0].filename}:{s.traceback[0].lineno} {s.size_diff / 1024:+.0f} Kio" for s in stats]
+        else:
+            stats = snapshot.statistics("lineno")[:5]
+            top = [f"{s.traceback[0].filename}:{s.traceback[0].lineno} {s.size / 1024:.0f} Kio" for s in stats]
+        if is_baseline:
+            self._baseline_snapshot = snapshot
+        self.samples.put({
+            "elapsed_s": round(elapsed, 1),
+            "frames": frames,
+            "restarts": restarts,
+            "baseline": is_baseline,
+            "rss_mb": round(rss_bytes() / 2**20, 2),
+            "traced_mb": round(traced / 2**20, 2),
+            "traced_peak_mb": round(traced_peak / 2**20, 2),
+            "ledger_kb": LEDGER.total() // 1024,
+            "ledger_entries": len(LEDGER.entries),
+            "gc_counts": gc.get_count(),
+            "gc_objects": len(gc.get_objects()),
+            "frame_times": frame_times,
+            "top_allocations": top,
+        })
+
+    def stop(self) -> None:
+        self.samples.put(None)
+        self.join()
+
+    def run(self) -> None:
+        while (sample := self.samples.get()) is not None:
+            times = sample.pop("frame_times")
+            sample["frame_ms"] = {
+                "p50": round(percentile(times, 0.50), 3),
+                "p95": round(percentile(times, 0.95), 3),
+                "p99": round(percentile(times, 0.99), 3),
+                "max": round(max(times, default=0.0), 3),
+            }
+            self.logger.info(json.dumps(sample, ensure_ascii=False))
+            self.last = sample
+            if sample["baseline"]:
+                self.baseline = sample
+            if self.baseline is None or sample is self.baseline or self.failure:
+                continue
+            # Une pointe isolée (menu, redémarrage) n'est pas une dérive
+            breach = self.check(sample)
+            if breach is None:
+                self.breaches = 0
+                continue
+            self.breaches += 1
+            if self.breaches >= self.thresholds.consecutive:
+                self.failure = breach
+                self.logger.error(breach)
+            else:
+                self.logger.warning(breach)
+
+    def check(self, sample: dict) -> str | None:
+        """Message d'échec si un indicateur a trop dérivé, sinon None."""
+        base, limits = self.baseline, self.thresholds
+        rss_growth = sample["rss_mb"] - base["rss_mb"]
+        if rss_growth > limits.rss_mb:
+            return f"RSS +{rss_growth:.1f} Mio (seuil {limits.rss_mb} Mio)"
+        traced_growth = sample["traced_mb"] - base["traced_mb"]
+        if traced_growth > limits.traced_mb:
+            return f"mémoire Python +{traced_growth:.1f} Mio (seuil {limits.traced_mb} Mio)"
+        p99, base_p99 = sample["frame_ms"]["p99"], base["frame_ms"]["p99"]
+        if p99 > base_p99 * limits.p99_ratio + limits.p99_slack_ms:
+            return f"p99 du temps de frame {p99:.2f} ms (référence {base_p99:.2f} ms)"
+        return None
+
+
+def make_logger(path: Path) -> logging.Logger:
+    """Journal tournant : 5 fichiers de 1 Mio au plus."""
+    logger = logging.getLogger("soak")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = RotatingFileHandler(path, maxBytes=2**20, backupCount=4, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Test d'endurance headless")
+    parser.add_argument("--hours", type=float, default=1.0, help="durée en temps de jeu")
+    parser.add_argument("--frames", type=int, help="nombre de frames (remplace --hours)")
+    parser.add_argument("--replay", type=Path, help="enregistrement de main.py --record-inputs, rejoué en boucle")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--realtime", action="store_true", help=f"cadencer à {FPS} FPS au lieu d'aller au plus vite")
+    parser.add_argument("--log", type=Path, default=Path("soak.log"))
+    parser.add_argument("--interval", type=float, default=10.0, help="secondes entre deux relevés")
+    parser.add_argument("--warmup", type=float, default=60.0, help="secondes avant le relevé de référence")
+    parser.add_argument("--max-rss-mb", type=float, default=Thresholds.rss_mb)
+    parser.add_argument("--max-traced-mb", type=float, default=Thresholds.traced_mb)
+    parser.add_argument("--max-p99-ratio", type=float, default=Thresholds.p99_ratio)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    tracemalloc.start()
+    pygame.init()
+    from settings import WINDOW_WIDTH, WINDOW_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT
+    from debug import draw_overlay
+    from game import Game
+    from inputs import ActionState
+
+    window = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
+    canvas = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    clock = pygame.time.Clock()
+
+    total = args.frames if args.frames is not None else int(args.hours * 3600 * FPS)
+    inputs = replay_inputs(args.replay) if args.replay else random_inputs(args.seed)
+    frame_times: deque[float] = deque(maxlen=FPS * 60)
+    thresholds = Thresholds(args.max_rss_mb, args.max_traced_mb, args.max_p99_ratio)
+    logger = make_logger(args.log)
+    game = Game()
+    # La chauffe commence à la première frame, pas au chargement
+    monitor = SoakMonitor(logger, args.interval, args.warmup, thresholds)
+    monitor.start()
+    frame = restarts = 0
+    while frame < total and monitor.failure is None:
+        if monitor.due():
+            monitor.collect(frame, restarts, list(frame_times))
+        if not game.running:
+            # Fin de partie, stage terminé ou redémarrage : nouvelle partie
+            game = Game(game.controls)
+            restarts += 1
+        held, pressed, keys = next(inputs)
+        start = time.perf_counter()
+        for key in keys:
+            game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+        if game.game_over:
+            game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_o, mod=0, unicode="", scancode=0))
+        pygame.event.clear()
+        game.update(ActionState(held=held, pressed=pressed))
+        game.render(canvas)
+        if game.show_debug:
+            draw_overlay(canvas, [f"FPS {clock.get_fps():.0f}", *game.debug_lines()])
+        pygame.transform.scale(canvas, (DISPLAY_WIDTH, DISPLAY_HEIGHT), window)
+        pygame.display.flip()
+        frame_times.append((time.perf_counter() - start) * 1000)
+        frame += 1
+        if args.realtime:
+            clock.tick(FPS)
+        else:
+            clock.tick()
+
+    monitor.stop()
+    pygame.quit()
+
+    last = monitor.last or {}
+    print(f"{frame} frames ({frame / FPS / 3600:.2f} h de jeu), {restarts} redémarrages")
+    if last:
+        print(
+            f"RSS {last['rss_mb']} Mio, Python {last['traced_mb']} Mio, "
+            f"p99 {last['frame_ms']['p99']} ms — journal : {args.log}"
+        )
+    if monitor.failure:
+        print(f"ÉCHEC : {monitor.failure}")
+        return 1
+    if monitor.baseline is None:
+        print("attention : aucun relevé de référence (durée inférieure à --warmup)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+"""spawner.py
+Apparition des ennemis autour de la caméra.
+
+Les niveaux listent des points d'apparition (``enemies`` : type et milieu du
+bas). Un ennemi n'est créé que lorsque son point entre dans la fenêtre de la
+caméra élargie d'une marge, et il est rendu à une réserve par type dès qu'il
+en sort ou meurt ; la réserve fournit les apparitions suivantes. Le nombre
+d'objets vivants dépend donc de ce qui est à l'écran, pas de la longueur du
+niveau. Les données communes à un type (sprites, masques, sons, réglages
+d'IA) sont partagées par toutes ses instances (``enemy.archetype``).
+
+Un ennemi sorti de la fenêtre réapparaît, intact, quand son point y revient
+après en être sorti ; un ennemi tué ne réapparaît pas.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+from settings import ENEMY_SPAWN_MARGIN
+from enemy import Enemy, archetype
+
+
+@dataclass
+class SpawnPoint:
+    """Point d'apparition d'un ennemi dans le niveau."""
+
+    kind: str
+    x: int
+    y: int
+    enemy: Enemy | None = None
+    # Faux tant que le point, dont l'ennemi vient de quitter la fenêtre, n'en
+    # est pas sorti à son tour (pas de réapparition sous les yeux du joueur)
+    armed: bool = True
+    dead: bool = False
+
+
+class EnemySpawner:
+    """Ennemis actifs d'un niveau et réserve d'instances recyclées."""
+
+    def __init__(self, spawns: list[dict], margin: int = ENEMY_SPAWN_MARGIN) -> None:
+        self.points = sorted((SpawnPoint(d["type"], d["x"], d["y"]) for d in spawns), key=lambda p: p.x)
+        self._xs = [p.x for p in self.points]
+        self.margin = margin
+        self.active: list[Enemy] = []
+        self._owner: dict[int, SpawnPoint] = {}
+        self._pool: dict[str, list[Enemy]] = {}
+        self._disarmed: list[SpawnPoint] = []
+        self.created = 0  # instances construites depuis le début du niveau
+
+    def kinds(self) -> set[str]:
+        return {p.kind for p in self.points}
+
+    @property
+    def pooled(self) -> int:
+        return sum(len(pool) for pool in self._pool.values())
+
+    def update(self, camera_x: int, view_width: int) -> None:
+        """Recycle les ennemis morts ou sortis de la fenêtre, fait entrer les nouveaux."""
+        left = camera_x - self.margin
+        right = camera_x + view_width + self.margin
+
+        kept: list[Enemy] = []
+        for enemy in self.active:
+            point = self._owner[id(enemy)]
+            if enemy.health <= 0:
+                point.dead = True
+            elif enemy.hitbox.right < left or enemy.hitbox.left > right:
+                if left <= point.x <= right:
+                    point.armed = False
+                    self._disarmed.append(point)
+            else:
+                kept.append(enemy)
+                continue
+            point.enemy = None
+            del self._owner[id(enemy)]
+            self._pool.setdefault(point.kind, []).append(enemy)
+        self.active = kept
+
+        if self._disarmed:
+            waiting = []
+            for point in self._disarmed:
+                if left <= point.x <= right:
+                    waiting.append(point)
+                else:
+                    point.armed = True
+            self._disarmed = waiting
+
+        # Seuls les points de la fenêtre sont parcourus
+        for i in range(bisect_left(self._xs, left), bisect_right(self._xs, right)):
+            point = self.points[i]
+            if point.enemy is None and point.armed and not point.dead:
+                point.enemy = self._acquire(point)
+                self._owner[id(point.enemy)] = point
+                self.active.append(point.enemy)
+
+    def _acquire(self, point: SpawnPoint) -> Enemy:
+        pool = self._pool.get(point.kind)
+        if pool:
+            enemy = pool.pop()
+            enemy.reset((point.x, point.y))
+            return enemy
+        self.created += 1
+        return Enemy(archetype(point.kind), (point.x, point.y))
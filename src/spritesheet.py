@@ -0,0 +1,117 @@
+"""spritesheet.py
+Découpage des planches de sprites à partir d'un descripteur JSON.
+
+Chaque frame est déclarée explicitement : image source, rectangle dans la
+planche et point de pivot (le point posé sur le milieu du bas de la hitbox,
+par défaut le milieu du bas de la frame). Au chargement, la frame est mise à
+l'échelle puis recadrée sur ses pixels opaques ; le pivot est conservé relatif
+à l'image recadrée, ce qui garde l'alignement d'origine tout en blittant
+beaucoup moins de pixels transparents.
+
+Format :
+
+    {
+      "scale": 0.0625,
+      "animations": {
+        "stand": {"frames": [{"image": "oishi_stand.png"}]},
+        "walk": {
+          "image": "oishi_walk.png",
+          "frames": [{"rect": [0, 0, 1024, 1024]}, {"rect": [1024, 0, 1024, 1024]}]
+        }
+      }
+    }
+
+``image`` et ``pivot`` peuvent être donnés au niveau de l'animation et
+surchargés par frame ; sans ``rect``, la frame est l'image entière.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import pygame
+
+from settings import PLAYER_SCALE
+from assets import finalize, load_image, mirrored, read_asset
+
+
+class SpriteSheetError(ValueError):
+    """Descripteur incohérent avec les images qu'il décrit."""
+
+
+@dataclass
+class SpriteSet:
+    """Frames recadrées d'un personnage et leurs pivots."""
+
+    animations: dict[str, list[pygame.Surface]] = field(default_factory=dict)
+    # Pivot (x, y) de chaque frame, en pixels de l'image recadrée, indexé par
+    # ``id`` de la surface ; les versions retournées ont aussi le leur
+    pivots: dict[int, tuple[int, int]] = field(default_factory=dict)
+    flipped: dict[int, pygame.Surface] = field(default_factory=dict)
+
+    def rect(self, image: pygame.Surface, anchor: tuple[int, int]) -> pygame.Rect:
+        """Rectangle d'affichage de ``image`` avec son pivot posé sur ``anchor``."""
+        px, py = self.pivots[id(image)]
+        return image.get_rect(topleft=(anchor[0] - px, anchor[1] - py))
+
+
+def _trim(frame: pygame.Surface, pivot: tuple[float, float]) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Recadre ``frame`` sur ses pixels opaques et y ramène ``pivot``."""
+    bbox = frame.get_bounding_rect()
+    if not bbox.width or not bbox.height:
+        raise SpriteSheetError("frame entièrement transparente")
+    trimmed = frame.subsurface(bbox).copy()
+    return trimmed, (round(pivot[0]) - bbox.x, round(pivot[1]) - bbox.y)
+
+
+def load_sprite_set(path: Path, category: str, name: str) -> SpriteSet:
+    """Charge les animations décrites par le descripteur ``path``.
+
+    Les chemins d'images sont relatifs au dossier du descripteur. Lève
+    ``SpriteSheetError`` si un rectangle déborde de sa planche ou si une
+    frame est vide.
+    """
+    path = Path(path)
+    data = json.loads(read_asset(path))
+    scale = float(data.get("scale", PLAYER_SCALE))
+    sheets: dict[str, pygame.Surface] = {}
+    sprites = SpriteSet()
+
+    for anim, spec in data["animations"].items():
+        frames: list[pygame.Surface] = []
+        for i, frame_spec in enumerate(spec["frames"]):
+            image_name = frame_spec.get("image", spec.get("image"))
+            if image_name is None:
+                raise SpriteSheetError(f"{path.name}: {anim}[{i}] sans image")
+            if image_name not in sheets:
+                sheets[image_name] = load_image(path.parent / image_name)
+            sheet = sheets[image_name]
+
+            rect = pygame.Rect(frame_spec.get("rect", sheet.get_rect()))
+            if not sheet.get_rect().contains(rect):
+                raise SpriteSheetError(
+                    f"{path.name}: {anim}[{i}] {tuple(rect)} déborde de {image_name} {sheet.get_size()}"
+                )
+            # Mise à l'échelle de la frame entière puis recadrage : les pixels
+            # affichés sont exactement ceux de l'ancien découpage
+            size = (int(rect.width * scale), int(rect.height * scale))
+            frame = pygame.transform.scale(sheet.subsurface(rect), size)
+            pivot = frame_spec.get("pivot", spec.get("pivot"))
+            if pivot is None:
+                pivot_px = (size[0] // 2, size[1])
+            else:
+                pivot_px = (pivot[0] * scale, pivot[1] * scale)
+            try:
+                trimmed, pivot_px = _trim(frame, pivot_px)
+            except SpriteSheetError as exc:
+                raise SpriteSheetError(f"{path.name}: {anim}[{i}] {exc}") from None
+
+            trimmed = finalize(trimmed, category, f"{name}/{anim}[{i}]")
+            flipped = mirrored(trimmed, category, f"{name}/flipped")
+            sprites.pivots[id(trimmed)] = pivot_px
+            sprites.pivots[id(flipped)] = (trimmed.get_width() - pivot_px[0], pivot_px[1])
+            sprites.flipped[id(trimmed)] = flipped
+            frames.append(trimmed)
+        sprites.animations[anim] = frames
+    return sprites
@@ -0,0 +1,205 @@
+"""stages.py
+Enchaînement des stages et préchargement du suivant.
+
+Un ``Stage`` regroupe tout ce qu'un niveau charge : données, décor, géométrie
+(plateformes mobiles et relief compris), points d'apparition des ennemis et graphe de
+navigation. Le ``StageManager`` charge le premier stage
+au démarrage ; une fois que le joueur a parcouru une part du stage courant,
+le suivant est chargé par un thread en arrière-plan, pendant que la partie
+continue. Les images communes aux deux stages sont reprises telles quelles
+(``assets.ImageCache``) : seules les ressources propres au stage suivant sont
+chargées. Au changement de stage, l'ancien n'est plus référencé et ce que lui
+seul utilisait est libéré : jamais plus de deux stages en mémoire.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import threading
+
+from settings import (
+    ASSETS_DIR,
+    MUSIC_FILE,
+    WINDOW_WIDTH,
+    STAGE_FILES,
+    STAGE_PREFETCH_AT,
+    ENEMY_CHASE_SPEED,
+    ENEMY_JUMP_SPEED,
+)
+from assets import ImageCache
+from background import ParallaxBackground, load_parallax
+from characters import SPAWN
+from enemy import archetype
+from navigation import NavGraph, build_nav_graph
+from platforms import (
+    Ladder,
+    MovingPlatform,
+    Platform,
+    Prop,
+    Staircase,
+    Wall,
+    create_level_platforms,
+    create_level_moving_platforms,
+    create_level_ladders,
+    create_level_stairs,
+    create_level_walls,
+    load_props,
+)
+from quality import DEFAULT_PROFILE, PROFILES, QualityProfile
+from renderqueue import DYNAMIC_LAYER
+from spawner import EnemySpawner
+from terrain import HeightField, build_height_field
+
+
+@dataclass
+class Stage:
+    """Un niveau chargé, prêt à jouer."""
+
+    path: Path
+    width: int
+    spawn: tuple[int, int]
+    music: Path
+    background: ParallaxBackground
+    platforms: list[Platform]
+    # Plateformes mobiles : hors du décor mémorisé et du graphe de navigation
+    movers: list[MovingPlatform]
+    ladders: list[Ladder]
+    stairs: list[Staircase]
+    walls: list[Wall]
+    # Hauteur du sol par colonne : plancher et escaliers (terrain.py)
+    ground: HeightField
+    # Décors sans collision ; ceux des couches fixes rejoignent le décor mémorisé
+    static_props: list[Prop]
+    props: list[Prop]
+    spawner: EnemySpawner
+    nav: NavGraph
+    images: ImageCache
+
+
+def load_stage(path: Path, quality: QualityProfile, inherit: ImageCache | None = None) -> Stage:
+    """Charge le niveau décrit par ``path``.
+
+    ``inherit`` est le cache d'images du stage précédent : les images déjà
+    chargées y sont reprises. Appelable hors du thread principal (la fenêtre
+    doit exister pour ``convert``).
+    """
+    path = Path(path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    width = data.get("width", WINDOW_WIDTH * 4)
+    images = ImageCache(inherit)
+
+    background = load_parallax(data.get("background"), quality.parallax_layers, images)
+    platforms = create_level_platforms(data.get("platforms", []), images)
+    movers = create_level_moving_platforms(data.get("moving_platforms", []), images)
+    ladders = create_level_ladders(data.get("ladders", []), platforms, images)
+    stairs = create_level_stairs(data.get("stairs", []), images)
+    walls = create_level_walls(data.get("walls", []), images)
+    props = load_props(data.get("props"), images)
+    spawner = EnemySpawner(data.get("enemies", []))
+    # Données partagées des types d'ennemis du niveau, chargées ici plutôt
+    # qu'à la première apparition
+    kinds = [archetype(name) for name in sorted(spawner.kinds())]
+    # Graphe de navigation des ennemis, construit une fois par niveau pour le
+    # plus large, le plus lent et le moins bon sauteur des types présents :
+    # chaque arête est alors praticable par tous (vitesses de saut négatives)
+    nav = build_nav_graph(
+        [p.rect for p in platforms],
+        [l.rect for l in ladders],
+        [s.rect for s in stairs],
+        [w.rect for w in walls],
+        width,
+        max((kind.stand.get_width() for kind in kinds), default=16),
+        min((kind.chase_speed for kind in kinds), default=ENEMY_CHASE_SPEED),
+        max((kind.jump_speed for kind in kinds), default=ENEMY_JUMP_SPEED),
+    )
+    images.seal()
+    return Stage(
+        path=path,
+        width=width,
+        spawn=tuple(data.get("spawn", SPAWN)),
+        music=ASSETS_DIR / data["music"] if "music" in data else Path(MUSIC_FILE),
+        background=background,
+        platforms=platforms,
+        movers=movers,
+        ladders=ladders,
+        stairs=stairs,
+        walls=walls,
+        ground=build_height_field(width, stairs),
+        static_props=[p for p in props if p.layer < DYNAMIC_LAYER],
+        props=[p for p in props if p.layer >= DYNAMIC_LAYER],
+        spawner=spawner,
+        nav=nav,
+        images=images,
+    )
+
+
+class StageManager:
+    """Stage courant et préchargement du suivant."""
+
+    def __init__(
+        self,
+        files: list[Path] | None = None,
+        quality: QualityProfile | None = None,
+        prefetch_at: float = STAGE_PREFETCH_AT,
+    ) -> None:
+        self.files = list(STAGE_FILES if files is None else files)
+        self.quality = quality or PROFILES[DEFAULT_PROFILE]
+        # Part de la largeur du stage à dépasser pour lancer le préchargement
+        self.prefetch_at = prefetch_at
+        self.index = 0
+        self.current = load_stage(self.files[0], self.quality)
+        self._thread: threading.Thread | None = None
+        self._next: Stage | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.index + 1 < len(self.files)
+
+    @property
+    def ready(self) -> bool:
+        """Vrai si le stage suivant est entièrement chargé."""
+        return self._thread is not None and not self._thread.is_alive()
+
+    def update(self, player_x: float) -> None:
+        """Lance le préchargement une fois le seuil du stage courant dépassé."""
+        if player_x >= self.current.width * self.prefetch_at:
+            self.prefetch()
+
+    def prefetch(self) -> None:
+        if self._thread is not None or not self.has_next:
+            return
+        self._thread = threading.Thread(
+            target=self._load,
+            args=(self.files[self.index + 1], self.current.images),
+            name="stage-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _load(self, path: Path, inherit: ImageCache) -> None:
+        try:
+            self._next = load_stage(path, self.quality, inherit)
+        except BaseException as exc:  # relancée par advance(), dans le thread principal
+            self._error = exc
+
+    def advance(self) -> Stage:
+        """Passe au stage suivant et le retourne.
+
+        Attend la fin du préchargement s'il n'est pas terminé (ou le lance,
+        si le seuil n'a jamais été atteint). L'ancien stage n'est plus
+        référencé par le gestionnaire.
+        """
+        if not self.has_next:
+            raise IndexError("pas de stage suivant")
+        self.prefetch()
+        self._thread.join()
+        self._thread = None
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+        self.current, self._next = self._next, None
+        self.index += 1
+        return self.current
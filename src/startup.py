@@ -0,0 +1,111 @@
+"""startup.py
+Démarrage rapide : sous-systèmes SDL initialisés à la demande et chronologie
+du lancement.
+
+``pygame.init()`` démarre tous les sous-systèmes d'un coup, y compris ceux
+dont la première image n'a pas besoin. Le lancement n'ouvre donc d'abord que
+l'affichage et les polices, affiche un écran titre, et prépare le reste
+ensuite : le mixer sur un thread à part pendant que le jeu s'importe, les
+manettes une fois la première image affichée. La construction de la partie
+(chargement des sprites et du niveau) vient après cette première image.
+
+``StartupTimeline`` horodate chaque étape depuis le début de ``main.py`` ;
+``main.py --startup-timeline FICHIER`` ajoute une ligne JSON par lancement
+pour suivre ces temps d'une version à l'autre.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import platform
+import threading
+import time
+import pygame
+
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+
+# Étapes suivies, dans l'ordre où elles surviennent d'habitude
+STAGES: dict[str, str] = {
+    "import": "imports",
+    "display": "fenêtre",
+    "first_frame": "première image",
+    "mixer": "mixer",
+    "game": "partie construite",
+    "interactive": "interactif",
+}
+
+
+class StartupTimeline:
+    """Instants (ms depuis ``origin``) des étapes du lancement."""
+
+    def __init__(self, origin: float | None = None) -> None:
+        self.origin = time.perf_counter() if origin is None else origin
+        self.marks: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, stage: str) -> None:
+        """Note l'étape ``stage`` ; seule la première occurrence compte."""
+        elapsed = (time.perf_counter() - self.origin) * 1000
+        with self._lock:
+            self.marks.setdefault(stage, round(elapsed, 1))
+
+    def __str__(self) -> str:
+        ordered = sorted(self.marks.items(), key=lambda item: item[1])
+        return "Démarrage : " + "  ".join(f"{STAGES.get(k, k)} {ms:.0f} ms" for k, ms in ordered)
+
+    def save(self, path: Path) -> None:
+        """Ajoute ce lancement au journal JSON ``path`` (une ligne par lancement)."""
+        record = {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "video": pygame.display.get_driver() if pygame.display.get_init() else None,
+            "marks": self.marks,
+        }
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+
+def init_display() -> None:
+    """Sous-systèmes nécessaires à la première image : affichage et polices."""
+    pygame.display.init()
+    pygame.font.init()
+
+
+def start_mixer(timeline: StartupTimeline | None = None) -> threading.Thread:
+    """Initialise le mixer en arrière-plan ; ``join`` avant de charger un son.
+
+    L'ouverture du périphérique audio peut prendre des dizaines de
+    millisecondes ; elle se fait pendant l'import et la construction du jeu.
+    """
+
+    def run() -> None:
+        try:
+            pygame.mixer.init()
+        except pygame.error as exc:
+            print(f"Son indisponible : {exc}")
+        if timeline is not None:
+            timeline.mark("mixer")
+
+    thread = threading.Thread(target=run, name="mixer-init", daemon=True)
+    thread.start()
+    return thread
+
+
+def init_deferred() -> None:
+    """Sous-systèmes dont la première image se passe : manettes.
+
+    Les manettes déjà branchées arrivent ensuite en ``JOYDEVICEADDED``.
+    """
+    pygame.joystick.init()
+
+
+def draw_splash(canvas: pygame.Surface) -> None:
+    """Écran titre affiché pendant le chargement."""
+    canvas.fill((0, 0, 0))
+    title = pygame.font.Font(None, 32).render("47 Ronins Chats", True, (255, 255, 255))
+    canvas.blit(title, title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 10)))
+    hint = pygame.font.Font(None, 16).render("Chargement…", True, (160, 160, 160))
+    canvas.blit(hint, hint.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 16)))
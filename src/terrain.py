@@ -0,0 +1,104 @@
+"""terrain.py
+Relief marchable d'un stage : hauteur du sol de chaque colonne de pixels.
+
+Le sol n'était qu'un plancher plat (``GROUND_Y``) et les escaliers un simple
+décor. ``HeightField`` range, pour chaque colonne x du stage, le y du dessus
+du relief (plancher, marches d'escalier, pentes) dans un ``array`` d'entiers
+16 bits : une seule lecture donne le sol sous une entité, quelle que soit la
+quantité de relief, et une pente ne coûte pas plus qu'un sol plat.
+
+Le profil d'un élément de relief est lu dans son sprite : le premier pixel
+opaque de chaque colonne. Un nouvel escalier ou une pente n'a donc besoin que
+de son image.
+
+Comme les plateformes, le relief ne porte que par le dessus. On y monte en
+marchant depuis le relief si la marche ne dépasse pas ``TERRAIN_STEP`` px,
+on s'y pose en tombant, et on passe derrière une face plus haute (le dos
+d'un escalier) ; le plancher reste dessous. Les plateformes flottantes gardent leur propre
+test (``colliders.PlatformIndex``) : une colonne n'a qu'une hauteur.
+"""
+
+from __future__ import annotations
+
+from array import array
+import pygame
+
+from settings import GROUND_Y, TERRAIN_STEP
+
+
+def surface_profile(image: pygame.Surface) -> list[int]:
+    """y du premier pixel opaque de chaque colonne de ``image`` (hauteur si vide)."""
+    mask = pygame.mask.from_surface(image)
+    w, h = mask.get_size()
+    tops = []
+    for x in range(w):
+        y = 0
+        while y < h and not mask.get_at((x, y)):
+            y += 1
+        tops.append(y)
+    return tops
+
+
+class HeightField:
+    """Hauteur du sol (y du dessus) de chaque colonne de pixels d'un stage."""
+
+    def __init__(self, width: int, floor: int = GROUND_Y, step: int = TERRAIN_STEP) -> None:
+        self.width = width
+        self.floor = floor
+        self.step = step
+        self.heights = array("h", [floor]) * width
+        self._profiles: dict[int, list[int]] = {}
+
+    def add(self, rect: pygame.Rect, image: pygame.Surface) -> None:
+        """Ajoute le relief dessiné par ``image`` posée en ``rect``."""
+        profile = self._profiles.get(id(image))
+        if profile is None:
+            profile = self._profiles[id(image)] = surface_profile(image)
+        heights = self.heights
+        for i, top in enumerate(profile):
+            x = rect.x + i
+            if 0 <= x < self.width and top < rect.height:
+                heights[x] = min(heights[x], rect.y + top)
+
+    def at(self, x: int) -> int:
+        """Sol de la colonne ``x`` (le plancher hors du stage)."""
+        if 0 <= x < self.width:
+            return self.heights[x]
+        return self.floor
+
+    def stands_on(self, body: pygame.Rect) -> bool:
+        """Vrai si ``body`` est posé sur le relief."""
+        return body.bottom == self.at(body.centerx)
+
+    def follow(self, body: pygame.Rect) -> bool:
+        """Garde sur le relief ``body``, qui y était posé, après un pas horizontal.
+
+        Il monte ou descend une marche d'au plus ``step`` px ; au-delà, il
+        bute sur rien (il passe derrière) ou tombe. Retourne vrai s'il est
+        toujours posé sur le relief.
+        """
+        top = self.at(body.centerx)
+        if abs(top - body.bottom) <= self.step:
+            body.bottom = top
+            return True
+        return False
+
+    def land(self, body: pygame.Rect, dy: int) -> bool:
+        """Arrête sur le relief ``body`` qui vient de descendre de ``dy`` px.
+
+        Il faut qu'il soit arrivé au niveau du sol en venant d'au-dessus (à la
+        marche près) : un corps sous le relief passe derrière.
+        """
+        top = self.at(body.centerx)
+        if dy >= 0 and body.bottom >= top and body.bottom - dy <= top + self.step:
+            body.bottom = top
+            return True
+        return False
+
+
+def build_height_field(width: int, terrain: list) -> HeightField:
+    """Relief d'un stage de largeur ``width`` ; ``terrain`` : éléments ``rect``/``image``."""
+    field = HeightField(width)
+    for item in terrain:
+        field.add(item.rect, item.image)
+    return field
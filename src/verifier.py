@@ -0,0 +1,257 @@
+"""verifier.py
+Vérifie qu'un niveau peut être terminé, personnage par personnage, sans y jouer.
+La physique utilisée est celle du jeu : ``Player.update`` est appelé en mode
+headless sur chaque état (position, vitesse verticale, au sol, sur une échelle)
+atteignable depuis le point d'apparition. La recherche en largeur, dédupliquée,
+est répartie sur un pool de processus, un niveau de profondeur (= un tick) à la
+fois. Elle donne la plus courte séquence d'entrées jusqu'à la sortie et les
+plateformes sur lesquelles on ne peut jamais se poser.
+
+Les plateformes mobiles sont figées : chacune devient une suite de plateformes
+fixes posées le long de son chemin, tous les ``MOVER_SAMPLE`` px (points de
+passage compris). L'état n'a pas d'horloge ; on suppose qu'un personnage peut
+attendre la plateforme à n'importe quel point de son trajet.
+
+    python src/verifier.py [--level levels/level1.json] [--character Koji] [--workers 4]
+
+Le code de sortie est non nul si un personnage ne peut pas atteindre la sortie.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+import time
+
+from settings import LEVEL_FILE, WINDOW_WIDTH, FPS
+
+# (x, y, vitesse verticale, au sol, sur une échelle)
+State = tuple[int, int, float, bool, bool]
+
+# Entrées essayées depuis chaque état. Sauter n'a d'effet qu'au sol et
+# haut/bas que sur une échelle : on élague le reste.
+MOVES: tuple[tuple[str, frozenset[str]], ...] = (
+    ("rien", frozenset()),
+    ("droite", frozenset({"right"})),
+    ("gauche", frozenset({"left"})),
+    ("saut", frozenset({"jump"})),
+    ("droite+saut", frozenset({"right", "jump"})),
+    ("gauche+saut", frozenset({"left", "jump"})),
+    ("haut", frozenset({"up"})),
+    ("bas", frozenset({"down"})),
+)
+AIR_MOVES = (0, 1, 2)
+GROUND_MOVES = (0, 1, 2, 3, 4, 5)
+LADDER_MOVES = (0, 1, 2, 3, 4, 5, 6, 7)
+
+# Écart entre deux positions figées d'une plateforme mobile (px)
+MOVER_SAMPLE = 16
+
+# État du processus courant (rempli par ``_init_world``)
+_WORLD: dict = {}
+
+
+def mover_stops(mover, spacing: int = MOVER_SAMPLE) -> list:
+    """Positions figées de ``mover`` tous les ``spacing`` px le long de son chemin."""
+    import pygame
+    from platforms import Platform
+
+    path = [pygame.Vector2(p) for p in mover.path]
+    if mover.loop and len(path) > 2:
+        path.append(path[0])
+    points = [path[0]]
+    for start, end in zip(path, path[1:]):
+        steps = max(1, round(start.distance_to(end) / spacing))
+        points += [start.lerp(end, i / steps) for i in range(1, steps + 1)]
+    stops = []
+    for point in points:
+        rect = mover.rect.copy()
+        rect.midbottom = (round(point.x), round(point.y))
+        stops.append(Platform(rect, mover.image))
+    return stops
+
+
+def _init_world(characters: list[str], level_data: dict) -> None:
+    """Charge la géométrie du niveau et les personnages, sans fenêtre ni son."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    pygame.mixer.set_num_channels(0)  # les sons de saut ne jouent pas
+
+    from characters import create_player
+    from colliders import PlatformIndex
+    from inputs import ActionState
+    from platforms import (
+        create_level_platforms,
+        create_level_ladders,
+        create_level_moving_platforms,
+        create_level_stairs,
+        create_level_walls,
+    )
+    from terrain import build_height_field
+
+    platforms = create_level_platforms(level_data.get("platforms", []))
+    _WORLD["platforms"] = [p.rect for p in platforms]
+    stops = [s for m in create_level_moving_platforms(level_data.get("moving_platforms", [])) for s in mover_stops(m)]
+    _WORLD["colliders"] = PlatformIndex(platforms + stops)
+    _WORLD["ladders"] = [l.rect for l in create_level_ladders(level_data.get("ladders", []), platforms)]
+    _WORLD["walls"] = [w.rect for w in create_level_walls(level_data.get("walls", []))]
+    _WORLD["ground"] = build_height_field(
+        level_data.get("width", WINDOW_WIDTH * 4), create_level_stairs(level_data.get("stairs", []))
+    )
+    _WORLD["players"] = {name: create_player(name) for name in characters}
+    _WORLD["actions"] = [ActionState(held=held) for _, held in MOVES]
+
+
+def _step(player, state: State, move: int) -> State:
+    """Applique une entrée à un état avec la vraie physique du joueur."""
+    x, y, vy, on_ground, on_ladder = state
+    player.hitbox.topleft = (x, y)
+    player.vel.update(0, vy)
+    player.on_ground = on_ground
+    player.on_ladder = on_ladder
+    player.is_attacking = False
+    player.invincible_time = 0
+    player.jump_phase = "stand"
+    platforms = _WORLD["colliders"].near(player.hitbox)
+    player.update(_WORLD["actions"][move], platforms, _WORLD["ladders"], _WORLD["walls"], _WORLD["ground"])
+    return (
+        player.hitbox.x,
+        player.hitbox.y,
+        round(player.vel.y, 3),
+        player.on_ground,
+        player.on_ladder,
+    )
+
+
+def _expand(character: str, states: list[State]) -> list[tuple[State, int, State]]:
+    """Successeurs (parent, entrée, enfant) d'un lot d'états."""
+    player = _WORLD["players"][character]
+    out: list[tuple[State, int, State]] = []
+    for state in states:
+        if state[4]:
+            moves = LADDER_MOVES
+        elif state[3]:
+            moves = GROUND_MOVES
+        else:
+            moves = AIR_MOVES
+        for move in moves:
+            out.append((state, move, _step(player, state, move)))
+    return out
+
+
+def search(
+    pool: ProcessPoolExecutor,
+    character: str,
+    spawn: tuple[int, int],
+    level_width: int,
+    hitbox_width: int,
+    workers: int,
+) -> tuple[list[int] | None, dict[State, tuple[State, int] | None]]:
+    """Recherche en largeur depuis ``spawn``.
+
+    Retourne la plus courte séquence d'entrées jusqu'à la sortie (None si elle
+    est inatteignable) et la table des états visités avec leur parent.
+    """
+    start: State = (spawn[0], spawn[1], 0.0, False, False)
+    parents: dict[State, tuple[State, int] | None] = {start: None}
+    frontier = [start]
+    goal: State | None = None
+    while frontier:
+        size = max(64, len(frontier) // (workers * 4) + 1)
+        chunks = [frontier[i : i + size] for i in range(0, len(frontier), size)]
+        next_frontier: list[State] = []
+        for results in pool.map(_expand, [character] * len(chunks), chunks):
+            for parent, move, child in results:
+                if child in parents:
+                    continue
+                parents[child] = (parent, move)
+                if goal is None and child[0] + hitbox_width >= level_width:
+                    goal = child
+                if child[0] < level_width:
+                    next_frontier.append(child)
+        frontier = next_frontier
+
+    if goal is None:
+        return None, parents
+    path: list[int] = []
+    state = goal
+    while parents[state] is not None:
+        state, move = parents[state]
+        path.append(move)
+    path.reverse()
+    return path, parents
+
+
+def compress(path: list[int]) -> str:
+    """Séquence d'entrées compacte : « droite×40, droite+saut, … »."""
+    runs: list[list[int]] = []
+    for move in path:
+        if runs and runs[-1][0] == move:
+            runs[-1][1] += 1
+        else:
+            runs.append([move, 1])
+    return ", ".join(MOVES[m][0] + (f"×{n}" if n > 1 else "") for m, n in runs)
+
+
+def unreachable_platforms(visited, platforms, hitbox_size: tuple[int, int]) -> list[int]:
+    """Indices des plateformes sur lesquelles aucun état n'est posé."""
+    w, h = hitbox_size
+    landed: set[int] = set()
+    for x, y, _, on_ground, _ in visited:
+        if not on_ground:
+            continue
+        bottom = y + h
+        for i, plat in enumerate(platforms):
+            if plat.top == bottom and x + w > plat.left and x < plat.right:
+                landed.add(i)
+    return [i for i in range(len(platforms)) if i not in landed]
+
+
+def main(argv: list[str] | None = None) -> int:
+    from characters import PARTY, SPAWN
+
+    parser = argparse.ArgumentParser(description="Vérificateur de jouabilité")
+    parser.add_argument("--level", type=Path, default=LEVEL_FILE)
+    parser.add_argument("--character", action="append", choices=PARTY, help="par défaut : toute la partie")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    characters = args.character or PARTY
+    level_data = json.loads(args.level.read_text(encoding="utf-8"))
+    level_width = level_data.get("width", WINDOW_WIDTH * 4)
+    spawn = tuple(level_data.get("spawn", SPAWN))
+
+    _init_world(characters, level_data)
+    platforms = _WORLD["platforms"]
+    print(f"Niveau {args.level.name} — largeur {level_width} px")
+
+    failed = False
+    with ProcessPoolExecutor(args.workers, initializer=_init_world, initargs=(characters, level_data)) as pool:
+        for character in characters:
+            hitbox = _WORLD["players"][character].hitbox
+            start = time.perf_counter()
+            path, visited = search(pool, character, spawn, level_width, hitbox.width, args.workers)
+            elapsed = time.perf_counter() - start
+            print(f"[{character}] {len(visited)} états explorés en {elapsed:.1f} s")
+            if path is None:
+                failed = True
+                print("  sortie INATTEIGNABLE")
+            else:
+                print(f"  sortie atteinte en {len(path)} ticks ({len(path) / FPS:.1f} s)")
+                print(f"  entrées : {compress(path)}")
+            missing = unreachable_platforms(visited, platforms, hitbox.size)
+            for i in missing:
+                plat = platforms[i]
+                print(f"  plateforme #{i} inaccessible (x={plat.x}, y={plat.y}, largeur {plat.width})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())